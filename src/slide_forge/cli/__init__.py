@@ -6,10 +6,11 @@ Usage:
 Commands:
     render        Render PPTX slides to PNG images (Windows: PowerPoint; macOS/Linux: LibreOffice)
     thumbnail     Create thumbnail grids from slides (Linux/WSL, requires LibreOffice)
+    preview       Render slide PNGs and thumbnail grids from one conversion
     pack          Pack an unpacked directory into a PPTX file
     unpack        Unpack a PPTX file for editing
     validate      Validate PPTX XML against XSD schemas
-    clean         Remove unreferenced files from an unpacked PPTX
+    clean         Remove unreferenced files from an unpacked or packed PPTX
     add-slide     Add a new slide to an unpacked PPTX directory
     bump-version  Bump version across pyproject.toml, plugin.json, and __init__.py
 """
@@ -31,10 +32,11 @@ def main(argv: list[str] | None = None) -> None:
     subparsers = parser.add_subparsers(dest="command", title="commands")
 
     # Register all subcommands
-    from slide_forge.cli import add_slide, bump_version, clean, pack, render, thumbnail, unpack, validate
+    from slide_forge.cli import add_slide, bump_version, clean, pack, preview, render, thumbnail, unpack, validate
 
     render.configure_parser(subparsers)
     thumbnail.configure_parser(subparsers)
+    preview.configure_parser(subparsers)
     pack.configure_parser(subparsers)
     unpack.configure_parser(subparsers)
     validate.configure_parser(subparsers)
@@ -0,0 +1,41 @@
+"""Shared on-disk cache location and content hashing helpers."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+
+def user_cache_dir(*parts: str) -> Path:
+    """Return (and create) the slide-forge cache directory.
+
+    ``SLIDE_FORGE_CACHE_DIR`` overrides the platform default
+    (``%LOCALAPPDATA%`` on Windows, ``$XDG_CACHE_HOME`` or ``~/.cache`` elsewhere).
+    """
+    override = os.environ.get("SLIDE_FORGE_CACHE_DIR")
+    if override:
+        base = Path(override)
+    elif sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = Path(os.environ["LOCALAPPDATA"]) / "slide-forge"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "slide-forge"
+
+    path = base.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def sidecar_cache_dir(directory: str | Path) -> Path:
+    """Return the cache directory kept next to an unpacked *directory* (not created)."""
+    directory = Path(directory).resolve()
+    return directory.parent / ".slide-forge-cache" / directory.name
+
+
+def file_sha256(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
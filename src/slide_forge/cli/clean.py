@@ -1,29 +1,64 @@
-"""Remove unreferenced files from an unpacked PPTX directory."""
+"""Remove unreferenced files from an unpacked PPTX directory or a packed .pptx file.
+
+A packed file is cleaned in memory: relationships are read from the zip,
+and the result is written as a new package whose untouched members are
+copied as raw compressed bytes.
+"""
 
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import posixpath
 import re
 import sys
+import zipfile
 from pathlib import Path
 
 import defusedxml.minidom
+import lxml.etree
+
+from slide_forge.cli.opc import (
+    CONTENT_TYPES_PART,
+    DirectorySource,
+    ZipSource,
+    open_source,
+    parse_relationships,
+    resolve_target,
+    source_part_name,
+)
+
+TRASH_DIRECTORY = "[trash]"
+
+# Parts in these directories are deleted when nothing kept references them.
+SWEEPABLE_DIRECTORIES = {
+    f"ppt/{name}" for name in ("media", "embeddings", "charts", "diagrams", "tags", "drawings", "ink")
+}
 
 
 def configure_parser(subparsers: argparse._SubParsersAction) -> None:
-    parser = subparsers.add_parser("clean", help="Remove unreferenced files from unpacked PPTX")
-    parser.add_argument("unpacked_dir", help="Path to unpacked PPTX directory")
+    parser = subparsers.add_parser("clean", help="Remove unreferenced files from an unpacked or packed PPTX")
+    parser.add_argument("path", help="Path to unpacked PPTX directory or .pptx file")
+    parser.add_argument("-o", "--output", help="Write the cleaned .pptx here instead of replacing the input file")
     parser.set_defaults(func=_run)
 
 
 def _run(args: argparse.Namespace) -> None:
-    unpacked_dir = Path(args.unpacked_dir)
+    path = Path(args.path)
 
-    if not unpacked_dir.exists():
-        print(f"Error: {unpacked_dir} not found", file=sys.stderr)
+    if not path.exists():
+        print(f"Error: {path} not found", file=sys.stderr)
+        sys.exit(1)
+    if args.output and not path.is_file():
+        print("Error: --output requires a packed .pptx input", file=sys.stderr)
         sys.exit(1)
 
-    removed = clean_unused_files(unpacked_dir)
+    source = open_source(path)
+    try:
+        removed = clean_unused_files(source)
+    except (OSError, ValueError, zipfile.BadZipFile, lxml.etree.XMLSyntaxError) as e:
+        print(f"Error: Failed to clean {path}: {e}", file=sys.stderr)
+        sys.exit(1)
 
     if removed:
         print(f"Removed {len(removed)} unreferenced files:")
@@ -32,41 +67,44 @@ def _run(args: argparse.Namespace) -> None:
     else:
         print("No unreferenced files found")
 
+    if isinstance(source, ZipSource) and (removed or args.output):
+        output = Path(args.output) if args.output else path
+        source.save(output)
+        print(f"Wrote {output}")
+
+
+def clean_unused_files(unpacked_dir: Path | DirectorySource | ZipSource) -> list[str]:
+    """Remove unreferenced parts and return their names.
 
-def clean_unused_files(unpacked_dir: Path) -> list[str]:
+    *unpacked_dir* may also be an already opened source; a
+    :class:`ZipSource` is only changed in memory until it is saved.
+    """
+    source = unpacked_dir if isinstance(unpacked_dir, DirectorySource | ZipSource) else DirectorySource(unpacked_dir)
     all_removed: list[str] = []
 
-    slides_removed = _remove_orphaned_slides(unpacked_dir)
+    slides_removed = _remove_orphaned_slides(source)
     all_removed.extend(slides_removed)
 
-    trash_removed = _remove_trash_directory(unpacked_dir)
+    trash_removed = _remove_trash_directory(source)
     all_removed.extend(trash_removed)
 
-    while True:
-        removed_rels = _remove_orphaned_rels_files(unpacked_dir)
-        referenced = _get_referenced_files(unpacked_dir)
-        removed_files = _remove_orphaned_files(unpacked_dir, referenced)
-
-        total_removed = removed_rels + removed_files
-        if not total_removed:
-            break
-
-        all_removed.extend(total_removed)
+    parts_removed = _sweep_unreachable_parts(source)
+    all_removed.extend(parts_removed)
 
     if all_removed:
-        _update_content_types(unpacked_dir, all_removed)
+        _update_content_types(source, all_removed)
 
     return all_removed
 
 
-def _get_slides_in_sldidlst(unpacked_dir: Path) -> set[str]:
-    pres_path = unpacked_dir / "ppt" / "presentation.xml"
-    pres_rels_path = unpacked_dir / "ppt" / "_rels" / "presentation.xml.rels"
+def _get_slides_in_sldidlst(source: DirectorySource | ZipSource, parts: set[str]) -> set[str]:
+    pres_path = "ppt/presentation.xml"
+    pres_rels_path = "ppt/_rels/presentation.xml.rels"
 
-    if not pres_path.exists() or not pres_rels_path.exists():
+    if pres_path not in parts or pres_rels_path not in parts:
         return set()
 
-    rels_dom = defusedxml.minidom.parse(str(pres_rels_path))
+    rels_dom = defusedxml.minidom.parseString(source.read(pres_rels_path).decode("utf-8"))
     rid_to_slide: dict[str, str] = {}
     for rel in rels_dom.getElementsByTagName("Relationship"):
         rid = rel.getAttribute("Id")
@@ -75,36 +113,38 @@ def _get_slides_in_sldidlst(unpacked_dir: Path) -> set[str]:
         if "slide" in rel_type and target.startswith("slides/"):
             rid_to_slide[rid] = target.replace("slides/", "")
 
-    pres_content = pres_path.read_text(encoding="utf-8")
+    pres_content = source.read(pres_path).decode("utf-8")
     referenced_rids = set(re.findall(r'<p:sldId[^>]*r:id="([^"]+)"', pres_content))
 
     return {rid_to_slide[rid] for rid in referenced_rids if rid in rid_to_slide}
 
 
-def _remove_orphaned_slides(unpacked_dir: Path) -> list[str]:
-    slides_dir = unpacked_dir / "ppt" / "slides"
-    slides_rels_dir = slides_dir / "_rels"
-    pres_rels_path = unpacked_dir / "ppt" / "_rels" / "presentation.xml.rels"
+def _remove_orphaned_slides(source: DirectorySource | ZipSource) -> list[str]:
+    parts = set(source.names())
+    pres_rels_path = "ppt/_rels/presentation.xml.rels"
 
-    if not slides_dir.exists():
+    slide_files = sorted(
+        name for name in parts if fnmatch.fnmatchcase(name, "ppt/slides/slide*.xml") and name.count("/") == 2
+    )
+    if not slide_files:
         return []
 
-    referenced_slides = _get_slides_in_sldidlst(unpacked_dir)
+    referenced_slides = _get_slides_in_sldidlst(source, parts)
     removed = []
 
-    for slide_file in slides_dir.glob("slide*.xml"):
-        if slide_file.name not in referenced_slides:
-            rel_path = slide_file.relative_to(unpacked_dir)
-            slide_file.unlink()
-            removed.append(str(rel_path))
+    for slide_file in slide_files:
+        slide_name = posixpath.basename(slide_file)
+        if slide_name not in referenced_slides:
+            source.remove(slide_file)
+            removed.append(slide_file)
 
-            rels_file = slides_rels_dir / f"{slide_file.name}.rels"
-            if rels_file.exists():
-                rels_file.unlink()
-                removed.append(str(rels_file.relative_to(unpacked_dir)))
+            rels_file = f"ppt/slides/_rels/{slide_name}.rels"
+            if rels_file in parts:
+                source.remove(rels_file)
+                removed.append(rels_file)
 
-    if removed and pres_rels_path.exists():
-        rels_dom = defusedxml.minidom.parse(str(pres_rels_path))
+    if removed and pres_rels_path in parts:
+        rels_dom = defusedxml.minidom.parseString(source.read(pres_rels_path).decode("utf-8"))
         changed = False
 
         for rel in list(rels_dom.getElementsByTagName("Relationship")):
@@ -117,157 +157,104 @@ def _remove_orphaned_slides(unpacked_dir: Path) -> list[str]:
                         changed = True
 
         if changed:
-            with open(pres_rels_path, "wb") as f:
-                f.write(rels_dom.toxml(encoding="utf-8"))
+            source.write(pres_rels_path, rels_dom.toxml(encoding="utf-8"))
 
     return removed
 
 
-def _remove_trash_directory(unpacked_dir: Path) -> list[str]:
-    trash_dir = unpacked_dir / "[trash]"
+def _remove_trash_directory(source: DirectorySource | ZipSource) -> list[str]:
     removed = []
 
-    if trash_dir.exists() and trash_dir.is_dir():
-        for file_path in trash_dir.iterdir():
-            if file_path.is_file():
-                rel_path = file_path.relative_to(unpacked_dir)
-                removed.append(str(rel_path))
-                file_path.unlink()
-        trash_dir.rmdir()
-
-    return removed
+    for name in sorted(source.names()):
+        if posixpath.dirname(name) == TRASH_DIRECTORY:
+            source.remove(name)
+            removed.append(name)
 
+    if isinstance(source, DirectorySource):
+        trash_dir = source.root / TRASH_DIRECTORY
+        if trash_dir.is_dir():
+            trash_dir.rmdir()
 
-def _get_slide_referenced_files(unpacked_dir: Path) -> set:
-    referenced: set = set()
-    slides_rels_dir = unpacked_dir / "ppt" / "slides" / "_rels"
-
-    if not slides_rels_dir.exists():
-        return referenced
-
-    for rels_file in slides_rels_dir.glob("*.rels"):
-        dom = defusedxml.minidom.parse(str(rels_file))
-        for rel in dom.getElementsByTagName("Relationship"):
-            target = rel.getAttribute("Target")
-            if not target:
-                continue
-            target_path = (rels_file.parent.parent / target).resolve()
-            try:
-                referenced.add(target_path.relative_to(unpacked_dir.resolve()))
-            except ValueError:
-                pass
+    return removed
 
-    return referenced
 
+def _sweep_unreachable_parts(source: DirectorySource | ZipSource) -> list[str]:
+    """Delete resource parts that no kept part references, directly or indirectly.
 
-def _remove_orphaned_rels_files(unpacked_dir: Path) -> list[str]:
-    resource_dirs = ["charts", "diagrams", "drawings"]
-    removed = []
-    slide_referenced = _get_slide_referenced_files(unpacked_dir)
+    Every ``.rels`` file is parsed once into a graph. Parts outside the
+    sweepable resource directories are never deleted and act as roots; the
+    sweepable parts reachable from them are marked and the rest (with their
+    rels) are removed in a single pass.
+    """
+    parts = set(source.names())
+    graph = _build_relationship_graph(source, parts)
 
-    for dir_name in resource_dirs:
-        rels_dir = unpacked_dir / "ppt" / dir_name / "_rels"
-        if not rels_dir.exists():
+    sweepable = {name for name in parts if _is_sweepable(name)}
+    pending = [target for owner, targets in graph.items() if not _is_sweepable(owner) for target in targets]
+    reachable: set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name in reachable or name not in sweepable:
             continue
+        reachable.add(name)
+        pending.extend(graph.get(name, ()))
 
-        for rels_file in rels_dir.glob("*.rels"):
-            resource_file = rels_dir.parent / rels_file.name.replace(".rels", "")
-            try:
-                resource_rel_path = resource_file.resolve().relative_to(unpacked_dir.resolve())
-            except ValueError:
-                continue
-
-            if not resource_file.exists() or resource_rel_path not in slide_referenced:
-                rels_file.unlink()
-                rel_path = rels_file.relative_to(unpacked_dir)
-                removed.append(str(rel_path))
+    removed = []
+    for name in sorted(parts):
+        owner = source_part_name(name) if _is_rels_part(name) else name
+        if _is_sweepable(owner) and owner not in reachable:
+            source.remove(name)
+            removed.append(name)
 
     return removed
 
 
-def _get_referenced_files(unpacked_dir: Path) -> set:
-    referenced: set = set()
+def _build_relationship_graph(source: DirectorySource | ZipSource, parts: set[str]) -> dict[str, list[str]]:
+    """Map each source part (``""`` for the package) to the internal parts its rels point at."""
+    graph: dict[str, list[str]] = {}
+    for rels_name in parts:
+        if not _is_rels_part(rels_name):
+            continue
 
-    for rels_file in unpacked_dir.rglob("*.rels"):
-        dom = defusedxml.minidom.parse(str(rels_file))
-        for rel in dom.getElementsByTagName("Relationship"):
-            target = rel.getAttribute("Target")
-            if not target:
+        targets = []
+        for rel in parse_relationships(source.read(rels_name)):
+            if rel.external or not rel.target:
                 continue
-            target_path = (rels_file.parent.parent / target).resolve()
-            try:
-                referenced.add(target_path.relative_to(unpacked_dir.resolve()))
-            except ValueError:
-                pass
+            target = resolve_target(rels_name, rel.target)
+            if target is not None:
+                targets.append(target)
+        graph[source_part_name(rels_name)] = targets
 
-    return referenced
+    return graph
 
 
-def _remove_orphaned_files(unpacked_dir: Path, referenced: set) -> list[str]:
-    resource_dirs = ["media", "embeddings", "charts", "diagrams", "tags", "drawings", "ink"]
-    removed = []
+def _is_rels_part(name: str) -> bool:
+    return name.endswith(".rels") and posixpath.basename(posixpath.dirname(name)) == "_rels"
 
-    for dir_name in resource_dirs:
-        dir_path = unpacked_dir / "ppt" / dir_name
-        if not dir_path.exists():
-            continue
 
-        for file_path in dir_path.glob("*"):
-            if not file_path.is_file():
-                continue
-            rel_path = file_path.relative_to(unpacked_dir)
-            if rel_path not in referenced:
-                file_path.unlink()
-                removed.append(str(rel_path))
-
-    theme_dir = unpacked_dir / "ppt" / "theme"
-    if theme_dir.exists():
-        for file_path in theme_dir.glob("theme*.xml"):
-            rel_path = file_path.relative_to(unpacked_dir)
-            if rel_path not in referenced:
-                file_path.unlink()
-                removed.append(str(rel_path))
-                theme_rels = theme_dir / "_rels" / f"{file_path.name}.rels"
-                if theme_rels.exists():
-                    theme_rels.unlink()
-                    removed.append(str(theme_rels.relative_to(unpacked_dir)))
-
-    notes_dir = unpacked_dir / "ppt" / "notesSlides"
-    if notes_dir.exists():
-        for file_path in notes_dir.glob("*.xml"):
-            if not file_path.is_file():
-                continue
-            rel_path = file_path.relative_to(unpacked_dir)
-            if rel_path not in referenced:
-                file_path.unlink()
-                removed.append(str(rel_path))
-
-        notes_rels_dir = notes_dir / "_rels"
-        if notes_rels_dir.exists():
-            for file_path in notes_rels_dir.glob("*.rels"):
-                notes_file = notes_dir / file_path.name.replace(".rels", "")
-                if not notes_file.exists():
-                    file_path.unlink()
-                    removed.append(str(file_path.relative_to(unpacked_dir)))
-
-    return removed
+def _is_sweepable(name: str) -> bool:
+    directory, filename = posixpath.split(name)
+    if directory in SWEEPABLE_DIRECTORIES:
+        return True
+    if directory == "ppt/theme":
+        return fnmatch.fnmatchcase(filename, "theme*.xml")
+    return directory == "ppt/notesSlides" and filename.endswith(".xml")
 
 
-def _update_content_types(unpacked_dir: Path, removed_files: list[str]) -> None:
-    ct_path = unpacked_dir / "[Content_Types].xml"
-    if not ct_path.exists():
+def _update_content_types(source: DirectorySource | ZipSource, removed_files: list[str]) -> None:
+    if CONTENT_TYPES_PART not in source.names():
         return
 
-    dom = defusedxml.minidom.parse(str(ct_path))
+    dom = defusedxml.minidom.parseString(source.read(CONTENT_TYPES_PART).decode("utf-8"))
     changed = False
 
+    removed = set(removed_files)
     for override in list(dom.getElementsByTagName("Override")):
         part_name = override.getAttribute("PartName").lstrip("/")
-        if part_name in removed_files:
+        if part_name in removed:
             if override.parentNode:
                 override.parentNode.removeChild(override)
                 changed = True
 
     if changed:
-        with open(ct_path, "wb") as f:
-            f.write(dom.toxml(encoding="utf-8"))
+        source.write(CONTENT_TYPES_PART, dom.toxml(encoding="utf-8"))
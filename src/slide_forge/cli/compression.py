@@ -0,0 +1,69 @@
+"""Per-member compression policy for writing packages.
+
+Media that is already compressed (PNG, JPEG, MP4, embedded Office files, ...)
+is stored as-is instead of being deflated again; XML and uncompressed
+formats (EMF/WMF, BMP, OLE binaries) are deflated at a selectable level.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import zipfile
+
+from slide_forge.cli.opc import CONTENT_TYPES_PART
+
+COMPRESSION_LEVELS = {"fast": 1, "default": 6, "max": 9}
+
+STORED_EXTENSIONS = frozenset(
+    {
+        # Images
+        "png", "jpg", "jpeg", "jpe", "jfif", "gif", "webp", "heic", "avif", "jxr", "wdp",
+        # Audio and video
+        "mp3", "m4a", "aac", "ogg", "oga", "wma", "mp4", "m4v", "mov", "wmv", "avi", "mpg", "mpeg", "webm", "mkv",
+        # Fonts and archives (obfuscated .odttf fonts are plain TrueType and are deflated)
+        "woff", "woff2", "zip", "gz", "7z",
+        # Embedded Office Open XML packages are zip files themselves
+        "xlsx", "xlsm", "docx", "docm", "pptx", "pptm",
+    }
+)  # fmt: skip
+
+MAGIC_PREFIXES = (
+    b"\x89PNG\r\n\x1a\n",
+    b"\xff\xd8\xff",  # JPEG
+    b"GIF87a",
+    b"GIF89a",
+    b"PK\x03\x04",  # zip (embedded packages)
+    b"\x1f\x8b",  # gzip
+    b"7z\xbc\xaf\x27\x1c",
+    b"ID3",  # MP3
+    b"OggS",
+    b"\x1aE\xdf\xa3",  # Matroska / WebM
+    b"wOFF",
+    b"wOF2",
+)
+
+MAGIC_HEADER_SIZE = 16
+
+
+def is_precompressed(name: str, header: bytes = b"") -> bool:
+    """Return whether the member is already compressed, by extension or magic bytes."""
+    extension = posixpath.splitext(name)[1].lstrip(".").lower()
+    if extension in STORED_EXTENSIONS:
+        return True
+
+    if header.startswith(MAGIC_PREFIXES):
+        return True
+    if header[4:8] == b"ftyp":  # MP4 / MOV / HEIC
+        return True
+    return header[:4] == b"RIFF" and header[8:12] == b"WEBP"
+
+
+def compression_for(name: str, header: bytes = b"") -> int:
+    return zipfile.ZIP_STORED if is_precompressed(name, header) else zipfile.ZIP_DEFLATED
+
+
+def member_order(names: list[str]) -> list[str]:
+    """Put ``[Content_Types].xml`` first, keeping the order of the other members."""
+    if CONTENT_TYPES_PART not in names:
+        return list(names)
+    return [CONTENT_TYPES_PART] + [name for name in names if name != CONTENT_TYPES_PART]
@@ -0,0 +1,151 @@
+"""Slide-level view of a packed presentation and reduced copies of it.
+
+:func:`build_reduced_deck` writes a copy of a deck that renders only some of
+its slides. Slides after the last kept one are dropped. Earlier ones are
+replaced by blank hidden slides, so the kept slides keep their positions and
+their slide-number fields still show the original numbers. Media, charts and
+notes that only the removed content used are swept out of the copy.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import NamedTuple
+
+import lxml.etree
+
+from slide_forge.cli.opc import (
+    PACKAGE_RELATIONSHIPS_NAMESPACE,
+    DirectorySource,
+    ZipSource,
+    rels_part_name,
+    resolve_target,
+)
+from slide_forge.cli.xml_format import xml_parser
+
+PRESENTATIONML_NAMESPACE = "http://schemas.openxmlformats.org/presentationml/2006/main"
+OFFICE_RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PRESENTATION_PART = "ppt/presentation.xml"
+SLIDE_LAYOUT_RELATIONSHIP = f"{OFFICE_RELATIONSHIPS_NAMESPACE}/slideLayout"
+
+_BLANK_SLIDE = (
+    f'<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    f'xmlns:r="{OFFICE_RELATIONSHIPS_NAMESPACE}" xmlns:p="{PRESENTATIONML_NAMESPACE}" show="0">'
+    '<p:cSld><p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    "<p:grpSpPr/></p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>"
+).encode()
+
+
+class SlideEntry(NamedTuple):
+    position: int
+    part_name: str
+    hidden: bool
+
+
+def list_slides(source: DirectorySource | ZipSource) -> list[SlideEntry]:
+    """Return the slides of the presentation in ``sldIdLst`` order (positions are 1-based)."""
+    presentation = lxml.etree.fromstring(source.read(PRESENTATION_PART), parser=xml_parser())
+    slides = []
+    for position, (_, part_name) in enumerate(_slide_ids(source, presentation), 1):
+        slide = lxml.etree.fromstring(source.read(part_name), parser=xml_parser())
+        slides.append(SlideEntry(position, part_name, slide.get("show") in ("0", "false")))
+    return slides
+
+
+def parse_slide_ranges(spec: str, count: int) -> list[int]:
+    """Parse ``"12-14,20"`` into sorted, unique 1-based positions within *count* slides."""
+    positions: set[int] = set()
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        first, _, last = item.partition("-")
+        try:
+            start = int(first)
+            stop = int(last) if last else start
+        except ValueError:
+            raise ValueError(f"Invalid slide range: {item!r}") from None
+        if not 1 <= start <= stop <= count:
+            raise ValueError(f"Slide range {item} out of range (1-{count})")
+        positions.update(range(start, stop + 1))
+
+    if not positions:
+        raise ValueError("No slides selected")
+    return sorted(positions)
+
+
+def build_reduced_deck(pptx_path: str | Path, output_path: str | Path, keep: set[int]) -> list[SlideEntry]:
+    """Write a copy of *pptx_path* that shows only the slides at positions *keep*.
+
+    Kept slides are shown even if they were hidden. Returns the kept slides
+    in presentation order, which is also the page order of the converted PDF.
+    """
+    from slide_forge.cli.clean import clean_unused_files
+
+    source = ZipSource(pptx_path)
+    slides = list_slides(source)
+    last = max(keep, default=0)
+    presentation = lxml.etree.fromstring(source.read(PRESENTATION_PART), parser=xml_parser())
+
+    kept = []
+    for slide, (sld_id, _) in zip(slides, _slide_ids(source, presentation), strict=True):
+        if slide.position in keep:
+            kept.append(slide)
+            if slide.hidden:
+                _unhide_slide(source, slide.part_name)
+        elif slide.position > last:
+            sld_id.getparent().remove(sld_id)
+        else:
+            _blank_slide(source, slide.part_name)
+
+    source.write(PRESENTATION_PART, lxml.etree.tostring(presentation, xml_declaration=True, encoding="UTF-8"))
+    clean_unused_files(source)
+    source.save(output_path)
+    return kept
+
+
+def _slide_ids(
+    source: DirectorySource | ZipSource, presentation: lxml.etree._Element
+) -> list[tuple[lxml.etree._Element, str]]:
+    """Return each ``sldId`` element with the slide part it points at, skipping dangling ids."""
+    targets = _relationship_targets(source, PRESENTATION_PART)
+    entries = []
+    for sld_id in presentation.iterfind(f"{{{PRESENTATIONML_NAMESPACE}}}sldIdLst/{{{PRESENTATIONML_NAMESPACE}}}sldId"):
+        part_name = targets.get(sld_id.get(f"{{{OFFICE_RELATIONSHIPS_NAMESPACE}}}id", ""))
+        if part_name is not None:
+            entries.append((sld_id, part_name))
+    return entries
+
+
+def _relationship_targets(source: DirectorySource | ZipSource, part_name: str) -> dict[str, str]:
+    """Map relationship ids of *part_name* to the internal parts they point at."""
+    rels_name = rels_part_name(part_name)
+    root = lxml.etree.fromstring(source.read(rels_name), parser=xml_parser())
+    targets = {}
+    for rel in root.iter(f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = resolve_target(rels_name, rel.get("Target", ""))
+        if target is not None:
+            targets[rel.get("Id", "")] = target
+    return targets
+
+
+def _blank_slide(source: DirectorySource | ZipSource, part_name: str) -> None:
+    """Replace a slide with an empty hidden one that keeps only its layout relationship."""
+    source.write(part_name, _BLANK_SLIDE)
+
+    rels_name = rels_part_name(part_name)
+    if rels_name not in source.names():
+        return
+    root = lxml.etree.fromstring(source.read(rels_name), parser=xml_parser())
+    for rel in list(root):
+        if rel.get("Type") != SLIDE_LAYOUT_RELATIONSHIP:
+            root.remove(rel)
+    source.write(rels_name, lxml.etree.tostring(root, xml_declaration=True, encoding="UTF-8"))
+
+
+def _unhide_slide(source: DirectorySource | ZipSource, part_name: str) -> None:
+    root = lxml.etree.fromstring(source.read(part_name), parser=xml_parser())
+    root.attrib.pop("show", None)
+    source.write(part_name, lxml.etree.tostring(root, xml_declaration=True, encoding="UTF-8"))
@@ -0,0 +1,167 @@
+"""Open Packaging Conventions helpers shared by the CLI tools.
+
+Part names are POSIX paths relative to the package root without a leading
+slash (``ppt/slides/slide1.xml``), matching zip member names.
+"""
+
+from __future__ import annotations
+
+import os
+import posixpath
+import zipfile
+from pathlib import Path, PurePath
+from typing import NamedTuple
+
+import lxml.etree
+
+from slide_forge.cli.zip_raw import copy_member
+
+PACKAGE_RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+ROOT_RELS_PART = "_rels/.rels"
+
+
+def rels_part_name(part_name: str) -> str:
+    """Return the relationships part for *part_name* (``a/b.xml`` -> ``a/_rels/b.xml.rels``)."""
+    directory, name = posixpath.split(part_name)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def source_part_name(rels_name: str) -> str:
+    """Return the part a relationships part belongs to (``""`` for the package root)."""
+    rels_dir, name = posixpath.split(rels_name)
+    return posixpath.join(posixpath.dirname(rels_dir), name.removesuffix(".rels"))
+
+
+def resolve_target(rels_name: str, target: str) -> str | None:
+    """Resolve a relationship target to a part name, or ``None`` if it leaves the package."""
+    if target.startswith("/"):
+        resolved = posixpath.normpath(target.lstrip("/"))
+    else:
+        base_dir = posixpath.dirname(posixpath.dirname(rels_name))
+        resolved = posixpath.normpath(posixpath.join(base_dir, target))
+
+    if resolved == ".." or resolved.startswith("../"):
+        return None
+    return resolved
+
+
+class RelationshipTarget(NamedTuple):
+    rel_type: str
+    target: str
+    external: bool
+
+
+def parse_relationships(content: bytes) -> list[RelationshipTarget]:
+    """Return the relationships of a ``.rels`` part in document order."""
+    parser = lxml.etree.XMLParser(resolve_entities=False, no_network=True, load_dtd=False)
+    root = lxml.etree.fromstring(content, parser=parser)
+    return [
+        RelationshipTarget(rel.get("Type", ""), rel.get("Target", ""), rel.get("TargetMode") == "External")
+        for rel in root.iter(f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship")
+    ]
+
+
+class DirectorySource:
+    """Package parts stored as files in an unpacked directory."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root).resolve()
+
+    def names(self) -> list[str]:
+        return [p.relative_to(self.root).as_posix() for p in self.root.rglob("*") if p.is_file()]
+
+    def read(self, name: str) -> bytes:
+        return (self.root / name).read_bytes()
+
+    def write(self, name: str, content: bytes) -> None:
+        (self.root / name).write_bytes(content)
+
+    def remove(self, name: str) -> None:
+        (self.root / name).unlink()
+
+    def part_name(self, path: str | PurePath) -> str:
+        return Path(path).resolve().relative_to(self.root).as_posix()
+
+
+class ZipSource:
+    """Package parts read straight from a packed file.
+
+    XML and relationship members are decompressed into memory once; media
+    and other binary members are only listed, never read, unless asked for.
+    Writes and removals are kept in memory and never touch the original
+    file; :meth:`save` writes the result as a new package.
+    """
+
+    XML_SUFFIXES = (".xml", ".rels")
+
+    def __init__(self, path: str | Path):
+        self.root = Path(path).resolve()
+        self._contents: dict[str, bytes] = {}
+        self.modified: set[str] = set()
+
+        with zipfile.ZipFile(self.root, "r") as zf:
+            self._names = [info.filename for info in zf.infolist() if not info.is_dir()]
+            for name in self._names:
+                if name.endswith(self.XML_SUFFIXES):
+                    self._contents[name] = zf.read(name)
+
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    def read(self, name: str) -> bytes:
+        content = self._contents.get(name)
+        if content is None:
+            with zipfile.ZipFile(self.root, "r") as zf:
+                content = zf.read(name)
+        return content
+
+    def write(self, name: str, content: bytes) -> None:
+        if name not in self._contents and name not in self._names:
+            self._names.append(name)
+        self._contents[name] = content
+        self.modified.add(name)
+
+    def remove(self, name: str) -> None:
+        self._names.remove(name)
+        self._contents.pop(name, None)
+        self.modified.discard(name)
+
+    def part_name(self, path: str | PurePath) -> str:
+        return PurePath(path).as_posix().lstrip("/")
+
+    def save(self, path: str | Path) -> None:
+        """Write the package to *path*, copying unmodified members as raw compressed bytes."""
+        path = Path(path)
+        names = set(self._names)
+        temp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            with zipfile.ZipFile(self.root, "r") as src, zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as dst:
+                copied = set()
+                for info in src.infolist():
+                    if info.filename not in names:
+                        continue
+                    copied.add(info.filename)
+                    if info.filename in self.modified:
+                        header = zipfile.ZipInfo(info.filename, info.date_time)
+                        header.external_attr = info.external_attr
+                        header.compress_type = zipfile.ZIP_DEFLATED
+                        dst.writestr(header, self._contents[info.filename])
+                    else:
+                        copy_member(src, info, dst)
+
+                for name in self._names:
+                    if name not in copied:
+                        dst.writestr(name, self._contents[name])
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+
+def open_source(path: str | Path) -> DirectorySource | ZipSource:
+    """Open an unpacked directory or a packed file as a package source."""
+    path = Path(path)
+    if path.is_file():
+        return ZipSource(path)
+    return DirectorySource(path)
@@ -6,15 +6,28 @@ Validates with auto-repair, condenses XML formatting, and creates the PPTX file.
 from __future__ import annotations
 
 import argparse
+import contextlib
+import os
 import shutil
+import stat
 import sys
-import tempfile
+import time
 import zipfile
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import defusedxml.minidom
+from slide_forge import __version__
+from slide_forge.cli.cache import sidecar_cache_dir
+from slide_forge.cli.compression import COMPRESSION_LEVELS, MAGIC_HEADER_SIZE, compression_for, member_order
+from slide_forge.cli.pack_cache import PackCache
+from slide_forge.cli.validators import SCHEMA_CACHE, PPTXSchemaValidator
+from slide_forge.cli.xml_format import condense_xml
+from slide_forge.cli.zip_raw import read_raw, write_raw
 
-from slide_forge.cli.validators import PPTXSchemaValidator
+# Earliest timestamp a zip header can hold.
+DETERMINISTIC_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+DETERMINISTIC_FILE_MODE = stat.S_IFREG | 0o644
 
 
 def configure_parser(subparsers: argparse._SubParsersAction) -> None:
@@ -22,6 +35,10 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
     parser.add_argument("input_directory", help="Unpacked PPTX document directory")
     parser.add_argument("output_file", help="Output .pptx file")
     parser.add_argument("--original", help="Original .pptx file for validation comparison")
+    parser.add_argument(
+        "--base",
+        help="Merge a partial unpack (unpack --only) over this .pptx; its other members are copied unchanged",
+    )
     parser.add_argument(
         "--validate",
         type=lambda x: x.lower() == "true",
@@ -29,6 +46,36 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
         metavar="true|false",
         help="Run validation with auto-repair (default: true)",
     )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Do not read or write the cached packed parts, per-part results and baseline errors of --original",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate XSD schemas and condense XML in N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--level",
+        choices=list(COMPRESSION_LEVELS),
+        default="default",
+        help="Deflate level for XML and other compressible parts (default: default)",
+    )
+    parser.add_argument(
+        "--deterministic",
+        action="store_true",
+        help="Sort members and use fixed timestamps so identical input gives identical bytes",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Report wall-clock time, sizes and peak memory (RSS)",
+    )
     parser.set_defaults(func=_run)
 
 
@@ -37,7 +84,13 @@ def _run(args: argparse.Namespace) -> None:
         args.input_directory,
         args.output_file,
         original_file=args.original,
+        base_file=args.base,
         validate=args.validate,
+        use_cache=args.use_cache,
+        jobs=args.jobs,
+        level=args.level,
+        deterministic=args.deterministic,
+        stats=args.stats,
     )
     print(message)
 
@@ -49,8 +102,15 @@ def pack(
     input_directory: str,
     output_file: str,
     original_file: str | None = None,
+    base_file: str | None = None,
     validate: bool = True,
+    use_cache: bool = True,
+    jobs: int = 1,
+    level: str = "default",
+    deterministic: bool = False,
+    stats: bool = False,
 ) -> tuple[None, str]:
+    start = time.perf_counter()
     input_dir = Path(input_directory)
     output_path = Path(output_file)
 
@@ -60,67 +120,228 @@ def pack(
     if output_path.suffix.lower() != ".pptx":
         return None, f"Error: {output_file} must be a .pptx file"
 
-    if validate and original_file:
-        original_path = Path(original_file)
-        if original_path.exists():
-            success, output = _run_validation(input_dir, original_path)
+    if level not in COMPRESSION_LEVELS:
+        return None, f"Error: Unknown compression level {level!r}"
+
+    base_path = Path(base_file) if base_file else None
+    if base_path is not None and not zipfile.is_zipfile(base_path):
+        return None, f"Error: {base_file} is not a valid PPTX file"
+
+    original_path = Path(original_file) if validate and original_file else None
+    if original_path is not None and not original_path.exists():
+        original_path = None
+
+    # A partial directory is validated after merging, without auto-repair
+    if original_path is not None and base_path is None:
+        success, output = _run_validation(input_dir, original_path, use_cache=use_cache, jobs=jobs)
+        if output:
+            print(output)
+        if not success:
+            return None, f"Error: Validation failed for {input_dir}"
+
+    files = [f for f in input_dir.rglob("*") if f.is_file()]
+    members = {f.relative_to(input_dir).as_posix(): f for f in files}
+    source_stats = {name: path.stat() for name, path in members.items()}
+    compresslevel = COMPRESSION_LEVELS[level]
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_output = output_path.with_name(f".{output_path.name}.tmp")
+    cache = PackCache(sidecar_cache_dir(input_dir) if use_cache else None, f"{__version__}-{level}")
+    try:
+        with contextlib.ExitStack() as stack:
+            zf = stack.enter_context(zipfile.ZipFile(temp_output, "w", zipfile.ZIP_DEFLATED))
+            base_zf = stack.enter_context(zipfile.ZipFile(base_path, "r")) if base_path is not None else None
+            base_infos = {info.filename: info for info in base_zf.infolist() if not info.is_dir()} if base_zf else {}
+
+            all_names = list(base_infos) + [name for name in members if name not in base_infos]
+            names = member_order(sorted(all_names) if deterministic else all_names)
+            cached = {
+                name: cache.lookup(name, members[name], source_stats[name]) for name in members if _is_xml_part(name)
+            }
+            xml_paths = [members[name] for name in names if name in cached and cached[name] is None]
+            condensed = stack.enter_context(contextlib.closing(_condense_parts(xml_paths, jobs)))
+
+            for arcname in names:
+                if arcname not in members:
+                    assert base_zf is not None
+                    _write_base_part(zf, base_zf, base_infos[arcname], deterministic)
+                    continue
+
+                info = _member_info(members[arcname], arcname, deterministic)
+                if not _is_xml_part(arcname):
+                    _write_binary_part(zf, members[arcname], info, compresslevel, cache, source_stats[arcname])
+                    continue
+
+                cached_info = cached[arcname]
+                if cached_info is not None:
+                    _write_cached_part(zf, info, cache, cached_info)
+                else:
+                    _write_xml_part(zf, info, next(condensed), compresslevel)
+
+        if original_path is not None and base_path is not None:
+            success, output = _run_validation(temp_output, original_path, use_cache=use_cache, jobs=jobs, repair=False)
             if output:
                 print(output)
             if not success:
-                return None, f"Error: Validation failed for {input_dir}"
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+                return None, f"Error: Validation failed for {input_dir} merged over {base_file}"
 
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                _condense_xml(xml_file)
+        os.replace(temp_output, output_path)
+        cache.save(output_path, members, source_stats)
+    finally:
+        cache.close()
+        temp_output.unlink(missing_ok=True)
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-    return None, f"Successfully packed {input_dir} to {output_file}"
+    message = f"Successfully packed {input_dir} to {output_file}"
+    if stats:
+        input_bytes = sum(stat.st_size for stat in source_stats.values())
+        seconds = time.perf_counter() - start
+        message += "\n" + _stats_line(len(files), input_bytes, output_path.stat().st_size, seconds)
+        if use_cache:
+            message += "\n" + cache.summary()
+    return None, message
 
 
 def _run_validation(
     unpacked_dir: Path,
     original_file: Path,
+    use_cache: bool = True,
+    jobs: int = 1,
+    repair: bool = True,
 ) -> tuple[bool, str | None]:
     output_lines = []
-    validators = [PPTXSchemaValidator(unpacked_dir, original_file)]
+    validators = [PPTXSchemaValidator(unpacked_dir, original_file, use_cache=use_cache, jobs=jobs)]
 
-    total_repairs = sum(v.repair() for v in validators)
+    total_repairs = sum(v.repair() for v in validators) if repair else 0
     if total_repairs:
         output_lines.append(f"Auto-repaired {total_repairs} issue(s)")
 
     success = all(v.validate() for v in validators)
 
+    output_lines.append(SCHEMA_CACHE.summary())
+
     if success:
         output_lines.append("All validations PASSED!")
 
     return success, "\n".join(output_lines) if output_lines else None
 
 
-def _condense_xml(xml_file: Path) -> None:
-    try:
-        with open(xml_file, encoding="utf-8") as f:
-            dom = defusedxml.minidom.parse(f)
+def _is_xml_part(name: str) -> bool:
+    return name.endswith((".xml", ".rels"))
 
-        for element in dom.getElementsByTagName("*"):
-            if element.tagName.endswith(":t"):
-                continue
 
-            for child in list(element.childNodes):
-                if (
-                    child.nodeType == child.TEXT_NODE and child.nodeValue and child.nodeValue.strip() == ""
-                ) or child.nodeType == child.COMMENT_NODE:
-                    element.removeChild(child)
+def _condense_parts(paths: list[Path], jobs: int) -> Generator[bytes, None, None]:
+    """Yield condensed XML for *paths* in order, condensing in *jobs* processes.
 
-        xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
+    Workers only condense; the caller stays the single zip writer.
+    """
+    if jobs <= 1 or len(paths) < 2:
+        yield from map(_condense_xml, paths)
+        return
+
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(_condense_xml, paths, chunksize=chunksize)
+
+
+def _member_info(path: Path, arcname: str, deterministic: bool) -> zipfile.ZipInfo:
+    """Return the member header for *path*; deterministic headers only take the file's size from its stat."""
+    if deterministic:
+        return _deterministic_info(arcname, path.stat().st_size)
+    return zipfile.ZipInfo.from_file(path, arcname)
+
+
+def _deterministic_info(arcname: str, file_size: int = 0) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(arcname, DETERMINISTIC_DATE_TIME)
+    info.create_system = 3
+    info.external_attr = DETERMINISTIC_FILE_MODE << 16
+    # zf.open(info, "w") decides up front whether a streamed member needs zip64 from file_size.
+    info.file_size = file_size
+    return info
+
+
+def _write_xml_part(zf: zipfile.ZipFile, info: zipfile.ZipInfo, content: bytes, compresslevel: int) -> None:
+    info.compress_type = zipfile.ZIP_DEFLATED
+    zf.writestr(info, content, compresslevel=compresslevel)
+
+
+def _write_binary_part(
+    zf: zipfile.ZipFile,
+    path: Path,
+    info: zipfile.ZipInfo,
+    compresslevel: int,
+    cache: PackCache,
+    stat: os.stat_result,
+) -> None:
+    """Stream a non-XML part from disk; already-compressed media is stored."""
+    with open(path, "rb") as src:
+        info.compress_type = compression_for(info.filename, src.read(MAGIC_HEADER_SIZE))
+
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            cached = cache.lookup(info.filename, path, stat)
+            if cached is not None:
+                _write_cached_part(zf, info, cache, cached)
+                return
+
+        # ZipFile.write sets the same private attribute (an alias of compress_level on 3.13+) to
+        # stream a file under a header built here; there is no public way to pass the level to open().
+        info._compresslevel = compresslevel  # pyright: ignore[reportAttributeAccessIssue]
+        src.seek(0)
+        with zf.open(info, "w") as dest:
+            shutil.copyfileobj(src, dest, 1 << 20)
+
+
+def _write_cached_part(zf: zipfile.ZipFile, info: zipfile.ZipInfo, cache: PackCache, cached: zipfile.ZipInfo) -> None:
+    _write_raw_part(zf, info, cached, cache.read_raw(cached))
+
+
+def _write_base_part(
+    zf: zipfile.ZipFile, base_zf: zipfile.ZipFile, base_info: zipfile.ZipInfo, deterministic: bool
+) -> None:
+    """Copy an untouched member of the --base package without recompressing it."""
+    info = _deterministic_info(base_info.filename) if deterministic else base_info
+    _write_raw_part(zf, info, base_info, read_raw(base_zf, base_info))
+
+
+def _write_raw_part(zf: zipfile.ZipFile, info: zipfile.ZipInfo, source: zipfile.ZipInfo, raw: bytes) -> None:
+    """Write *raw* (compressed as described by *source*) under the header *info*."""
+    info.compress_type = source.compress_type
+    info.CRC = source.CRC
+    info.file_size = source.file_size
+    write_raw(zf, info, raw)
+
+
+def _condense_xml(xml_file: Path) -> bytes:
+    try:
+        return condense_xml(xml_file.read_bytes())
     except Exception as e:
         print(f"ERROR: Failed to parse {xml_file.name}: {e}", file=sys.stderr)
         raise
+
+
+def _stats_line(part_count: int, input_bytes: int, output_bytes: int, seconds: float) -> str:
+    peaks = _peak_rss_bytes()
+    if peaks is None:
+        peak = "n/a"
+    else:
+        parent, workers = peaks
+        peak = f"{parent / 2**20:.1f} MB"
+        if workers:
+            peak += f" (largest worker {workers / 2**20:.1f} MB)"
+    return (
+        f"Stats: {part_count} part(s), {input_bytes / 2**20:.1f} MB -> {output_bytes / 2**20:.1f} MB "
+        f"in {seconds:.2f}s, peak RSS {peak}"
+    )
+
+
+def _peak_rss_bytes() -> tuple[int, int] | None:
+    """Return the peak RSS of this process and of its largest finished child (the --jobs workers)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # Linux reports kilobytes, macOS bytes.
+    scale = 1 if sys.platform == "darwin" else 1024
+    parent = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return parent * scale, children * scale
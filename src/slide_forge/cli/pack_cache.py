@@ -0,0 +1,132 @@
+"""Sidecar cache of condensed and compressed members for incremental packs.
+
+The cache keeps the deflated members of the last pack in ``pack.zip`` next
+to the unpacked directory, plus ``pack.json`` with the source file's mtime,
+size and SHA-256 for each member. An unchanged part is copied into the next
+package as raw compressed bytes, so it is neither condensed nor deflated
+again. Stored media is not cached; it costs no more to stream from disk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import zipfile
+from pathlib import Path
+
+from slide_forge.cli.cache import file_sha256
+from slide_forge.cli.zip_raw import copy_member, read_raw
+
+
+class PackCache:
+    INDEX_NAME = "pack.json"
+    ARCHIVE_NAME = "pack.zip"
+
+    def __init__(self, directory: Path | None, settings: str):
+        self.directory = directory
+        self.settings = settings
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict] = {}
+        self._archive: zipfile.ZipFile | None = None
+
+        if directory is None:
+            return
+
+        try:
+            data = json.loads((directory / self.INDEX_NAME).read_text(encoding="utf-8"))
+            if data.get("settings") == settings:
+                self._entries = data["members"]
+                self._archive = zipfile.ZipFile(directory / self.ARCHIVE_NAME, "r")
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self._entries = {}
+
+    def lookup(self, name: str, path: Path, stat: os.stat_result) -> zipfile.ZipInfo | None:
+        """Return the cached member for *name* if *path* is unchanged since it was stored."""
+        entry = self._entries.get(name)
+        info = self._member(name, entry)
+        if entry is None or info is None:
+            self.misses += 1
+            return None
+
+        unchanged = stat.st_size == entry["size"] and (
+            stat.st_mtime_ns == entry["mtime_ns"] or file_sha256(path) == entry["sha256"]
+        )
+        if not unchanged:
+            self.misses += 1
+            return None
+
+        entry["mtime_ns"] = stat.st_mtime_ns
+        self.hits += 1
+        return info
+
+    def read_raw(self, info: zipfile.ZipInfo) -> bytes:
+        assert self._archive is not None
+        return read_raw(self._archive, info)
+
+    def save(self, output_path: Path, sources: dict[str, Path], stats: dict[str, os.stat_result]) -> None:
+        """Store the deflated members of *output_path*, keyed by their *sources*.
+
+        *stats* are the source stats taken before packing; parts modified
+        since then are left out rather than cached under the wrong key.
+        """
+        if self.directory is None:
+            return
+
+        entries: dict[str, dict] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        archive_path = self.directory / self.ARCHIVE_NAME
+        temp_path = archive_path.with_suffix(".tmp")
+        try:
+            with zipfile.ZipFile(output_path, "r") as output, zipfile.ZipFile(temp_path, "w") as archive:
+                for info in output.infolist():
+                    source = sources.get(info.filename)
+                    if source is None or info.compress_type == zipfile.ZIP_STORED:
+                        continue
+
+                    stat = source.stat()
+                    packed_stat = stats[info.filename]
+                    if (stat.st_mtime_ns, stat.st_size) != (packed_stat.st_mtime_ns, packed_stat.st_size):
+                        continue
+
+                    copy_member(output, info, archive)
+                    previous = self._entries.get(info.filename)
+                    if previous and previous["mtime_ns"] == stat.st_mtime_ns and previous["size"] == stat.st_size:
+                        sha256 = previous["sha256"]
+                    else:
+                        sha256 = file_sha256(source)
+                    entries[info.filename] = {
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "sha256": sha256,
+                        "crc": info.CRC,
+                        "compress_size": info.compress_size,
+                    }
+
+            self.close()
+            os.replace(temp_path, archive_path)
+            index = {"settings": self.settings, "members": entries}
+            (self.directory / self.INDEX_NAME).write_text(json.dumps(index), encoding="utf-8")
+        except OSError:
+            pass
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def summary(self) -> str:
+        return f"Pack cache: {self.hits} part(s) reused, {self.misses} rebuilt"
+
+    def _member(self, name: str, entry: dict | None) -> zipfile.ZipInfo | None:
+        if entry is None or self._archive is None:
+            return None
+        try:
+            info = self._archive.getinfo(name)
+        except KeyError:
+            return None
+        if info.CRC != entry["crc"] or info.compress_size != entry["compress_size"]:
+            return None
+        return info
@@ -0,0 +1,92 @@
+"""PDF conversions shared between render, thumbnail and preview.
+
+A converted PDF is stored under the SHA-256 of the .pptx and the converter
+version, so converting the same deck again (from any command) is a file
+copy. Only the most recently used ``MAX_ENTRIES`` PDFs are kept.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from slide_forge.cli.cache import file_sha256, user_cache_dir
+
+CACHE_FORMAT_VERSION = "1"
+
+
+def converter_version() -> str:
+    """Identify the PPTX -> PDF converter, running ``soffice --version`` once per installation."""
+    if sys.platform == "win32":
+        return "powerpoint"
+
+    soffice = shutil.which("soffice")
+    if soffice is None:
+        return "soffice"
+
+    real_path = os.path.realpath(soffice)
+    stat = os.stat(real_path)
+    stamp = f"{real_path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    versions_path = user_cache_dir("pdf") / "versions.json"
+    try:
+        versions = json.loads(versions_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        versions = {}
+    if stamp not in versions:
+        from slide_forge.cli.soffice import run_soffice
+
+        result = run_soffice(["--version"], capture_output=True, text=True)
+        output = (result.stdout or "").strip()
+        versions[stamp] = output.splitlines()[0] if output else stamp
+        try:
+            versions_path.write_text(json.dumps(versions), encoding="utf-8")
+        except OSError:
+            pass
+    return versions[stamp]
+
+
+class PdfCache:
+    MAX_ENTRIES = 32
+
+    def __init__(self, directory: Path | None = None):
+        self.directory = directory or user_cache_dir("pdf")
+        self._version: str | None = None
+
+    def wrap(self, convert: Callable[[str, str], None]) -> Callable[[str, str], None]:
+        """Return *convert* with its results looked up in and stored to the cache."""
+
+        def cached_convert(pptx_path: str, pdf_path: str) -> None:
+            cached_path = self._path(pptx_path)
+            if cached_path.exists():
+                shutil.copyfile(cached_path, pdf_path)
+                os.utime(cached_path)
+                print(f"PDF cache: reused conversion of {os.path.basename(pptx_path)}")
+                return
+
+            convert(pptx_path, pdf_path)
+            temp_path = cached_path.with_suffix(".tmp")
+            try:
+                shutil.copyfile(pdf_path, temp_path)
+                os.replace(temp_path, cached_path)
+                self._prune()
+            except OSError:
+                temp_path.unlink(missing_ok=True)
+
+        return cached_convert
+
+    def _path(self, pptx_path: str) -> Path:
+        if self._version is None:
+            self._version = converter_version()
+        key = hashlib.sha256(f"{CACHE_FORMAT_VERSION}\0{self._version}".encode()).hexdigest()[:16]
+        return self.directory / f"{file_sha256(pptx_path)}-{key}.pdf"
+
+    def _prune(self) -> None:
+        entries = sorted(self.directory.glob("*.pdf"), key=lambda path: path.stat().st_mtime, reverse=True)
+        for path in entries[self.MAX_ENTRIES :]:
+            path.unlink(missing_ok=True)
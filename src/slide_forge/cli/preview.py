@@ -0,0 +1,121 @@
+"""Render slide PNGs and thumbnail grids from a single PPTX -> PDF conversion.
+
+Equivalent to running ``render`` and ``thumbnail`` back to back, but the
+deck is converted once and both outputs are rasterized from the same PDF.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from slide_forge.cli import render, thumbnail
+from slide_forge.cli.deck import list_slides
+from slide_forge.cli.opc import ZipSource
+
+
+def configure_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("preview", help="Render slide PNGs and thumbnail grids from one conversion")
+    parser.add_argument("pptx", help="Path to the .pptx file")
+    parser.add_argument("output_dir", nargs="?", help="Output directory (default: <name>_preview/)")
+    parser.add_argument("--dpi", type=int, default=150, help="Slide image resolution (default: 150)")
+    parser.add_argument(
+        "--cols",
+        type=int,
+        default=thumbnail.DEFAULT_COLS,
+        help=f"Thumbnail grid columns (default: {thumbnail.DEFAULT_COLS}, max: {thumbnail.MAX_COLS})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Rasterize PDF pages in N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Convert even if render, thumbnail or preview already converted this file",
+    )
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Convert through a persistent LibreOffice instance that stays up between runs (macOS/Linux)",
+    )
+    backend.add_argument(
+        "--workers",
+        type=int,
+        help="Convert in one of N isolated LibreOffice profiles so up to N runs can convert at once (macOS/Linux)",
+    )
+    parser.set_defaults(func=_run)
+
+
+def _run(args: argparse.Namespace) -> None:
+    preview(
+        args.pptx,
+        args.output_dir,
+        args.dpi,
+        min(args.cols, thumbnail.MAX_COLS),
+        jobs=args.jobs,
+        daemon=args.daemon,
+        workers=args.workers,
+        use_cache=args.use_cache,
+    )
+
+
+def preview(
+    pptx_path: str,
+    output_dir: str | None = None,
+    dpi: int = 150,
+    cols: int = thumbnail.DEFAULT_COLS,
+    jobs: int = 1,
+    daemon: bool = False,
+    workers: int | None = None,
+    use_cache: bool = True,
+) -> tuple[list[str], list[str]]:
+    """Convert once, then write ``slide-NN.png`` images and ``thumbnails.jpg`` grid(s) to *output_dir*.
+
+    Returns:
+        The slide image paths and the grid paths
+    """
+    render._check_dependencies()
+
+    if not os.path.exists(pptx_path):
+        print(f"File not found: {pptx_path}")
+        sys.exit(1)
+
+    if output_dir is None:
+        output_dir = os.path.join(
+            os.path.dirname(pptx_path) or ".",
+            os.path.splitext(os.path.basename(pptx_path))[0] + "_preview",
+        )
+    os.makedirs(output_dir, exist_ok=True)
+
+    convert = functools.partial(render._pptx_to_pdf, daemon=daemon, workers=workers)
+    if use_cache:
+        from slide_forge.cli.pdf_cache import PdfCache
+
+        convert = PdfCache().wrap(convert)
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+        pdf_path = os.path.join(temp_dir, "render.pdf")
+        print(f"PPTX -> PDF: {pptx_path}")
+        convert(pptx_path, pdf_path)
+
+        print(f"PDF -> PNG ({dpi} DPI) and thumbnails")
+        images = render._pdf_to_images(pdf_path, output_dir, dpi, jobs)
+        thumbnails = thumbnail._iter_thumbnails(Path(pdf_path), thumbnail.THUMBNAIL_WIDTH)
+        slides = thumbnail._iter_slides(list_slides(ZipSource(pptx_path)), thumbnails)
+        grids = thumbnail._create_grids(slides, cols, thumbnail.THUMBNAIL_WIDTH, Path(output_dir) / "thumbnails.jpg")
+
+    print(f"Rendered {len(images)} slides and {len(grids)} grid(s) to {output_dir}/")
+    for path in [*images, *grids]:
+        print(f"  {os.path.basename(path)}")
+    return images, grids
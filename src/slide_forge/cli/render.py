@@ -2,13 +2,27 @@
 
 Windows: PowerPoint COM automation (PPTX -> PDF) + PyMuPDF (PDF -> PNG).
 macOS/Linux: LibreOffice headless (PPTX -> PDF) + PyMuPDF (PDF -> PNG).
+With ``--daemon`` the conversion goes through a shared, long-running
+LibreOffice instance instead (see :mod:`slide_forge.cli.soffice_daemon`).
+
+Images of unchanged slides are reused from a render cache; only changed
+slides are converted, as a reduced deck (see :mod:`slide_forge.cli.render_cache`).
+
+:func:`render_to_bytes` and :func:`iter_render_bytes` return encoded images
+from a PDF held in memory instead of writing files, for preview services.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import math
 import os
 import sys
+from collections.abc import Callable, Iterator
+
+IMAGE_FORMATS = ("png", "jpeg", "webp")
 
 
 def configure_parser(subparsers: argparse._SubParsersAction) -> None:
@@ -16,11 +30,50 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
     parser.add_argument("pptx", help="Path to the .pptx file")
     parser.add_argument("output_dir", nargs="?", help="Output directory (default: <name>_slides/)")
     parser.add_argument("--dpi", type=int, default=150, help="Image resolution (default: 150)")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Rasterize PDF pages in N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--slides",
+        metavar="RANGES",
+        help="Render only these slides, e.g. 12-14,20; images keep the original slide numbers",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Convert every slide instead of reusing cached images of unchanged slides and cached PDFs",
+    )
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Convert through a persistent LibreOffice instance that stays up between runs (macOS/Linux)",
+    )
+    backend.add_argument(
+        "--workers",
+        type=int,
+        help="Convert in one of N isolated LibreOffice profiles so up to N renders can run at once (macOS/Linux)",
+    )
     parser.set_defaults(func=_run)
 
 
 def _run(args: argparse.Namespace) -> None:
-    render(args.pptx, args.output_dir, args.dpi)
+    render(
+        args.pptx,
+        args.output_dir,
+        args.dpi,
+        daemon=args.daemon,
+        workers=args.workers,
+        jobs=args.jobs,
+        use_cache=args.use_cache,
+        slides=args.slides,
+    )
 
 
 def _check_dependencies() -> None:
@@ -33,11 +86,13 @@ def _check_dependencies() -> None:
             sys.exit(1)
 
 
-def _pptx_to_pdf(pptx_path: str, pdf_path: str) -> None:
+def _pptx_to_pdf(pptx_path: str, pdf_path: str, daemon: bool = False, workers: int | None = None) -> None:
     if sys.platform == "win32":
         _pptx_to_pdf_windows(pptx_path, pdf_path)
+    elif daemon:
+        _pptx_to_pdf_daemon(pptx_path, pdf_path)
     else:
-        _pptx_to_pdf_soffice(pptx_path, pdf_path)
+        _pptx_to_pdf_soffice(pptx_path, pdf_path, workers)
 
 
 def _pptx_to_pdf_windows(pptx_path: str, pdf_path: str) -> None:
@@ -57,13 +112,14 @@ def _pptx_to_pdf_windows(pptx_path: str, pdf_path: str) -> None:
         pythoncom.CoUninitialize()
 
 
-def _pptx_to_pdf_soffice(pptx_path: str, pdf_path: str) -> None:
+def _pptx_to_pdf_soffice(pptx_path: str, pdf_path: str, workers: int | None = None) -> None:
     from slide_forge.cli.soffice import run_soffice
 
     abs_pptx = os.path.abspath(pptx_path)
     output_dir = os.path.dirname(os.path.abspath(pdf_path))
     result = run_soffice(
         ["--headless", "--convert-to", "pdf", "--outdir", output_dir, abs_pptx],
+        workers=workers,
         capture_output=True,
     )
     # soffice outputs <stem>.pdf
@@ -78,29 +134,89 @@ def _pptx_to_pdf_soffice(pptx_path: str, pdf_path: str) -> None:
         os.replace(soffice_pdf, pdf_path)
 
 
-def _pdf_to_images(pdf_path: str, output_dir: str, dpi: int = 150) -> list[str]:
+def _pptx_to_pdf_daemon(pptx_path: str, pdf_path: str) -> None:
+    try:
+        import uno  # noqa: F401  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        print("Error: --daemon requires the LibreOffice Python bridge (uno).", file=sys.stderr)
+        print("Install python3-uno or run with LibreOffice's bundled Python.", file=sys.stderr)
+        sys.exit(1)
+
+    from slide_forge.cli.soffice_daemon import SofficeDaemon
+
+    try:
+        daemon = SofficeDaemon()
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    daemon.convert(pptx_path, pdf_path)
+
+
+def _pdf_to_images(pdf_path: str, output_dir: str, dpi: int = 150, jobs: int = 1) -> list[str]:
+    """Rasterize every page, splitting the pages into *jobs* contiguous ranges when > 1.
+
+    PyMuPDF documents cannot be shared between threads, so each worker
+    process opens the PDF itself and renders its own range.
+    """
     import pymupdf
 
     os.makedirs(output_dir, exist_ok=True)
-    doc = pymupdf.open(pdf_path)
+    with pymupdf.open(pdf_path) as doc:
+        page_count = len(doc)
+
+    if jobs <= 1 or page_count < 2:
+        return _rasterize_pages(pdf_path, output_dir, dpi, 0, page_count)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    range_size = math.ceil(page_count / jobs)
+    starts = range(0, page_count, range_size)
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        futures = [
+            executor.submit(_rasterize_pages, pdf_path, output_dir, dpi, start, min(start + range_size, page_count))
+            for start in starts
+        ]
+        return [path for future in futures for path in future.result()]
+
+
+def _rasterize_pages(pdf_path: str, output_dir: str, dpi: int, start: int, stop: int) -> list[str]:
+    import pymupdf
+
     paths = []
-    for i in range(len(doc)):
-        page = doc[i]
-        pix = page.get_pixmap(dpi=dpi)
-        img_path = os.path.join(output_dir, f"slide-{i + 1:02d}.png")
-        pix.save(img_path)
-        paths.append(img_path)
-    doc.close()
+    with pymupdf.open(pdf_path) as doc:
+        for i in range(start, stop):
+            pix = doc[i].get_pixmap(dpi=dpi)
+            img_path = os.path.join(output_dir, f"slide-{i + 1:02d}.png")
+            # Output images may be hard links into the render cache; never write through them.
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(img_path)
+            pix.save(img_path)
+            paths.append(img_path)
     return paths
 
 
-def render(pptx_path: str, output_dir: str | None = None, dpi: int = 150) -> list[str]:
+def render(
+    pptx_path: str,
+    output_dir: str | None = None,
+    dpi: int = 150,
+    daemon: bool = False,
+    workers: int | None = None,
+    jobs: int = 1,
+    use_cache: bool = True,
+    slides: str | None = None,
+) -> list[str]:
     """Full pipeline: PPTX -> PDF -> PNG images.
 
     Args:
         pptx_path: Path to the .pptx file
         output_dir: Directory for output images (default: same dir as pptx)
         dpi: Resolution for rendered images (default: 150)
+        daemon: Reuse a persistent LibreOffice instance (ignored on Windows)
+        workers: Convert in a free profile from a pool of this many (ignored on Windows)
+        jobs: Number of processes rasterizing PDF pages (default: 1)
+        use_cache: Reuse images of unchanged slides from the render cache and
+            PDFs converted by earlier render, thumbnail or preview runs
+        slides: Render only these slides, e.g. ``"12-14,20"`` (1-based deck positions)
 
     Returns:
         List of paths to generated PNG images
@@ -118,20 +234,225 @@ def render(pptx_path: str, output_dir: str | None = None, dpi: int = 150) -> lis
         )
 
     os.makedirs(output_dir, exist_ok=True)
+    convert = functools.partial(_pptx_to_pdf, daemon=daemon, workers=workers)
+    if use_cache or slides:
+        try:
+            images = _render_slides(pptx_path, output_dir, dpi, jobs, convert, slides, use_cache)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        images = _convert_and_rasterize(pptx_path, output_dir, dpi, jobs, convert)
+
+    print(f"Rendered {len(images)} slides to {output_dir}/")
+    for img in images:
+        print(f"  {os.path.basename(img)}")
+    return images
+
+
+def _convert_and_rasterize(
+    pptx_path: str, output_dir: str, dpi: int, jobs: int, convert: Callable[[str, str], None]
+) -> list[str]:
     pdf_path = os.path.join(output_dir, "render.pdf")
 
     print(f"PPTX -> PDF: {pptx_path}")
-    _pptx_to_pdf(pptx_path, pdf_path)
+    convert(pptx_path, pdf_path)
 
     print(f"PDF -> PNG ({dpi} DPI): {pdf_path}")
-    images = _pdf_to_images(pdf_path, output_dir, dpi)
+    images = _pdf_to_images(pdf_path, output_dir, dpi, jobs)
 
     try:
         os.remove(pdf_path)
     except OSError:
         pass
+    return images
 
-    print(f"Rendered {len(images)} slides to {output_dir}/")
-    for img in images:
-        print(f"  {os.path.basename(img)}")
+
+def _render_slides(
+    pptx_path: str,
+    output_dir: str,
+    dpi: int,
+    jobs: int,
+    convert: Callable[[str, str], None],
+    slide_spec: str | None = None,
+    use_cache: bool = True,
+) -> list[str]:
+    """Render the requested slides, converting only those missing from the render cache.
+
+    Without *slide_spec* every visible slide is rendered and named by its
+    page number; with it, the listed slides (hidden ones included) are named
+    by their position in the deck. Anything other than the deck's own visible
+    slides is converted as a reduced deck. With *use_cache*, conversions of
+    the whole deck also go through the PDF cache; reduced decks are
+    throwaway and never do.
+    """
+    import tempfile
+    from pathlib import Path
+
+    from slide_forge.cli.cache import user_cache_dir
+    from slide_forge.cli.deck import build_reduced_deck, list_slides, parse_slide_ranges
+    from slide_forge.cli.opc import ZipSource
+    from slide_forge.cli.pdf_cache import PdfCache
+    from slide_forge.cli.render_cache import RenderCache, slide_digests
+
+    convert_deck = PdfCache().wrap(convert) if use_cache else convert
+    slides = list_slides(ZipSource(pptx_path))
+    visible = [slide for slide in slides if not slide.hidden]
+    if slide_spec is None:
+        targets = [(slide, f"slide-{index:02d}.png") for index, slide in enumerate(visible, 1)]
+    else:
+        positions = parse_slide_ranges(slide_spec, len(slides))
+        targets = [(slides[position - 1], f"slide-{position:02d}.png") for position in positions]
+
+    cache = RenderCache(user_cache_dir("render")) if use_cache else None
+    digests = slide_digests(pptx_path, [slide for slide, _ in targets], dpi) if cache else {}
+    rendered: dict[str, Path] = {}
+    for slide, _ in targets:
+        cached = cache.lookup(digests[slide.part_name]) if cache else None
+        if cached is not None:
+            rendered[slide.part_name] = cached
+    missing = [slide for slide, _ in targets if slide.part_name not in rendered]
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+        if missing:
+            if missing == visible:
+                pages = _convert_and_rasterize(pptx_path, temp_dir, dpi, jobs, convert_deck)
+            else:
+                reduced = os.path.join(temp_dir, "reduced.pptx")
+                build_reduced_deck(pptx_path, reduced, {slide.position for slide in missing})
+                print(f"Reduced deck: {len(missing)} of {len(slides)} slides")
+                pages = _convert_and_rasterize(reduced, temp_dir, dpi, jobs, convert)
+            if len(pages) != len(missing):
+                message = f"expected {len(missing)} pages, converter produced {len(pages)}"
+                if slide_spec is not None:
+                    raise RuntimeError(message.capitalize())
+                print(f"Warning: {message}; rendering uncached", file=sys.stderr)
+                return _convert_and_rasterize(pptx_path, output_dir, dpi, jobs, convert_deck)
+
+            for slide, page in zip(missing, pages, strict=True):
+                rendered[slide.part_name] = cache.store(digests[slide.part_name], page) if cache else Path(page)
+
+        images = []
+        for slide, filename in targets:
+            img_path = os.path.join(output_dir, filename)
+            if cache:
+                cache.place(rendered[slide.part_name], img_path)
+            else:
+                os.replace(rendered[slide.part_name], img_path)
+            images.append(img_path)
+
+    if cache:
+        cache.prune()
+        print(cache.summary())
     return images
+
+
+def render_to_bytes(
+    pptx: str | os.PathLike | bytes,
+    dpi: int = 150,
+    image_format: str = "png",
+    slides: str | None = None,
+    daemon: bool = False,
+    workers: int | None = None,
+    quality: int = 90,
+) -> list[bytes]:
+    """Render slides to encoded images in memory, one per page; see :func:`iter_render_bytes`."""
+    return list(iter_render_bytes(pptx, dpi, image_format, slides, daemon, workers, quality))
+
+
+def iter_render_bytes(
+    pptx: str | os.PathLike | bytes,
+    dpi: int = 150,
+    image_format: str = "png",
+    slides: str | None = None,
+    daemon: bool = False,
+    workers: int | None = None,
+    quality: int = 90,
+) -> Iterator[bytes]:
+    """Yield one encoded image per rendered page as soon as it is rasterized.
+
+    Args:
+        pptx: Path to the .pptx file, or its contents
+        dpi: Resolution for rendered images (default: 150)
+        image_format: One of ``IMAGE_FORMATS`` (default: png)
+        slides: Render only these slides, e.g. ``"12-14,20"`` (1-based deck positions)
+        daemon: Convert through the persistent LibreOffice instance, which
+            streams the PDF back without writing it (ignored on Windows)
+        workers: Convert in a free profile from a pool of this many (ignored on Windows)
+        quality: Encoder quality for jpeg and webp
+
+    The PDF is opened from memory and images are never written to disk.
+    Without *daemon* the converter still writes the PDF to a temporary
+    file, which is read back and removed before rasterizing starts.
+
+    Raises:
+        ValueError: *image_format* is not supported (raised by this call, not on first iteration)
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {image_format} (expected one of {', '.join(IMAGE_FORMATS)})")
+    return _iter_render_bytes(pptx, dpi, image_format, slides, daemon, workers, quality)
+
+
+def _iter_render_bytes(
+    pptx: str | os.PathLike | bytes,
+    dpi: int,
+    image_format: str,
+    slides: str | None,
+    daemon: bool,
+    workers: int | None,
+    quality: int,
+) -> Iterator[bytes]:
+    import pymupdf
+
+    pdf = _pdf_bytes(pptx, slides, daemon, workers)
+    with pymupdf.open(stream=pdf, filetype="pdf") as doc:
+        for page in doc:
+            yield _encode_pixmap(page.get_pixmap(dpi=dpi), image_format, quality)
+
+
+def _pdf_bytes(pptx: str | os.PathLike | bytes, slides: str | None, daemon: bool, workers: int | None) -> bytes:
+    import tempfile
+
+    from slide_forge.cli.deck import build_reduced_deck, list_slides, parse_slide_ranges
+    from slide_forge.cli.opc import ZipSource
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if isinstance(pptx, bytes):
+            pptx_path = os.path.join(temp_dir, "input.pptx")
+            with open(pptx_path, "wb") as f:
+                f.write(pptx)
+        else:
+            pptx_path = os.fspath(pptx)
+
+        if slides is not None:
+            positions = parse_slide_ranges(slides, len(list_slides(ZipSource(pptx_path))))
+            reduced_path = os.path.join(temp_dir, "reduced.pptx")
+            build_reduced_deck(pptx_path, reduced_path, set(positions))
+            pptx_path = reduced_path
+
+        if daemon and sys.platform != "win32":
+            from slide_forge.cli.soffice_daemon import SofficeDaemon
+
+            return SofficeDaemon().convert_to_bytes(pptx_path)
+
+        pdf_path = os.path.join(temp_dir, "render.pdf")
+        _pptx_to_pdf(pptx_path, pdf_path, workers=workers)
+        with open(pdf_path, "rb") as f:
+            return f.read()
+
+
+def _encode_pixmap(pix, image_format: str, quality: int) -> bytes:
+    if image_format == "png":
+        return pix.tobytes("png")
+    if image_format == "jpeg":
+        return pix.tobytes("jpeg", jpg_quality=quality)
+
+    # PyMuPDF has no WebP encoder.
+    import io
+
+    from PIL import Image
+
+    image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    buffer = io.BytesIO()
+    image.save(buffer, "WEBP", quality=quality)
+    return buffer.getvalue()
@@ -0,0 +1,165 @@
+"""Content-addressed cache of rendered slide images.
+
+Each slide is keyed by a SHA-256 over everything that can change how it
+looks: the slide part and the closure of parts reachable through its
+relationships (layout, master, theme, media, charts, ...), the
+presentation-wide settings in ``presentation.xml`` (with the slide list
+left out, so reordering other slides does not invalidate it), its position
+(slide-number fields), the resolution and the converter version.
+Relationships to notes, comments and other slides are not followed; they do
+not affect the rendered page. Only the most recently used ``MAX_ENTRIES``
+images are kept.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+from slide_forge.cli.deck import PRESENTATION_PART, PRESENTATIONML_NAMESPACE, SlideEntry
+from slide_forge.cli.opc import parse_relationships, rels_part_name, resolve_target
+from slide_forge.cli.pdf_cache import converter_version
+from slide_forge.cli.xml_format import xml_parser
+
+CACHE_FORMAT_VERSION = "1"
+# Presentation-level parts that style every slide without being in its relationship closure.
+SHARED_PARTS = ("ppt/tableStyles.xml",)
+UNRENDERED_RELATIONSHIP_SUFFIXES = ("/notesSlide", "/slide", "/comments", "/commentAuthors")
+
+
+def slide_digests(pptx_path: str | Path, slides: list[SlideEntry], dpi: int) -> dict[str, str]:
+    """Return the cache key of each slide in *slides*, by part name."""
+    converter = converter_version()
+    part_digests: dict[str, bytes] = {}
+
+    with zipfile.ZipFile(pptx_path, "r") as zf:
+        names = set(zf.namelist())
+
+        def part_digest(name: str) -> bytes:
+            digest = part_digests.get(name)
+            if digest is None:
+                digest = hashlib.sha256(zf.read(name)).digest() if name in names else b""
+                part_digests[name] = digest
+            return digest
+
+        shared = hashlib.sha256(f"{CACHE_FORMAT_VERSION}\0{converter}\0{dpi}".encode())
+        shared.update(_presentation_settings(zf.read(PRESENTATION_PART)))
+        for name in SHARED_PARTS:
+            shared.update(part_digest(name))
+
+        digests = {}
+        for slide in slides:
+            digest = shared.copy()
+            digest.update(f"\0{slide.position}".encode())
+            for name in sorted(_render_closure(zf, names, slide.part_name)):
+                digest.update(f"\0{name}\0".encode())
+                digest.update(part_digest(name))
+            digests[slide.part_name] = digest.hexdigest()
+
+    return digests
+
+
+def _render_closure(zf: zipfile.ZipFile, names: set[str], part_name: str) -> set[str]:
+    """Return *part_name* and every part (and ``.rels``) reachable from it that affects rendering."""
+    closure: set[str] = set()
+    pending = [part_name]
+    while pending:
+        name = pending.pop()
+        if name in closure or name not in names:
+            continue
+        closure.add(name)
+
+        rels_name = rels_part_name(name)
+        if rels_name not in names:
+            continue
+        closure.add(rels_name)
+        for rel in parse_relationships(zf.read(rels_name)):
+            if rel.external or rel.rel_type.endswith(UNRENDERED_RELATIONSHIP_SUFFIXES):
+                continue
+            target = resolve_target(rels_name, rel.target)
+            if target is not None:
+                pending.append(target)
+    return closure
+
+
+def _presentation_settings(content: bytes) -> bytes:
+    root = lxml.etree.fromstring(content, parser=xml_parser())
+    for slide_list in root.findall(f"{{{PRESENTATIONML_NAMESPACE}}}sldIdLst"):
+        root.remove(slide_list)
+    return lxml.etree.tostring(root)
+
+
+class RenderCache:
+    """Rendered PNGs stored under their slide digest, shared by all decks."""
+
+    MAX_ENTRIES = 1000
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, digest: str) -> Path | None:
+        path = self._path(digest)
+        if path.exists():
+            self.hits += 1
+            with contextlib.suppress(OSError):
+                os.utime(path)
+            return path
+        self.misses += 1
+        return None
+
+    def store(self, digest: str, image_path: str | Path) -> Path:
+        """Copy a freshly rendered image into the cache and return the cached path.
+
+        Entries are read-only, since :meth:`place` hard-links them into output
+        directories. If the cache cannot be written, *image_path* is returned.
+        """
+        path = self._path(digest)
+        temp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(suffix=".tmp", dir=path.parent)
+            os.close(fd)
+            temp_path = Path(temp_name)
+            shutil.copyfile(image_path, temp_path)
+            temp_path.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(temp_path, path)
+        except OSError:
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+            return Path(image_path)
+        return path
+
+    def place(self, cached_path: Path, output_path: str | Path) -> None:
+        """Hard-link (or copy, across file systems) a cached image to *output_path*."""
+        output_path = Path(output_path)
+        output_path.unlink(missing_ok=True)
+        try:
+            os.link(cached_path, output_path)
+        except OSError:
+            shutil.copyfile(cached_path, output_path)
+
+    def prune(self) -> None:
+        """Delete all but the ``MAX_ENTRIES`` most recently used images."""
+        entries = []
+        for path in self.directory.glob("*/*.png"):
+            with contextlib.suppress(OSError):
+                entries.append((path.stat().st_mtime, path))
+        entries.sort(reverse=True)
+        for _, path in entries[self.MAX_ENTRIES :]:
+            path.unlink(missing_ok=True)
+
+    def summary(self) -> str:
+        return f"Render cache: {self.hits} slide(s) reused, {self.misses} rendered"
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / digest[:2] / f"{digest}.png"
@@ -1,14 +1,22 @@
 """Helper for running LibreOffice (soffice) in environments where AF_UNIX
 sockets may be blocked (e.g., sandboxed VMs).  Detects the restriction
 at runtime and applies an LD_PRELOAD shim if needed.
+
+LibreOffice serialises on its user profile, so concurrent conversions each
+need their own.  :class:`SofficePool` hands out a fixed set of profile
+directories under the user cache, one per worker, locked while in use and
+kept between runs so each is only initialised once.
 """
 
 from __future__ import annotations
 
+import contextlib
 import os
-import sys
 import subprocess
+import sys
 import tempfile
+import time
+from collections.abc import Iterator
 from pathlib import Path
 
 
@@ -23,9 +31,91 @@ def get_soffice_env() -> dict[str, str]:
     return env
 
 
-def run_soffice(args: list[str], **kwargs) -> subprocess.CompletedProcess:
+def run_soffice(
+    args: list[str], workers: int | None = None, check: bool = False, **kwargs
+) -> subprocess.CompletedProcess:
+    """Run soffice with *args*; with *workers*, in a free profile from a pool of that size."""
     env = get_soffice_env()
-    return subprocess.run(["soffice", *args], env=env, **kwargs)
+    if workers is None:
+        return subprocess.run(["soffice", *args], env=env, check=check, **kwargs)
+
+    with SofficePool(workers).profile() as profile:
+        return subprocess.run(["soffice", _profile_arg(profile), *args], env=env, check=check, **kwargs)
+
+
+class SofficePool:
+    """A pool of *workers* isolated soffice profiles shared by all processes of this user."""
+
+    POLL_INTERVAL = 0.2
+    # Longer than any single conversion should take; past it a profile lock is assumed to be stuck.
+    LOCK_TIMEOUT = 600.0
+
+    def __init__(self, workers: int):
+        from slide_forge.cli.cache import user_cache_dir
+
+        self.workers = max(1, workers)
+        self.directory = user_cache_dir("soffice", "profiles")
+
+    @contextlib.contextmanager
+    def profile(self) -> Iterator[Path]:
+        """Lock a free worker profile for the duration of the block, waiting up to LOCK_TIMEOUT if all are busy."""
+        deadline = time.monotonic() + self.LOCK_TIMEOUT
+        while True:
+            for index in range(self.workers):
+                lock = _try_lock(self.directory / f"worker-{index}.lock")
+                if lock is None:
+                    continue
+                try:
+                    profile = self.directory / f"worker-{index}"
+                    _warm_profile(profile)
+                    yield profile
+                finally:
+                    _unlock(lock)
+                return
+            if time.monotonic() > deadline:
+                raise RuntimeError(
+                    f"All {self.workers} LibreOffice profile(s) in {self.directory} stayed busy "
+                    f"for {self.LOCK_TIMEOUT:g}s; a soffice process holding one may be hung"
+                )
+            time.sleep(self.POLL_INTERVAL)
+
+
+def _profile_arg(profile: Path) -> str:
+    return f"-env:UserInstallation={profile.resolve().as_uri()}"
+
+
+def _warm_profile(profile: Path) -> None:
+    """Create the LibreOffice profile on first use so later conversions skip the first-start cost."""
+    if (profile / "user").is_dir():
+        return
+    subprocess.run(
+        ["soffice", _profile_arg(profile), "--headless", "--terminate_after_init"],
+        env=get_soffice_env(),
+        capture_output=True,
+        check=False,
+    )
+
+
+def _try_lock(path: Path) -> int | None:
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _unlock(fd: int) -> None:
+    # Closing the descriptor releases the lock on every platform.
+    os.close(fd)
 
 
 _SHIM_SO = Path(tempfile.gettempdir()) / "lo_socket_shim.so"
@@ -0,0 +1,323 @@
+"""Long-running LibreOffice instance for repeated PPTX -> PDF conversions.
+
+Starting ``soffice`` costs several seconds per call. :class:`SofficeDaemon`
+keeps one headless instance listening on a UNO pipe and converts documents
+through it. The instance is owned
+by a small supervisor process (``python -m slide_forge.cli.soffice_daemon``)
+that outlives the CLI invocation, restarts soffice if it crashes and shuts
+it down after ``idle_timeout`` seconds without a conversion.
+
+Clients need the LibreOffice Python bridge (``uno``), which ships with
+LibreOffice (``python3-uno`` on Debian/Ubuntu).
+
+The daemon is refused where AF_UNIX sockets are blocked: the only other UNO
+transport is an unauthenticated TCP socket, through which any local user
+could drive soffice (and run commands) as this user.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from slide_forge.cli.cache import user_cache_dir
+from slide_forge.cli.soffice import _needs_shim, _try_lock, _unlock, get_soffice_env
+
+DEFAULT_IDLE_TIMEOUT = 600
+STARTUP_TIMEOUT = 60
+# The supervisor gives soffice 10 seconds to exit before killing it.
+STOP_TIMEOUT = 15
+POLL_INTERVAL = 1.0
+# soffice is restarted at most MAX_RESTARTS times in a row unless it stayed up for STABLE_UPTIME seconds.
+MAX_RESTARTS = 3
+STABLE_UPTIME = 60
+PDF_EXPORT_FILTER = "impress_pdf_Export"
+
+
+class SofficeDaemon:
+    """Client handle for a shared soffice instance, started on first use."""
+
+    def __init__(self, name: str = "default", idle_timeout: int = DEFAULT_IDLE_TIMEOUT):
+        if _needs_shim():
+            raise RuntimeError(
+                "The LibreOffice daemon needs AF_UNIX sockets for its private UNO pipe, and they are blocked here; "
+                "convert without --daemon"
+            )
+        self.name = name
+        self.idle_timeout = idle_timeout
+        self.directory = user_cache_dir("soffice", f"daemon-{name}")
+        self.state_path = self.directory / "daemon.json"
+        self.activity_path = self.directory / "last-used"
+        self.lock_path = self.directory / f"{name}.lock"
+
+    def convert(self, pptx_path: str | Path, pdf_path: str | Path) -> None:
+        """Convert *pptx_path* to *pdf_path*, restarting the instance once if it died."""
+        import uno  # pyright: ignore[reportMissingImports]
+
+        pdf_url = uno.systemPathToFileUrl(str(Path(pdf_path).resolve()))
+        self._export(pptx_path, lambda export: export(pdf_url))
+
+    def convert_to_bytes(self, pptx_path: str | Path) -> bytes:
+        """Convert *pptx_path* and return the PDF, streamed from soffice without a file."""
+        import unohelper  # pyright: ignore[reportMissingImports]
+        from com.sun.star.io import XOutputStream  # pyright: ignore[reportMissingImports]
+
+        class Sink(unohelper.Base, XOutputStream):
+            def __init__(self):
+                self.chunks: list[bytes] = []
+
+            def writeBytes(self, data) -> None:
+                self.chunks.append(data.value)
+
+            def flush(self) -> None:
+                pass
+
+            def closeOutput(self) -> None:
+                pass
+
+        def export_to_sink(export) -> bytes:
+            sink = Sink()
+            export("private:stream", OutputStream=sink)
+            return b"".join(sink.chunks)
+
+        return self._export(pptx_path, export_to_sink)
+
+    def _export[T](self, pptx_path: str | Path, store: Callable[[Callable[..., None]], T]) -> T:
+        """Open *pptx_path* and return ``store(export)``, retrying once on a fresh instance if soffice died."""
+        error: Exception | None = None
+        for attempt in range(2):
+            desktop = self._desktop()
+            self._touch()
+            try:
+                return _with_document(desktop, Path(pptx_path).resolve(), store)
+            except Exception as e:
+                if attempt or self.is_healthy():
+                    raise RuntimeError(f"LibreOffice PDF conversion failed: {e}") from e
+                error = e
+        raise RuntimeError(f"LibreOffice PDF conversion failed: {error}") from error
+
+    def is_healthy(self) -> bool:
+        """Return whether the supervisor is running and soffice answers on its connection."""
+        state = self._read_state()
+        if state is None or not _pid_alive(state["pid"]):
+            return False
+        try:
+            _resolve_desktop(state["connection"])
+        except Exception:  # noqa: BLE001 - UNO reports a dead or missing pipe with its own exception types
+            return False
+        return True
+
+    def start(self) -> None:
+        """Start the supervisor unless a healthy instance is already running."""
+        with self._locked():
+            if self.is_healthy():
+                return
+            self._stop()
+            self._launch()
+
+    def stop(self) -> None:
+        """Stop the supervisor and its soffice instance, if any."""
+        with self._locked():
+            self._stop()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold this daemon's lock so concurrent clients start or stop it one at a time."""
+        deadline = time.monotonic() + STARTUP_TIMEOUT + STOP_TIMEOUT
+        while (lock := _try_lock(self.lock_path)) is None:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Timed out waiting for another process to start or stop {self.directory}")
+            time.sleep(0.1)
+        try:
+            yield
+        finally:
+            _unlock(lock)
+
+    def _launch(self) -> None:
+        connection = _connection_string(self.name)
+        self._touch()
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "slide_forge.cli.soffice_daemon",
+                "--name",
+                self.name,
+                "--connection",
+                connection,
+                "--idle-timeout",
+                str(self.idle_timeout),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.state_path.write_text(json.dumps({"pid": process.pid, "connection": connection}), encoding="utf-8")
+
+    def _stop(self) -> None:
+        """Terminate the supervisor and wait for it, so a new one never shares the pipe with the old."""
+        state = self._read_state()
+        if state is not None and _pid_alive(state["pid"]):
+            with contextlib.suppress(OSError):
+                os.kill(state["pid"], signal.SIGTERM)
+            deadline = time.monotonic() + STOP_TIMEOUT
+            while _pid_alive(state["pid"]):
+                _reap(state["pid"])
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"LibreOffice daemon (pid {state['pid']}) did not stop")
+                time.sleep(0.1)
+        self.state_path.unlink(missing_ok=True)
+
+    def _desktop(self):
+        if not self.is_healthy():
+            self.start()
+
+        state = self._read_state()
+        assert state is not None
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                return _resolve_desktop(state["connection"])
+            except Exception as e:
+                if time.monotonic() > deadline or not _pid_alive(state["pid"]):
+                    raise RuntimeError(f"LibreOffice daemon did not start: {e}") from e
+                time.sleep(0.25)
+
+    def _read_state(self) -> dict | None:
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _touch(self) -> None:
+        self.activity_path.touch()
+
+
+def _connection_string(name: str) -> str:
+    return f"pipe,name=slide-forge-{os.getuid() if hasattr(os, 'getuid') else 0}-{name}"
+
+
+def _resolve_desktop(connection: str):
+    import uno  # pyright: ignore[reportMissingImports]
+
+    local = uno.getComponentContext()
+    resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+    ctx = resolver.resolve(f"uno:{connection};urp;StarOffice.ComponentContext")
+    return ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+
+
+def _with_document[T](desktop, pptx_path: Path, store: Callable[[Callable[..., None]], T]) -> T:
+    """Open *pptx_path* hidden and call *store* with a function exporting it as PDF to a URL."""
+    import uno  # pyright: ignore[reportMissingImports]
+    from com.sun.star.beans import PropertyValue  # pyright: ignore[reportMissingImports]
+
+    def props(**values) -> tuple:
+        return tuple(PropertyValue(Name=k, Value=v) for k, v in values.items())
+
+    doc = desktop.loadComponentFromURL(
+        uno.systemPathToFileUrl(str(pptx_path)), "_blank", 0, props(Hidden=True, ReadOnly=True)
+    )
+    if doc is None:
+        raise RuntimeError(f"Could not open {pptx_path}")
+    try:
+        return store(lambda url, **extra: doc.storeToURL(url, props(FilterName=PDF_EXPORT_FILTER, **extra)))
+    finally:
+        doc.close(True)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _reap(pid: int) -> None:
+    """Collect *pid* if this process started it, so an exited supervisor does not linger as a zombie."""
+    if hasattr(os, "WNOHANG"):
+        with contextlib.suppress(ChildProcessError):
+            os.waitpid(pid, os.WNOHANG)
+
+
+def _start_soffice(connection: str, profile_dir: Path) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            "soffice",
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--norestore",
+            "--nodefault",
+            f"-env:UserInstallation={profile_dir.resolve().as_uri()}",
+            f"--accept={connection};urp;StarOffice.ComponentContext",
+        ],
+        env=get_soffice_env(),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _serve(name: str, connection: str, idle_timeout: int) -> None:
+    """Supervisor loop: keep soffice alive until idle for *idle_timeout* seconds or terminated."""
+    directory = user_cache_dir("soffice", f"daemon-{name}")
+    activity_path = directory / "last-used"
+    stopping = False
+
+    def request_stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    process = _start_soffice(connection, directory / "profile")
+    started = time.monotonic()
+    restarts = 0
+    try:
+        while not stopping:
+            time.sleep(POLL_INTERVAL)
+            try:
+                idle = time.time() - activity_path.stat().st_mtime
+            except OSError:
+                idle = idle_timeout
+            if idle >= idle_timeout:
+                break
+
+            if process.poll() is not None:
+                restarts = 1 if time.monotonic() - started > STABLE_UPTIME else restarts + 1
+                if restarts > MAX_RESTARTS:
+                    break
+                process = _start_soffice(connection, directory / "profile")
+                started = time.monotonic()
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        state_path = directory / "daemon.json"
+        with contextlib.suppress(OSError, ValueError):
+            if json.loads(state_path.read_text(encoding="utf-8"))["pid"] == os.getpid():
+                state_path.unlink()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Supervise a headless soffice instance")
+    parser.add_argument("--name", default="default")
+    parser.add_argument("--connection", required=True)
+    parser.add_argument("--idle-timeout", type=int, default=DEFAULT_IDLE_TIMEOUT)
+    cli_args = parser.parse_args()
+    _serve(cli_args.name, cli_args.connection, cli_args.idle_timeout)
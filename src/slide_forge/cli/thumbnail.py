@@ -1,26 +1,35 @@
 """Create thumbnail grids from PowerPoint presentation slides.
 
 Creates a grid layout of slide thumbnails for quick visual analysis.
-Requires: pip install Pillow defusedxml
-Platform: Linux/WSL (requires LibreOffice and pdftoppm)
+Pages are rasterized in-process with PyMuPDF directly at thumbnail size and
+composed into the grid one at a time, so memory use does not grow with the
+number of slides.
+Requires: pip install Pillow pymupdf
+Platform: Linux/WSL (requires LibreOffice)
 """
 
 from __future__ import annotations
 
 import argparse
-import subprocess
+import contextlib
+import itertools
+import os
+import struct
 import sys
 import tempfile
-import zipfile
+import zlib
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import BinaryIO, Self
 
-import defusedxml.minidom
 from PIL import Image, ImageDraw, ImageFont
 
-from slide_forge.cli.soffice import get_soffice_env
+from slide_forge.cli.deck import SlideEntry, list_slides
+from slide_forge.cli.opc import ZipSource
+from slide_forge.cli.pdf_cache import PdfCache
+from slide_forge.cli.soffice import run_soffice
 
 THUMBNAIL_WIDTH = 300
-CONVERSION_DPI = 100
 MAX_COLS = 6
 DEFAULT_COLS = 3
 JPEG_QUALITY = 95
@@ -45,6 +54,22 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
         default=DEFAULT_COLS,
         help=f"Number of columns (default: {DEFAULT_COLS}, max: {MAX_COLS})",
     )
+    parser.add_argument(
+        "--contact-sheet",
+        metavar="PATH",
+        help="Also write every slide into one .png or .webp image",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Convert in one of N isolated LibreOffice profiles so up to N runs can convert at once",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Convert with LibreOffice even if render, thumbnail or preview already converted this file",
+    )
     parser.set_defaults(func=_run)
 
 
@@ -60,216 +85,299 @@ def _run(args: argparse.Namespace) -> None:
 
     output_path = Path(f"{args.output_prefix}.jpg")
 
+    contact_sheet = Path(args.contact_sheet) if args.contact_sheet else None
+    if contact_sheet and contact_sheet.suffix.lower() not in (".png", ".webp"):
+        print(f"Error: Contact sheet must be a .png or .webp file: {args.contact_sheet}", file=sys.stderr)
+        sys.exit(1)
+
     try:
-        slide_info = _get_slide_info(input_path)
+        slides = list_slides(ZipSource(input_path))
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
-            visible_images = _convert_to_images(input_path, temp_path)
+            pdf_path = _convert_to_pdf(input_path, temp_path, args.workers, args.use_cache)
+            thumbnails = _iter_slides(slides, _iter_thumbnails(pdf_path, THUMBNAIL_WIDTH))
 
-            if not visible_images and not any(s["hidden"] for s in slide_info):
+            grid_files = _create_grids(thumbnails, cols, THUMBNAIL_WIDTH, output_path, contact_sheet)
+
+            if not grid_files:
                 print("Error: No slides found", file=sys.stderr)
                 sys.exit(1)
 
-            slides = _build_slide_list(slide_info, visible_images, temp_path)
-
-            grid_files = _create_grids(slides, cols, THUMBNAIL_WIDTH, output_path)
-
             print(f"Created {len(grid_files)} grid(s):")
             for grid_file in grid_files:
                 print(f"  {grid_file}")
+            if contact_sheet:
+                print(f"Created contact sheet: {contact_sheet}")
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def _get_slide_info(pptx_path: Path) -> list[dict]:
-    with zipfile.ZipFile(pptx_path, "r") as zf:
-        rels_content = zf.read("ppt/_rels/presentation.xml.rels").decode("utf-8")
-        rels_dom = defusedxml.minidom.parseString(rels_content)
-
-        rid_to_slide: dict[str, str] = {}
-        for rel in rels_dom.getElementsByTagName("Relationship"):
-            rid = rel.getAttribute("Id")
-            target = rel.getAttribute("Target")
-            rel_type = rel.getAttribute("Type")
-            if "slide" in rel_type and target.startswith("slides/"):
-                rid_to_slide[rid] = target.replace("slides/", "")
-
-        pres_content = zf.read("ppt/presentation.xml").decode("utf-8")
-        pres_dom = defusedxml.minidom.parseString(pres_content)
-
-        slides = []
-        for sld_id in pres_dom.getElementsByTagName("p:sldId"):
-            rid = sld_id.getAttribute("r:id")
-            if rid in rid_to_slide:
-                hidden = sld_id.getAttribute("show") == "0"
-                slides.append({"name": rid_to_slide[rid], "hidden": hidden})
-
-        return slides
-
-
-def _build_slide_list(
-    slide_info: list[dict],
-    visible_images: list[Path],
-    temp_dir: Path,
-) -> list[tuple[Path, str]]:
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
-            placeholder_size = img.size
-    else:
-        placeholder_size = (1920, 1080)
-
-    slides = []
-    visible_idx = 0
-
-    for info in slide_info:
-        if info["hidden"]:
-            placeholder_path = temp_dir / f"hidden-{info['name']}.jpg"
-            placeholder_img = _create_hidden_placeholder(placeholder_size)
-            placeholder_img.save(placeholder_path, "JPEG")
-            slides.append((placeholder_path, f"{info['name']} (hidden)"))
+def _iter_slides(
+    slides: list[SlideEntry],
+    thumbnails: Iterable[Image.Image],
+) -> Iterator[tuple[Image.Image, str]]:
+    """Pair each slide with its thumbnail, pulling pages only as they are needed.
+
+    LibreOffice does not export hidden slides, so they get a placeholder
+    instead. One placeholder is drawn, sized like the neighbouring pages, and
+    reused for every hidden slide.
+    """
+    thumbnails = iter(thumbnails)
+    upcoming: Image.Image | None = None
+    placeholder: Image.Image | None = None
+
+    for slide in slides:
+        name = Path(slide.part_name).name
+        if slide.hidden:
+            if placeholder is None:
+                if upcoming is None:
+                    upcoming = next(thumbnails, None)
+                size = upcoming.size if upcoming else (THUMBNAIL_WIDTH, THUMBNAIL_WIDTH * 9 // 16)
+                placeholder = _create_hidden_placeholder(size)
+            yield placeholder, f"{name} (hidden)"
         else:
-            if visible_idx < len(visible_images):
-                slides.append((visible_images[visible_idx], info["name"]))
-                visible_idx += 1
-
-    return slides
+            image = upcoming if upcoming is not None else next(thumbnails, None)
+            upcoming = None
+            if image is not None:
+                yield image, name
 
 
 def _create_hidden_placeholder(size: tuple[int, int]) -> Image.Image:
     img = Image.new("RGB", size, color="#F0F0F0")
     draw = ImageDraw.Draw(img)
-    line_width = max(5, min(size) // 100)
+    line_width = max(2, min(size) // 100)
     draw.line([(0, 0), size], fill="#CCCCCC", width=line_width)
     draw.line([(size[0], 0), (0, size[1])], fill="#CCCCCC", width=line_width)
     return img
 
 
-def _convert_to_images(pptx_path: Path, temp_dir: Path) -> list[Path]:
+def _convert_to_pdf(pptx_path: Path, temp_dir: Path, workers: int | None = None, use_cache: bool = True) -> Path:
+    """Convert to ``<temp_dir>/<stem>.pdf`` with LibreOffice, or copy it from the shared PDF cache."""
     pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
 
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-        env=get_soffice_env(),
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
-
-    result = subprocess.run(
-        [
-            "pdftoppm",
-            "-jpeg",
-            "-r",
-            str(CONVERSION_DPI),
-            str(pdf_path),
-            str(temp_dir / "slide"),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError("Image conversion failed")
+    def convert(pptx: str, pdf: str) -> None:
+        result = run_soffice(
+            [
+                "--headless",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                str(temp_dir),
+                pptx,
+            ],
+            workers=workers,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0 or not os.path.exists(pdf):
+            raise RuntimeError("PDF conversion failed")
+
+    cached_convert = PdfCache().wrap(convert) if use_cache else convert
+    cached_convert(str(pptx_path), str(pdf_path))
+    return pdf_path
+
 
-    return sorted(temp_dir.glob("slide-*.jpg"))
+def _iter_thumbnails(pdf_path: Path, width: int) -> Iterator[Image.Image]:
+    """Rasterize each page straight to *width* pixels wide, one page at a time."""
+    import pymupdf
+
+    with pymupdf.open(pdf_path) as doc:
+        for page in doc:
+            scale = width / page.rect.width
+            pix = page.get_pixmap(matrix=pymupdf.Matrix(scale, scale))
+            yield Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
 
 
 def _create_grids(
-    slides: list[tuple[Path, str]],
+    slides: Iterable[tuple[Image.Image, str]],
     cols: int,
     width: int,
     output_path: Path,
+    contact_sheet: Path | None = None,
 ) -> list[str]:
-    max_per_grid = cols * (cols + 1)
+    """Write grids of ``cols * (cols + 1)`` slides, composing each tile as soon as it arrives.
+
+    Only the rows of the grid being filled are held in memory. With
+    *contact_sheet*, every row is also appended to one image of all slides.
+    """
+    slides = iter(slides)
+    first = next(slides, None)
+    if first is None:
+        return []
+
+    layout = _GridLayout(cols, width, first[0].height / first[0].width)
+    rows = layout.rows(itertools.chain([first], slides))
+    rows_per_grid = cols + 1
     grid_files = []
 
-    for chunk_idx, start_idx in enumerate(range(0, len(slides), max_per_grid)):
-        end_idx = min(start_idx + max_per_grid, len(slides))
-        chunk_slides = slides[start_idx:end_idx]
-
-        grid = _create_grid(chunk_slides, cols, width)
+    with _ContactSheet(contact_sheet, layout.grid_width) if contact_sheet else contextlib.nullcontext() as sheet:
+        upcoming = next(rows, None)
+        while upcoming is not None:
+            grid_rows = [upcoming, *itertools.islice(rows, rows_per_grid - 1)]
+            upcoming = next(rows, None)
+            if sheet is not None:
+                for row in grid_rows:
+                    sheet.write(row)
 
-        if len(slides) <= max_per_grid:
-            grid_filename = output_path
-        else:
-            stem = output_path.stem
-            suffix = output_path.suffix
-            grid_filename = output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
+            if upcoming is None and not grid_files:
+                grid_filename = output_path
+            else:
+                grid_filename = output_path.parent / f"{output_path.stem}-{len(grid_files) + 1}{output_path.suffix}"
 
-        grid_filename.parent.mkdir(parents=True, exist_ok=True)
-        grid.save(str(grid_filename), quality=JPEG_QUALITY)
-        grid_files.append(str(grid_filename))
+            grid_filename.parent.mkdir(parents=True, exist_ok=True)
+            _stack_rows(grid_rows, layout.grid_width).save(str(grid_filename), quality=JPEG_QUALITY)
+            grid_files.append(str(grid_filename))
 
     return grid_files
 
 
-def _create_grid(
-    slides: list[tuple[Path, str]],
-    cols: int,
-    width: int,
-) -> Image.Image:
-    font_size = int(width * FONT_SIZE_RATIO)
-    label_padding = int(font_size * LABEL_PADDING_RATIO)
-
-    with Image.open(slides[0][0]) as img:
-        aspect = img.height / img.width
-    height = int(width * aspect)
-
-    rows = (len(slides) + cols - 1) // cols
-    grid_w = cols * width + (cols + 1) * GRID_PADDING
-    grid_h = rows * (height + font_size + label_padding * 2) + (rows + 1) * GRID_PADDING
-
-    grid = Image.new("RGB", (grid_w, grid_h), "white")
-    draw = ImageDraw.Draw(grid)
-
-    try:
-        font = ImageFont.load_default(size=font_size)
-    except Exception:
-        font = ImageFont.load_default()
-
-    for i, (img_path, slide_name) in enumerate(slides):
-        row, col = i // cols, i % cols
+class _GridLayout:
+    """Tile geometry of a grid, shared by every grid and the contact sheet of one deck."""
+
+    def __init__(self, cols: int, width: int, aspect: float):
+        self.cols = cols
+        self.width = width
+        self.height = round(width * aspect)
+        self.font_size = int(width * FONT_SIZE_RATIO)
+        self.label_padding = int(self.font_size * LABEL_PADDING_RATIO)
+        self.grid_width = cols * width + (cols + 1) * GRID_PADDING
+        # Each row carries the padding below it (tile borders reach into it); the top padding is added when stacking.
+        self.row_height = self.font_size + self.label_padding * 2 + self.height + GRID_PADDING
+
+        try:
+            self.font = ImageFont.load_default(size=self.font_size)
+        except Exception:
+            self.font = ImageFont.load_default()
+
+    def rows(self, slides: Iterable[tuple[Image.Image, str]]) -> Iterator[Image.Image]:
+        """Yield one row image per *cols* slides, pasting each slide into it as it arrives."""
+        row: Image.Image | None = None
+        for i, (img, slide_name) in enumerate(slides):
+            col = i % self.cols
+            if row is None or col == 0:
+                if row is not None:
+                    yield row
+                row = Image.new("RGB", (self.grid_width, self.row_height), "white")
+            self._paste(row, col, img, slide_name)
+        if row is not None:
+            yield row
+
+    def _paste(self, row: Image.Image, col: int, img: Image.Image, label: str) -> None:
+        width, height = self.width, self.height
+        draw = ImageDraw.Draw(row)
         x = col * width + (col + 1) * GRID_PADDING
-        y_base = row * (height + font_size + label_padding * 2) + (row + 1) * GRID_PADDING
-
-        label = slide_name
-        bbox = draw.textbbox((0, 0), label, font=font)
+        bbox = draw.textbbox((0, 0), label, font=self.font)
         text_w = bbox[2] - bbox[0]
         draw.text(
-            (x + (width - text_w) // 2, y_base + label_padding),
+            (x + (width - text_w) // 2, self.label_padding),
             label,
             fill="black",
-            font=font,
+            font=self.font,
         )
 
-        y_thumbnail = y_base + label_padding + font_size + label_padding
+        y_thumbnail = self.label_padding + self.font_size + self.label_padding
 
-        with Image.open(img_path) as img:
+        if img.width > width or img.height > height:
+            img = img.copy()
             img.thumbnail((width, height), Image.Resampling.LANCZOS)
-            w, h = img.size
-            tx = x + (width - w) // 2
-            ty = y_thumbnail + (height - h) // 2
-            grid.paste(img, (tx, ty))
-
-            if BORDER_WIDTH > 0:
-                draw.rectangle(
-                    [
-                        (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
-                        (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
-                    ],
-                    outline="gray",
-                    width=BORDER_WIDTH,
-                )
-
+        w, h = img.size
+        tx = x + (width - w) // 2
+        ty = y_thumbnail + (height - h) // 2
+        row.paste(img, (tx, ty))
+
+        if BORDER_WIDTH > 0:
+            draw.rectangle(
+                [
+                    (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
+                    (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
+                ],
+                outline="gray",
+                width=BORDER_WIDTH,
+            )
+
+
+def _stack_rows(rows: list[Image.Image], grid_width: int) -> Image.Image:
+    grid = Image.new("RGB", (grid_width, sum(row.height for row in rows) + GRID_PADDING), "white")
+    y = GRID_PADDING
+    for row in rows:
+        grid.paste(row, (0, y))
+        y += row.height
     return grid
+
+
+class _ContactSheet:
+    """Every grid row stacked into a single PNG or WebP image.
+
+    PNG is streamed to disk row by row, so memory stays at one row however
+    many slides the deck has. libwebp only encodes whole images, so a WebP
+    sheet is assembled in memory and limited to WebP's maximum height.
+    """
+
+    WEBP_MAX_HEIGHT = 16383
+
+    def __init__(self, path: Path, width: int):
+        self.path = path
+        self.width = width
+        self.height = 0
+        self.format = path.suffix.lower()
+        if self.format not in (".png", ".webp"):
+            raise ValueError(f"Contact sheet must be .png or .webp: {path}")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._rows: list[Image.Image] = []
+        self._file: BinaryIO | None = None
+        if self.format == ".png":
+            self._file = open(path, "wb")  # noqa: SIM115 - closed by __exit__
+            self._compressor = zlib.compressobj()
+            self._file.write(b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", self._png_header()))
+            self.write(Image.new("RGB", (width, GRID_PADDING), "white"))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self._finish()
+        elif self._file is not None:
+            self._file.close()
+            self.path.unlink(missing_ok=True)
+
+    def write(self, row: Image.Image) -> None:
+        self.height += row.height
+        if self._file is None:
+            if self.height + GRID_PADDING > self.WEBP_MAX_HEIGHT:
+                raise ValueError(
+                    f"Contact sheet is taller than the {self.WEBP_MAX_HEIGHT}px WebP limit; use a .png contact sheet"
+                )
+            self._rows.append(row)
+            return
+
+        stride = self.width * 3
+        pixels = row.tobytes()
+        # Filter type 0 (None) before every scanline.
+        scanlines = b"".join(b"\0" + pixels[i : i + stride] for i in range(0, len(pixels), stride))
+        data = self._compressor.compress(scanlines)
+        if data:
+            self._file.write(_png_chunk(b"IDAT", data))
+
+    def _finish(self) -> None:
+        if self._file is None:
+            _stack_rows(self._rows, self.width).save(str(self.path), quality=JPEG_QUALITY)
+            return
+
+        self._file.write(_png_chunk(b"IDAT", self._compressor.flush()) + _png_chunk(b"IEND", b""))
+        # The height is only known now; rewrite the header chunk in place (same length).
+        self._file.seek(8)
+        self._file.write(_png_chunk(b"IHDR", self._png_header()))
+        self._file.close()
+
+    def _png_header(self) -> bytes:
+        # 8-bit RGB, deflate, no interlacing.
+        return struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
@@ -6,11 +6,14 @@ Extracts the ZIP archive and pretty-prints XML files.
 from __future__ import annotations
 
 import argparse
+import math
 import sys
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import defusedxml.minidom
+from slide_forge.cli.opc import CONTENT_TYPES_PART, parse_relationships, rels_part_name, resolve_target
+from slide_forge.cli.xml_format import pretty_xml
 
 SMART_QUOTE_REPLACEMENTS = {
     "\u201c": "&#x201C;",
@@ -19,16 +22,50 @@ SMART_QUOTE_REPLACEMENTS = {
     "\u2019": "&#x2019;",
 }
 
+# Parts shared across slides are not pulled into a partial unpack; pack --base keeps the originals.
+SHARED_RELATIONSHIP_TYPES = (
+    "/slide",
+    "/slideLayout",
+    "/slideMaster",
+    "/notesMaster",
+    "/handoutMaster",
+    "/theme",
+    "/presentation",
+)
+
 
 def configure_parser(subparsers: argparse._SubParsersAction) -> None:
     parser = subparsers.add_parser("unpack", help="Unpack a PPTX file for editing")
     parser.add_argument("input_file", help="PPTX file to unpack")
     parser.add_argument("output_directory", help="Output directory")
+    parser.add_argument(
+        "--only",
+        type=lambda x: [name.strip() for name in x.split(",") if name.strip()],
+        metavar="PARTS",
+        help=(
+            "Comma-separated parts to extract (e.g. slides/slide3.xml,slides/slide4.xml) with their rels and "
+            "slide-owned dependencies; pack the result with --base"
+        ),
+    )
+    parser.add_argument(
+        "--no-pretty",
+        dest="pretty",
+        action="store_false",
+        help="Write XML parts as stored instead of pretty-printing them (faster for large decks)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Format XML parts in N worker processes (default: 1)",
+    )
     parser.set_defaults(func=_run)
 
 
 def _run(args: argparse.Namespace) -> None:
-    _, message = unpack(args.input_file, args.output_directory)
+    _, message = unpack(args.input_file, args.output_directory, only=args.only, pretty=args.pretty, jobs=args.jobs)
     print(message)
 
     if "Error" in message:
@@ -38,6 +75,9 @@ def _run(args: argparse.Namespace) -> None:
 def unpack(
     input_file: str,
     output_directory: str,
+    only: list[str] | None = None,
+    pretty: bool = True,
+    jobs: int = 1,
 ) -> tuple[None, str]:
     input_path = Path(input_file)
     output_path = Path(output_directory)
@@ -49,19 +89,32 @@ def unpack(
         return None, f"Error: {input_file} must be a .pptx file"
 
     try:
-        output_path.mkdir(parents=True, exist_ok=True)
-
         with zipfile.ZipFile(input_path, "r") as zf:
-            zf.extractall(output_path)
-
-        xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-        for xml_file in xml_files:
-            _pretty_print_xml(xml_file)
-
-        for xml_file in xml_files:
-            _escape_smart_quotes(xml_file)
-
-        return None, f"Unpacked {input_file} ({len(xml_files)} XML files)"
+            infos = zf.infolist()
+            total = len(infos)
+            selected = None
+            if only:
+                selected = _dependency_closure(zf, only)
+                if isinstance(selected, str):
+                    return None, selected
+                infos = [info for info in infos if info.filename in selected]
+
+            output_path.mkdir(parents=True, exist_ok=True)
+            xml_names = []
+            for info in infos:
+                if not info.is_dir() and _is_xml_member(info.filename):
+                    xml_names.append(info.filename)
+                else:
+                    zf.extract(info, output_path)
+
+        _unpack_xml_members(input_path, output_path, xml_names, pretty, jobs)
+
+        if selected is not None:
+            return None, (
+                f"Unpacked {len(infos)} of {total} parts from {input_file} ({len(xml_names)} XML files); "
+                f"pack with --base {input_file}"
+            )
+        return None, f"Unpacked {input_file} ({len(xml_names)} XML files)"
 
     except zipfile.BadZipFile:
         return None, f"Error: {input_file} is not a valid PPTX file"
@@ -69,20 +122,90 @@ def unpack(
         return None, f"Error unpacking: {e}"
 
 
-def _pretty_print_xml(xml_file: Path) -> None:
-    try:
-        content = xml_file.read_text(encoding="utf-8")
-        dom = defusedxml.minidom.parseString(content)
-        xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="utf-8"))
-    except Exception:
-        pass
+def _dependency_closure(zf: zipfile.ZipFile, parts: list[str]) -> set[str] | str:
+    """Return *parts* with their rels and the parts those reference, or an error message.
+
+    Names may omit the ``ppt/`` prefix. Shared parts (layouts, masters,
+    themes, other slides) are not followed.
+    """
+    available = {info.filename for info in zf.infolist() if not info.is_dir()}
+    pending = []
+    for part in parts:
+        name = part.lstrip("/")
+        if name not in available and f"ppt/{name}" in available:
+            name = f"ppt/{name}"
+        if name not in available:
+            return f"Error: {part} not found in {zf.filename}"
+        pending.append(name)
+
+    selected = {CONTENT_TYPES_PART}
+    while pending:
+        name = pending.pop()
+        if name in selected:
+            continue
+        selected.add(name)
+
+        rels_name = rels_part_name(name)
+        if rels_name not in available:
+            continue
+        selected.add(rels_name)
+
+        for rel in parse_relationships(zf.read(rels_name)):
+            if rel.external or rel.rel_type.endswith(SHARED_RELATIONSHIP_TYPES):
+                continue
+            target = resolve_target(rels_name, rel.target)
+            if target in available:
+                pending.append(target)
+
+    return selected & available
+
+
+def _is_xml_member(name: str) -> bool:
+    return name.endswith((".xml", ".rels"))
+
+
+def _unpack_xml_members(input_path: Path, output_path: Path, names: list[str], pretty: bool, jobs: int) -> None:
+    """Read, format and write each XML member once, in *jobs* processes when > 1."""
+    if jobs <= 1 or len(names) < 2:
+        _write_xml_members(input_path, output_path, names, pretty)
+        return
+
+    chunk_size = math.ceil(len(names) / (jobs * 4))
+    chunks = [names[i : i + chunk_size] for i in range(0, len(names), chunk_size)]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as executor:
+        futures = [executor.submit(_write_xml_members, input_path, output_path, chunk, pretty) for chunk in chunks]
+        for future in futures:
+            future.result()
+
+
+def _write_xml_members(input_path: Path, output_path: Path, names: list[str], pretty: bool) -> None:
+    with zipfile.ZipFile(input_path, "r") as zf:
+        for name in names:
+            target = _member_path(output_path, name)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(_format_xml(zf.read(name), pretty))
+
+
+def _member_path(output_path: Path, name: str) -> Path:
+    """Map a member name below *output_path*, dropping ``..`` and absolute parts like ``extract`` does."""
+    parts = [part for part in name.replace("\\", "/").split("/") if part not in ("", ".", "..")]
+    return output_path.joinpath(*parts)
+
+
+def _format_xml(content: bytes, pretty: bool) -> bytes:
+    if pretty:
+        try:
+            content = pretty_xml(content)
+        except Exception:
+            pass
+    return _escape_smart_quotes(content)
 
 
-def _escape_smart_quotes(xml_file: Path) -> None:
+def _escape_smart_quotes(content: bytes) -> bytes:
     try:
-        content = xml_file.read_text(encoding="utf-8")
-        for char, entity in SMART_QUOTE_REPLACEMENTS.items():
-            content = content.replace(char, entity)
-        xml_file.write_text(content, encoding="utf-8")
-    except Exception:
-        pass
+        text = content.decode("utf-8")
+    except UnicodeDecodeError:
+        return content
+    for char, entity in SMART_QUOTE_REPLACEMENTS.items():
+        text = text.replace(char, entity)
+    return text.encode("utf-8")
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import argparse
 import sys
-import tempfile
 import zipfile
 from pathlib import Path
 
-from slide_forge.cli.validators import PPTXSchemaValidator
+from slide_forge.cli.validators import SCHEMA_CACHE, PPTXSchemaValidator
 
 
 def configure_parser(subparsers: argparse._SubParsersAction) -> None:
@@ -21,6 +20,20 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
         help="Path to original .pptx file. If omitted, all XSD errors are reported.",
     )
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Do not read or write the cached per-part results and baseline errors of --original",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate XSD schemas in N worker processes (default: 1)",
+    )
     parser.add_argument(
         "--auto-repair",
         action="store_true",
@@ -46,18 +59,22 @@ def _run(args: argparse.Namespace) -> None:
             sys.exit(1)
 
     if path.is_file() and path.suffix.lower() == ".pptx":
-        temp_dir = tempfile.mkdtemp()
-        with zipfile.ZipFile(path, "r") as zf:
-            zf.extractall(temp_dir)
-        unpacked_dir = Path(temp_dir)
-    else:
-        if not path.is_dir():
-            print(f"Error: {path} is not a directory or .pptx file", file=sys.stderr)
+        if not zipfile.is_zipfile(path):
+            print(f"Error: {path} is not a valid PPTX file", file=sys.stderr)
             sys.exit(1)
-        unpacked_dir = path
+    elif not path.is_dir():
+        print(f"Error: {path} is not a directory or .pptx file", file=sys.stderr)
+        sys.exit(1)
 
+    # Packed files are validated straight from the zip; nothing is extracted to disk
     validators = [
-        PPTXSchemaValidator(unpacked_dir, original_file, verbose=args.verbose),
+        PPTXSchemaValidator(
+            path,
+            original_file,
+            verbose=args.verbose,
+            use_cache=args.use_cache,
+            jobs=args.jobs,
+        ),
     ]
 
     if args.auto_repair:
@@ -67,6 +84,8 @@ def _run(args: argparse.Namespace) -> None:
 
     success = all(v.validate() for v in validators)
 
+    print(SCHEMA_CACHE.summary())
+
     if success:
         print("All validations PASSED!")
 
@@ -2,8 +2,11 @@
 
 from .base import BaseSchemaValidator
 from .pptx import PPTXSchemaValidator
+from .schema_cache import SCHEMA_CACHE, SchemaCache
 
 __all__ = [
+    "SCHEMA_CACHE",
     "BaseSchemaValidator",
     "PPTXSchemaValidator",
+    "SchemaCache",
 ]
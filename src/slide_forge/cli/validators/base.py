@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
+import copy
+import io
+import json
 import re
-from pathlib import Path
-from typing import cast
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePath, PurePosixPath
+from typing import Any, cast
 
 import defusedxml.minidom
 import lxml.etree
 
+from slide_forge import __version__
+from slide_forge.cli.cache import file_sha256, sidecar_cache_dir, user_cache_dir
+from slide_forge.cli.opc import (
+    CONTENT_TYPES_PART,
+    DirectorySource,
+    ZipSource,
+    open_source,
+    rels_part_name,
+    resolve_target,
+)
+
+from .package import ParsedPackage
+from .schema_cache import SCHEMA_CACHE
+from .validation_cache import ValidationCache
+
 
 class BaseSchemaValidator:
     IGNORED_VALIDATION_ERRORS = [
@@ -79,19 +100,57 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir: str | Path, original_file: str | Path | None = None, verbose: bool = False):
+    def __init__(
+        self,
+        unpacked_dir: str | Path,
+        original_file: str | Path | None = None,
+        verbose: bool = False,
+        use_cache: bool = True,
+        jobs: int = 1,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file) if original_file else None
         self.verbose = verbose
+        self.use_cache = use_cache
+        self.jobs = jobs
+        self._original_errors: dict[str, set[str]] | None = None
+        self._xsd_results: dict[str, tuple[bool | None, set[str] | None]] = {}
 
         self.schemas_dir = Path(__file__).parent.parent / "schemas"
 
-        patterns = ["*.xml", "*.rels"]
-        self.xml_files = [f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)]
+        # unpacked_dir may also be a packed .pptx, which is read in memory without extracting
+        self.package = ParsedPackage(open_source(self.unpacked_dir))
+        self.xml_parts = self.package.xml_parts
+        self.cache = ValidationCache(self._validation_cache_path(), f"{type(self).__name__}-{__version__}")
 
-        if not self.xml_files:
+        if not self.xml_parts:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+    def _validation_cache_path(self) -> Path | None:
+        """Incremental results live next to an unpacked directory; packed files are not cached."""
+        source = self.package.source
+        if not self.use_cache or not isinstance(source, DirectorySource):
+            return None
+        return sidecar_cache_dir(source.root) / "validate.json"
+
+    def _cache_key(self, name: str, *dependencies: str, extra: str = "") -> str:
+        digests = [
+            self.package.digest(part) if part in self.package.file_set else "-" for part in (name, *dependencies)
+        ]
+        return "|".join([*digests, extra])
+
+    def _cached(self, check: str, name: str, compute: Callable[[str], Any], *dependencies: str, extra: str = "") -> Any:
+        """Return ``compute(name)``, reusing the stored result while the part and its dependencies are unchanged."""
+        key = self._cache_key(name, *dependencies, extra=extra)
+        value = self.cache.get(check, name, key)
+        if value is None:
+            value = compute(name)
+            self.cache.put(check, name, key, value)
+        return value
+
+    def save_cache(self) -> None:
+        self.cache.save(self.package.file_set)
+
     def validate(self) -> bool:
         raise NotImplementedError("Subclasses must implement the validate method")
 
@@ -101,9 +160,13 @@ class BaseSchemaValidator:
     def repair_whitespace_preservation(self) -> int:
         repairs = 0
 
-        for xml_file in self.xml_files:
+        for name in self.xml_parts:
+            key = self._cache_key(name)
+            if self.cache.get("repair", name, key) is not None:
+                continue
+
             try:
-                content = xml_file.read_text(encoding="utf-8")
+                content = self.package.read(name).decode("utf-8")
                 dom = defusedxml.minidom.parseString(content)
                 modified = False
 
@@ -115,29 +178,28 @@ class BaseSchemaValidator:
                                 elem.setAttribute("xml:space", "preserve")
                                 text_preview = repr(text[:30]) + "..." if len(text) > 30 else repr(text)
                                 print(
-                                    f"  Repaired: {xml_file.name}: Added xml:space='preserve' to {elem.tagName}: {text_preview}"
+                                    f"  Repaired: {PurePosixPath(name).name}: "
+                                    f"Added xml:space='preserve' to {elem.tagName}: {text_preview}"
                                 )
                                 repairs += 1
                                 modified = True
 
                 if modified:
-                    xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
+                    self.package.write(name, dom.toxml(encoding="UTF-8"))
+                else:
+                    self.cache.put("repair", name, key, 0)
 
             except Exception:
                 pass
 
+        self.save_cache()
         return repairs
 
     def validate_xml(self) -> bool:
         errors = []
 
-        for xml_file in self.xml_files:
-            try:
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(f"  {xml_file.relative_to(self.unpacked_dir)}: Line {e.lineno}: {e.msg}")
-            except Exception as e:
-                errors.append(f"  {xml_file.relative_to(self.unpacked_dir)}: Unexpected error: {str(e)}")
+        for name in self.xml_parts:
+            errors.extend(self._cached("xml", name, self._xml_errors))
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
@@ -149,22 +211,20 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _xml_errors(self, name: str) -> list[str]:
+        try:
+            self.package.tree(name)
+        except lxml.etree.XMLSyntaxError as e:
+            return [f"  {name}: Line {e.lineno}: {e.msg}"]
+        except Exception as e:
+            return [f"  {name}: Unexpected error: {str(e)}"]
+        return []
+
     def validate_namespaces(self) -> bool:
         errors = []
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}
-
-                for attr_val in [v for k, v in root.attrib.items() if str(k).endswith("Ignorable")]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+        for name in self.xml_parts:
+            errors.extend(self._cached("namespaces", name, self._namespace_errors))
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
@@ -175,76 +235,38 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    def _namespace_errors(self, name: str) -> list[str]:
+        errors: list[str] = []
+        try:
+            root = self.package.tree(name).getroot()
+            declared = set(root.nsmap.keys()) - {None}
+
+            for attr_val in [v for k, v in root.attrib.items() if str(k).endswith("Ignorable")]:
+                undeclared = set(attr_val.split()) - declared
+                errors.extend(f"  {name}: Namespace '{ns}' in Ignorable but not declared" for ns in undeclared)
+        except lxml.etree.XMLSyntaxError:
+            pass
+        return errors
+
     def validate_unique_ids(self) -> bool:
         errors = []
         global_ids: dict[str, tuple] = {}
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids: dict[tuple, dict] = {}
-
-                mc_elements = cast(
-                    list[lxml.etree._Element],
-                    root.xpath(".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}),
-                )
-                for elem in mc_elements:
-                    parent = elem.getparent()
-                    if parent is not None:
-                        parent.remove(elem)
-
-                for elem in root.iter():
-                    tag = elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
-
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        in_excluded_container = any(
-                            ancestor.tag.split("}")[-1].lower() in self.EXCLUDED_ID_CONTAINERS
-                            for ancestor in elem.iterancestors()
+        for name in self.xml_parts:
+            for entry in self._cached("unique_ids", name, self._unique_id_entries):
+                if entry[0] == "global":
+                    _, id_value, sourceline, tag = entry
+                    if id_value in global_ids:
+                        prev_file, prev_line, prev_tag = global_ids[id_value]
+                        errors.append(
+                            f"  {name}: "
+                            f"Line {sourceline}: Global ID '{id_value}' in <{tag}> "
+                            f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
                         )
-                        if in_excluded_container:
-                            continue
-
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = str(attr).split("}")[-1].lower() if "}" in str(attr) else str(attr).lower()
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[str(id_value)] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}")
+                    else:
+                        global_ids[id_value] = (name, sourceline, tag)
+                else:
+                    errors.append(entry[1])
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -256,74 +278,114 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _unique_id_entries(self, name: str) -> list[list]:
+        """Per-part ID facts in document order.
+
+        File-scoped duplicates are reported directly as ``["error", message]``;
+        global IDs become ``["global", id, line, tag]`` and are resolved across parts.
+        """
+        entries: list[list] = []
+        try:
+            # Work on a copy: AlternateContent is stripped and the tree is shared with other checks
+            root = copy.deepcopy(self.package.tree(name).getroot())
+            file_ids: dict[tuple, dict] = {}
+
+            mc_elements = cast(
+                list[lxml.etree._Element],
+                root.xpath(".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}),
+            )
+            for elem in mc_elements:
+                parent = elem.getparent()
+                if parent is not None:
+                    parent.remove(elem)
+
+            for elem in root.iter():
+                tag = elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
+
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    in_excluded_container = any(
+                        ancestor.tag.split("}")[-1].lower() in self.EXCLUDED_ID_CONTAINERS
+                        for ancestor in elem.iterancestors()
+                    )
+                    if in_excluded_container:
+                        continue
+
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        attr_local = str(attr).split("}")[-1].lower() if "}" in str(attr) else str(attr).lower()
+                        if attr_local == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            entries.append(["global", str(id_value), elem.sourceline, tag])
+                        elif scope == "file":
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                entries.append(
+                                    [
+                                        "error",
+                                        (
+                                            f"  {name}: "
+                                            f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                            f"(first occurrence at line {prev_line})"
+                                        ),
+                                    ]
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            entries.append(["error", f"  {name}: Error: {e}"])
+
+        return entries
+
     def validate_file_references(self) -> bool:
         errors = []
 
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_files = [name for name in self.xml_parts if name.endswith(".rels")]
 
         if not rels_files:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if file_path.is_file() and file_path.name != "[Content_Types].xml" and not file_path.name.endswith(".rels"):
-                all_files.append(file_path.resolve())
+        all_files = [
+            name
+            for name in self.package.files
+            if PurePosixPath(name).name != CONTENT_TYPES_PART and not name.endswith(".rels")
+        ]
 
-        all_referenced_files: set[Path] = set()
+        all_referenced_files: set[str] = set()
 
         if self.verbose:
             print(f"Found {len(rels_files)} .rels files and {len(all_files)} target files")
 
         for rels_file in rels_files:
-            try:
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                rels_dir = rels_file.parent
-
-                referenced_files: set[Path] = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(("http", "mailto:")):
-                        if target.startswith("/"):
-                            target_path = self.unpacked_dir / target.lstrip("/")
-                        elif rels_file.name == ".rels":
-                            target_path = self.unpacked_dir / target
-                        else:
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}")
+            # Targets are cached per .rels content; whether they exist is checked against the current part list
+            for entry in self._cached("file_references", rels_file, self._relationship_targets):
+                if entry[0] == "error":
+                    errors.append(entry[1])
+                    continue
 
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+                _, target, target_part, line_num = entry
+                if target_part is not None and target_part in self.package.file_set:
+                    all_referenced_files.add(target_part)
+                else:
+                    errors.append(f"  {rels_file}: Line {line_num}: Broken reference to {target}")
 
         unreferenced_files = set(all_files) - all_referenced_files
 
         if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+            for unref_file in sorted(unreferenced_files, key=PurePosixPath):
+                errors.append(f"  Unreferenced file: {unref_file}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
@@ -340,68 +402,29 @@ class BaseSchemaValidator:
                 print("PASSED - All references are valid and all files are properly referenced")
             return True
 
+    def _relationship_targets(self, rels_file: str) -> list[list]:
+        try:
+            return [
+                ["target", rel.target, resolve_target(rels_file, rel.target), rel.sourceline]
+                for rel in self.package.relationships(rels_file)
+                if rel.target and not rel.target.startswith(("http", "mailto:"))
+            ]
+        except Exception as e:
+            return [["error", f"  Error parsing {rels_file}: {e}"]]
+
     def validate_all_relationship_ids(self) -> bool:
         errors = []
 
-        for xml_file in self.xml_files:
-            if xml_file.suffix == ".rels":
+        for xml_file in self.xml_parts:
+            if xml_file.endswith(".rels"):
                 continue
 
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
+            rels_file = rels_part_name(xml_file)
 
-            if not rels_file.exists():
+            if rels_file not in self.package.file_set:
                 continue
 
-            try:
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type: dict[str, str] = {}
-
-                for rel in rels_root.findall(f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        type_name = rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        rid_to_type[rid] = type_name
-
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                r_ns = self.OFFICE_RELATIONSHIPS_NAMESPACE
-                rid_attrs_to_check = ["id", "embed", "link"]
-                for elem in xml_root.iter():
-                    for attr_name in rid_attrs_to_check:
-                        rid_attr = elem.get(f"{{{r_ns}}}{attr_name}")
-                        if not rid_attr:
-                            continue
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> r:{attr_name} references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        elif attr_name == "id" and self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(elem_name)
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+            errors.extend(self._cached("relationship_ids", xml_file, self._relationship_id_errors, rels_file))
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
@@ -414,6 +437,58 @@ class BaseSchemaValidator:
                 print("PASSED - All relationship ID references are valid")
             return True
 
+    def _relationship_id_errors(self, xml_file: str) -> list[str]:
+        errors = []
+        rels_file = rels_part_name(xml_file)
+
+        try:
+            rid_to_type: dict[str, str] = {}
+
+            for rel in self.package.relationships(rels_file):
+                rid = rel.rid
+                rel_type = rel.rel_type
+                if rid:
+                    if rid in rid_to_type:
+                        errors.append(
+                            f"  {rels_file}: Line {rel.sourceline}: "
+                            f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                        )
+                    type_name = rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                    rid_to_type[rid] = type_name
+
+            xml_root = self.package.tree(xml_file).getroot()
+
+            r_ns = self.OFFICE_RELATIONSHIPS_NAMESPACE
+            rid_attrs_to_check = ["id", "embed", "link"]
+            for elem in xml_root.iter():
+                for attr_name in rid_attrs_to_check:
+                    rid_attr = elem.get(f"{{{r_ns}}}{attr_name}")
+                    if not rid_attr:
+                        continue
+                    elem_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+
+                    if rid_attr not in rid_to_type:
+                        errors.append(
+                            f"  {xml_file}: Line {elem.sourceline}: "
+                            f"<{elem_name}> r:{attr_name} references non-existent relationship '{rid_attr}' "
+                            f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                        )
+                    elif attr_name == "id" and self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(elem_name)
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            if expected_type not in actual_type.lower():
+                                errors.append(
+                                    f"  {xml_file}: Line {elem.sourceline}: "
+                                    f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                    f"but should point to a '{expected_type}' relationship"
+                                )
+
+        except Exception as e:
+            errors.append(f"  Error processing {xml_file}: {e}")
+
+        return errors
+
     def _get_expected_relationship_type(self, element_name: str) -> str | None:
         elem_lower = element_name.lower()
 
@@ -440,25 +515,14 @@ class BaseSchemaValidator:
     def validate_content_types(self) -> bool:
         errors = []
 
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        if CONTENT_TYPES_PART not in self.package.file_set:
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts: set[str] = set()
-            declared_extensions: set[str] = set()
-
-            for override in root.findall(f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            for default in root.findall(f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            overrides, defaults = self.package.content_types()
+            declared_parts = set(overrides)
+            declared_extensions = set(defaults)
 
             declarable_roots = {
                 "sld",
@@ -482,28 +546,19 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            all_files = [f for f in self.unpacked_dir.rglob("*") if f.is_file()]
-
-            for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace("\\", "/")
-
+            for path_str in self.xml_parts:
                 if any(skip in path_str for skip in [".rels", "[Content_Types]", "docProps/", "_rels/"]):
                     continue
 
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
-
-                    if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml")
+                root_name = self._cached("root_tag", path_str, self._root_tag_name)
+                if root_name in declarable_roots and path_str not in declared_parts:
+                    errors.append(f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml")
 
-                except Exception:
-                    continue
-
-            for file_path in all_files:
+            for relative_path in self.package.files:
+                file_path = PurePosixPath(relative_path)
                 if file_path.suffix.lower() in {".xml", ".rels"}:
                     continue
-                if file_path.name == "[Content_Types].xml":
+                if file_path.name == CONTENT_TYPES_PART:
                     continue
                 if "_rels" in file_path.parts or "docProps" in file_path.parts:
                     continue
@@ -511,7 +566,6 @@ class BaseSchemaValidator:
                 extension = file_path.suffix.lstrip(".").lower()
                 if extension and extension not in declared_extensions:
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
                             f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
                         )
@@ -529,18 +583,26 @@ class BaseSchemaValidator:
                 print("PASSED - All content files are properly declared in [Content_Types].xml")
             return True
 
+    def _root_tag_name(self, name: str) -> str:
+        try:
+            root_tag = self.package.tree(name).getroot().tag
+        except Exception:
+            return ""
+        return root_tag.split("}")[-1] if "}" in root_tag else root_tag
+
     def validate_file_against_xsd(self, xml_file: str | Path, verbose: bool = False) -> tuple[bool | None, set[str]]:
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
+        name = self.package.source.part_name(xml_file)
+        return self._validate_part_against_xsd(name, verbose=verbose)
 
-        is_valid, current_errors = self._validate_single_file_xsd(xml_file, unpacked_dir)
+    def _validate_part_against_xsd(self, name: str, verbose: bool = False) -> tuple[bool | None, set[str]]:
+        is_valid, current_errors = self._cached_part_xsd(name)
 
         if is_valid is None:
             return None, set()
         elif is_valid:
             return True, set()
 
-        original_errors = self._get_original_file_errors(xml_file)
+        original_errors = self._get_original_file_errors(name)
 
         assert current_errors is not None
         new_errors = current_errors - original_errors
@@ -549,9 +611,8 @@ class BaseSchemaValidator:
 
         if new_errors:
             if verbose:
-                relative_path = xml_file.relative_to(unpacked_dir)
-                print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                print(f"FAILED - {name}: {len(new_errors)} new error(s)")
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -566,9 +627,11 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
-            relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(xml_file, verbose=False)
+        if self.jobs > 1:
+            self._validate_parts_xsd_parallel()
+
+        for relative_path in self.xml_parts:
+            is_valid, new_file_errors = self._validate_part_against_xsd(relative_path, verbose=False)
 
             if is_valid is None:
                 skipped_count += 1
@@ -582,11 +645,11 @@ class BaseSchemaValidator:
                 continue
 
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:
+            for error in sorted(new_file_errors)[:3]:
                 new_errors.append(f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}")
 
         if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
+            print(f"Validated {len(self.xml_parts)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
             if original_error_count:
@@ -605,7 +668,7 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
-    def _get_schema_path(self, xml_file: Path) -> Path | None:
+    def _get_schema_path(self, xml_file: PurePath) -> Path | None:
         if xml_file.name in self.SCHEMA_MAPPINGS:
             return self.schemas_dir / self.SCHEMA_MAPPINGS[xml_file.name]
 
@@ -624,8 +687,7 @@ class BaseSchemaValidator:
         return None
 
     def _clean_ignorable_namespaces(self, xml_doc: lxml.etree._ElementTree) -> lxml.etree._ElementTree:
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        xml_copy = copy.deepcopy(xml_doc.getroot())
 
         for elem in xml_copy.iter():
             attrs_to_remove = []
@@ -670,64 +732,149 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(
-        self, xml_file: Path, base_path: Path
-    ) -> tuple[bool | None, set[str] | None]:
-        schema_path = self._get_schema_path(xml_file)
-        if not schema_path:
+    def _validate_parts_xsd_parallel(self) -> None:
+        """Validate all schema-backed parts in worker processes.
+
+        Parts are split into contiguous chunks and results are collected in
+        submission order, so the merged output matches the serial path.
+        """
+        names = [
+            name
+            for name in self.xml_parts
+            if self._get_schema_path(PurePosixPath(name)) and not self.cache.contains("xsd", name, self._xsd_key(name))
+        ]
+        if len(names) < 2:
+            return
+
+        chunk_size = max(1, -(-len(names) // (self.jobs * 4)))
+        chunks = [names[i : i + chunk_size] for i in range(0, len(names), chunk_size)]
+
+        # Repairs of a packed file only exist in memory, so workers need them passed along
+        written = self.package.written if isinstance(self.package.source, ZipSource) else {}
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.jobs, len(chunks)),
+            initializer=_init_xsd_worker,
+            initargs=(type(self), self.unpacked_dir, written),
+        ) as executor:
+            for results, stats in executor.map(_validate_xsd_chunk, chunks):
+                self._xsd_results.update(results)
+                SCHEMA_CACHE.merge_stats(stats)
+
+    def _xsd_key(self, name: str) -> str:
+        schema_path = self._get_schema_path(PurePosixPath(name))
+        assert schema_path is not None
+        return self._cache_key(name, extra=schema_path.relative_to(self.schemas_dir).as_posix())
+
+    def _cached_part_xsd(self, name: str) -> tuple[bool | None, set[str] | None]:
+        if not self._get_schema_path(PurePosixPath(name)):
+            return None, None
+
+        key = self._xsd_key(name)
+        entry = self.cache.get("xsd", name, key)
+        if entry is None:
+            is_valid, errors = self._validate_part_xsd(name)
+            entry = [is_valid, sorted(errors or ())]
+            self.cache.put("xsd", name, key, entry)
+
+        is_valid, errors = entry
+        return is_valid, set(errors)
+
+    def _validate_part_xsd(self, name: str) -> tuple[bool | None, set[str] | None]:
+        if name in self._xsd_results:
+            return self._xsd_results.pop(name)
+
+        relative_path = PurePosixPath(name)
+        if not self._get_schema_path(relative_path):
             return None, None
 
         try:
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=str(schema_path))
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            xml_doc = self.package.tree(name)
+        except Exception as e:
+            return False, {str(e)}
+
+        return self._validate_xsd_document(xml_doc, relative_path)
 
-            with open(xml_file) as f:
-                xml_doc = lxml.etree.parse(f)
+    def _validate_xsd_bytes(self, content: bytes, relative_path: PurePath) -> tuple[bool | None, set[str] | None]:
+        if not self._get_schema_path(relative_path):
+            return None, None
 
+        try:
+            xml_doc = lxml.etree.parse(io.BytesIO(content))
+        except Exception as e:
+            return False, {str(e)}
+
+        return self._validate_xsd_document(xml_doc, relative_path)
+
+    def _validate_xsd_document(
+        self, xml_doc: lxml.etree._ElementTree, relative_path: PurePath
+    ) -> tuple[bool | None, set[str] | None]:
+        schema_path = self._get_schema_path(relative_path)
+        if not schema_path:
+            return None, None
+
+        try:
+            # Template tag removal works on a copy, so the shared tree is never mutated
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
-            relative_path = xml_file.relative_to(base_path)
             if relative_path.parts and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS:
                 xml_doc = self._clean_ignorable_namespaces(xml_doc)
 
-            if schema.validate(xml_doc):
-                return True, set()
-            else:
-                errors = set()
-                for error in cast(list[lxml.etree._LogEntry], schema.error_log):
-                    errors.add(error.message)
-                return False, errors
+            return SCHEMA_CACHE.validate(schema_path, xml_doc)
 
         except Exception as e:
             return False, {str(e)}
 
-    def _get_original_file_errors(self, xml_file: str | Path) -> set[str]:
+    def _get_original_file_errors(self, name: str) -> set[str]:
         if self.original_file is None:
             return set()
 
-        import tempfile
-        import zipfile
+        if self._original_errors is None:
+            self._original_errors = self._load_original_error_index()
 
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
+        return self._original_errors.get(name, set())
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+    def _load_original_error_index(self) -> dict[str, set[str]]:
+        assert self.original_file is not None
 
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        cache_file = None
+        if self.use_cache:
+            key = f"{file_sha256(self.original_file)}-{type(self).__name__}-{__version__}"
+            cache_file = user_cache_dir("baseline") / f"{key}.json"
+            try:
+                cached = json.loads(cache_file.read_text(encoding="utf-8"))
+                return {part: set(errors) for part, errors in cached.items()}
+            except (OSError, ValueError):
+                pass
 
-            original_xml_file = temp_path / relative_path
+        index = self._build_original_error_index()
 
-            if not original_xml_file.exists():
-                return set()
+        if cache_file is not None:
+            try:
+                cache_file.write_text(
+                    json.dumps({part: sorted(errors) for part, errors in index.items()}),
+                    encoding="utf-8",
+                )
+            except OSError:
+                pass
 
-            is_valid, errors = self._validate_single_file_xsd(original_xml_file, temp_path)
-            return errors if errors else set()
+        return index
+
+    def _build_original_error_index(self) -> dict[str, set[str]]:
+        """Validate every part of the original package once, keyed by part name."""
+        assert self.original_file is not None
+
+        index: dict[str, set[str]] = {}
+        with zipfile.ZipFile(self.original_file, "r") as zf:
+            for name in zf.namelist():
+                if not name.endswith((".xml", ".rels")):
+                    continue
+                _, errors = self._validate_xsd_bytes(zf.read(name), PurePosixPath(name))
+                if errors:
+                    index[name] = errors
+
+        return index
 
     def _remove_template_tags_from_text_nodes(
         self, xml_doc: lxml.etree._ElementTree
@@ -735,8 +882,7 @@ class BaseSchemaValidator:
         warnings: list[str] = []
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
 
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        xml_copy = copy.deepcopy(xml_doc.getroot())
 
         def process_text_content(text: str | None, content_type: str) -> str | None:
             if not text:
@@ -759,3 +905,26 @@ class BaseSchemaValidator:
             elem.tail = process_text_content(elem.tail, "tail content")
 
         return lxml.etree.ElementTree(xml_copy), warnings
+
+
+_worker_validator: BaseSchemaValidator | None = None
+
+
+def _init_xsd_worker(validator_cls: type[BaseSchemaValidator], unpacked_dir: Path, written: dict[str, bytes]) -> None:
+    global _worker_validator
+    _worker_validator = validator_cls(unpacked_dir, use_cache=False)
+    for name, content in written.items():
+        _worker_validator.package.write(name, content)
+
+
+def _validate_xsd_chunk(
+    names: list[str],
+) -> tuple[dict[str, tuple[bool | None, set[str] | None]], tuple[int, float, int, float]]:
+    assert _worker_validator is not None
+
+    before = SCHEMA_CACHE.stats()
+    results = {name: _worker_validator._validate_part_xsd(name) for name in names}
+    after = SCHEMA_CACHE.stats()
+
+    compiled_count, compile_seconds, validated_count, validate_seconds = (a - b for a, b in zip(after, before))
+    return results, (int(compiled_count), compile_seconds, int(validated_count), validate_seconds)
@@ -0,0 +1,145 @@
+"""Parsed view of a package shared by all validation checks.
+
+The package source (unpacked directory or packed file) is listed once and
+every XML part is parsed at most once, no matter how many checks look at it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import posixpath
+from collections import Counter
+from typing import NamedTuple
+
+import lxml.etree
+
+from slide_forge.cli.opc import (
+    CONTENT_TYPES_NAMESPACE,
+    CONTENT_TYPES_PART,
+    PACKAGE_RELATIONSHIPS_NAMESPACE,
+    DirectorySource,
+    ZipSource,
+)
+
+
+class Relationship(NamedTuple):
+    rid: str | None
+    rel_type: str
+    target: str
+    target_mode: str | None
+    sourceline: int | None
+
+
+class ParsedPackage:
+    def __init__(self, source: DirectorySource | ZipSource):
+        self.source = source
+
+        self.files = source.names()
+        self.file_set = set(self.files)
+        self.xml_parts = [name for name in self.files if name.endswith(".xml")] + [
+            name for name in self.files if name.endswith(".rels")
+        ]
+
+        self.written: dict[str, bytes] = {}
+        self.parse_counts: Counter[str] = Counter()
+        self._trees: dict[str, lxml.etree._ElementTree] = {}
+        self._parse_errors: dict[str, Exception] = {}
+        self._relationships: dict[str, list[Relationship]] = {}
+        self._digests: dict[str, str] = {}
+        self._content_types: tuple[dict[str, str], dict[str, str]] | None = None
+
+    def read(self, name: str) -> bytes:
+        return self.source.read(name)
+
+    def write(self, name: str, content: bytes) -> None:
+        self.source.write(name, content)
+        self.written[name] = content
+        self.discard(name)
+
+    def discard(self, name: str) -> None:
+        """Forget parsed state for *name* after it was modified."""
+        self._trees.pop(name, None)
+        self._parse_errors.pop(name, None)
+        self._relationships.pop(name, None)
+        self._digests.pop(name, None)
+        if name == CONTENT_TYPES_PART:
+            self._content_types = None
+
+    def digest(self, name: str) -> str:
+        """Return the SHA-256 of the part's current content."""
+        digest = self._digests.get(name)
+        if digest is None:
+            digest = self._digests[name] = hashlib.sha256(self.read(name)).hexdigest()
+        return digest
+
+    def tree(self, name: str) -> lxml.etree._ElementTree:
+        """Return the parsed tree of *name*; parse failures are cached and re-raised."""
+        tree = self._trees.get(name)
+        if tree is not None:
+            return tree
+        if name in self._parse_errors:
+            raise self._parse_errors[name]
+
+        self.parse_counts[name] += 1
+        try:
+            tree = lxml.etree.parse(io.BytesIO(self.read(name)))
+        except Exception as e:
+            self._parse_errors[name] = e
+            raise
+        self._trees[name] = tree
+        return tree
+
+    def parts_in(self, directory: str, suffix: str) -> list[str]:
+        """Return parts directly inside *directory* whose names end with *suffix*."""
+        return [name for name in self.files if posixpath.dirname(name) == directory and name.endswith(suffix)]
+
+    def relationships(self, rels_name: str) -> list[Relationship]:
+        rels = self._relationships.get(rels_name)
+        if rels is None:
+            rels_root = self.tree(rels_name).getroot()
+            rels = [
+                Relationship(
+                    rel.get("Id"),
+                    rel.get("Type", ""),
+                    rel.get("Target", ""),
+                    rel.get("TargetMode"),
+                    rel.sourceline,
+                )
+                for rel in rels_root.findall(f".//{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship")
+            ]
+            self._relationships[rels_name] = rels
+        return rels
+
+    def content_types(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Return ``(overrides, defaults)`` from ``[Content_Types].xml``.
+
+        Overrides map part names (without leading slash) to content types,
+        defaults map lower-cased extensions to content types.
+        """
+        if self._content_types is None:
+            root = self.tree(CONTENT_TYPES_PART).getroot()
+            overrides: dict[str, str] = {}
+            defaults: dict[str, str] = {}
+
+            for override in root.findall(f".//{{{CONTENT_TYPES_NAMESPACE}}}Override"):
+                part_name = override.get("PartName")
+                if part_name is not None:
+                    overrides[part_name.lstrip("/")] = override.get("ContentType", "")
+
+            for default in root.findall(f".//{{{CONTENT_TYPES_NAMESPACE}}}Default"):
+                extension = default.get("Extension")
+                if extension is not None:
+                    defaults[extension.lower()] = default.get("ContentType", "")
+
+            self._content_types = overrides, defaults
+        return self._content_types
+
+    def parse_report(self) -> list[str]:
+        total = sum(self.parse_counts.values())
+        most = max(self.parse_counts.values(), default=0)
+        lines = [f"Parsed {len(self.parse_counts)} part(s) with {total} parse(s) (max {most} per part)"]
+        for name, count in sorted(self.parse_counts.items()):
+            if count > 1:
+                lines.append(f"  {name}: parsed {count} times")
+        return lines
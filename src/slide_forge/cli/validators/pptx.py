@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 import re
+from pathlib import PurePosixPath
 
 import lxml.etree
 
+from slide_forge.cli.opc import rels_part_name
+
 from .base import BaseSchemaValidator
 
 
@@ -24,6 +26,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate(self) -> bool:
         if not self.validate_xml():
+            self._finish_validation()
             return False
 
         all_valid = True
@@ -57,31 +60,26 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         if not self.validate_no_duplicate_slide_layouts():
             all_valid = False
 
+        self._finish_validation()
+
         return all_valid
 
+    def _finish_validation(self) -> None:
+        self.save_cache()
+        if self.verbose:
+            for line in self.package.parse_report():
+                print(line)
+            print(self.cache.summary())
+
+    UUID_PATTERN = re.compile(
+        r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+    )
+
     def validate_uuid_ids(self) -> bool:
         errors = []
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
-        )
-
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                for elem in root.iter():
-                    for attr, value in elem.attrib.items():
-                        attr_name = str(attr).split("}")[-1].lower()
-                        if attr_name == "id" or attr_name.endswith("id"):
-                            if self._looks_like_uuid(str(value)):
-                                if not uuid_pattern.match(str(value)):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
-                                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}")
+
+        for xml_file in self.xml_parts:
+            errors.extend(self._cached("uuid_ids", xml_file, self._uuid_id_errors))
 
         if errors:
             print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
@@ -93,6 +91,27 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All UUID-like IDs contain valid hex values")
             return True
 
+    def _uuid_id_errors(self, xml_file: str) -> list[str]:
+        errors = []
+        try:
+            root = self.package.tree(xml_file).getroot()
+
+            for elem in root.iter():
+                for attr, value in elem.attrib.items():
+                    attr_name = str(attr).split("}")[-1].lower()
+                    if attr_name == "id" or attr_name.endswith("id"):
+                        if self._looks_like_uuid(str(value)):
+                            if not self.UUID_PATTERN.match(str(value)):
+                                errors.append(
+                                    f"  {xml_file}: "
+                                    f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
+                                )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(f"  {xml_file}: Error: {e}")
+
+        return errors
+
     def _looks_like_uuid(self, value: str) -> bool:
         clean_value = value.strip("{}()").replace("-", "")
         return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
@@ -100,7 +119,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
     def validate_slide_layout_ids(self) -> bool:
         errors = []
 
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        slide_masters = self.package.parts_in("ppt/slideMasters", ".xml")
 
         if not slide_masters:
             if self.verbose:
@@ -108,39 +127,11 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             return True
 
         for slide_master in slide_masters:
-            try:
-                root = lxml.etree.parse(str(slide_master)).getroot()
-
-                rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
-
-                if not rels_file.exists():
-                    errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
-                    )
-                    continue
-
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                valid_layout_rids: set[str | None] = set()
-                for rel in rels_root.findall(f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
-
-                for sld_layout_id in root.findall(f".//{{{self.PRESENTATIONML_NAMESPACE}}}sldLayoutId"):
-                    r_id = sld_layout_id.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    layout_id = sld_layout_id.get("id")
-
-                    if r_id and r_id not in valid_layout_rids:
-                        errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}")
+            errors.extend(
+                self._cached(
+                    "slide_layout_ids", slide_master, self._slide_layout_id_errors, rels_part_name(slide_master)
+                )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
@@ -153,27 +144,43 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slide layout IDs reference valid slide layouts")
             return True
 
-    def validate_no_duplicate_slide_layouts(self) -> bool:
+    def _slide_layout_id_errors(self, slide_master: str) -> list[str]:
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        try:
+            root = self.package.tree(slide_master).getroot()
 
-        for rels_file in slide_rels_files:
-            try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+            rels_file = rels_part_name(slide_master)
+
+            if rels_file not in self.package.file_set:
+                return [f"  {slide_master}: Missing relationships file: {rels_file}"]
 
-                layout_rels = [
-                    rel
-                    for rel in root.findall(f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship")
-                    if "slideLayout" in rel.get("Type", "")
-                ]
+            valid_layout_rids: set[str | None] = set()
+            for rel in self.package.relationships(rels_file):
+                if "slideLayout" in rel.rel_type:
+                    valid_layout_rids.add(rel.rid)
 
-                if len(layout_rels) > 1:
+            for sld_layout_id in root.findall(f".//{{{self.PRESENTATIONML_NAMESPACE}}}sldLayoutId"):
+                r_id = sld_layout_id.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
+                layout_id = sld_layout_id.get("id")
+
+                if r_id and r_id not in valid_layout_rids:
                     errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                        f"  {slide_master}: "
+                        f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
+                        f"references r:id='{r_id}' which is not found in slide layout relationships"
                     )
 
-            except Exception as e:
-                errors.append(f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}")
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(f"  {slide_master}: Error: {e}")
+
+        return errors
+
+    def validate_no_duplicate_slide_layouts(self) -> bool:
+        errors = []
+        slide_rels_files = self.package.parts_in("ppt/slides/_rels", ".xml.rels")
+
+        for rels_file in slide_rels_files:
+            errors.extend(self._cached("duplicate_slide_layouts", rels_file, self._duplicate_slide_layout_errors))
 
         if errors:
             print("FAILED - Found slides with duplicate slideLayout references:")
@@ -185,11 +192,21 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slides have exactly one slideLayout reference")
             return True
 
+    def _duplicate_slide_layout_errors(self, rels_file: str) -> list[str]:
+        try:
+            layout_rels = [rel for rel in self.package.relationships(rels_file) if "slideLayout" in rel.rel_type]
+        except Exception as e:
+            return [f"  {rels_file}: Error: {e}"]
+
+        if len(layout_rels) > 1:
+            return [f"  {rels_file}: has {len(layout_rels)} slideLayout references"]
+        return []
+
     def validate_notes_slide_references(self) -> bool:
         errors = []
-        notes_slide_references: dict[str, list[tuple[str, Path]]] = {}
+        notes_slide_references: dict[str, list[tuple[str, str]]] = {}
 
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = self.package.parts_in("ppt/slides/_rels", ".xml.rels")
 
         if not slide_rels_files:
             if self.verbose:
@@ -197,31 +214,24 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             return True
 
         for rels_file in slide_rels_files:
-            try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+            slide_name = PurePosixPath(rels_file).stem.replace(".xml", "")
 
-                for rel in root.findall(f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"):
-                    rel_type = rel.get("Type", "")
-                    if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
-                        if target:
-                            normalized_target = target.replace("../", "")
-
-                            slide_name = rels_file.stem.replace(".xml", "")
-
-                            if normalized_target not in notes_slide_references:
-                                notes_slide_references[normalized_target] = []
-                            notes_slide_references[normalized_target].append((slide_name, rels_file))
+            for entry in self._cached("notes_slide_references", rels_file, self._notes_slide_targets):
+                if entry[0] == "error":
+                    errors.append(entry[1])
+                    continue
 
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}")
+                normalized_target = entry[1]
+                if normalized_target not in notes_slide_references:
+                    notes_slide_references[normalized_target] = []
+                notes_slide_references[normalized_target].append((slide_name, rels_file))
 
         for target, references in notes_slide_references.items():
             if len(references) > 1:
                 slide_names = [ref[0] for ref in references]
                 errors.append(f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}")
                 for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
+                    errors.append(f"    - {rels_file}")
 
         if errors:
             print(
@@ -235,3 +245,13 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             if self.verbose:
                 print("PASSED - All notes slide references are unique")
             return True
+
+    def _notes_slide_targets(self, rels_file: str) -> list[list[str]]:
+        try:
+            return [
+                ["target", rel.target.replace("../", "")]
+                for rel in self.package.relationships(rels_file)
+                if "notesSlide" in rel.rel_type and rel.target
+            ]
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            return [["error", f"  {rels_file}: Error: {e}"]]
@@ -0,0 +1,76 @@
+"""Process-wide registry of compiled XSD schemas.
+
+Compiling ``pml.xsd`` pulls in the whole DrawingML import graph and dominates
+validation time, so each schema is compiled at most once per process and the
+time spent compiling vs. validating is tracked for reporting.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import cast
+
+import lxml.etree
+
+
+class SchemaCache:
+    def __init__(self) -> None:
+        self._schemas: dict[Path, lxml.etree.XMLSchema] = {}
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self.compiled_count = 0
+        self.compile_seconds = 0.0
+        self.validate_seconds = 0.0
+        self.validated_count = 0
+
+    def get(self, schema_path: str | Path) -> lxml.etree.XMLSchema:
+        schema_path = Path(schema_path).resolve()
+        schema = self._schemas.get(schema_path)
+        if schema is None:
+            start = time.perf_counter()
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=str(schema_path))
+                schema = lxml.etree.XMLSchema(xsd_doc)
+            self.compile_seconds += time.perf_counter() - start
+            self.compiled_count += 1
+            self._schemas[schema_path] = schema
+        return schema
+
+    def validate(self, schema_path: str | Path, xml_doc: lxml.etree._ElementTree) -> tuple[bool, set[str]]:
+        schema = self.get(schema_path)
+
+        start = time.perf_counter()
+        is_valid = schema.validate(xml_doc)
+        errors = {error.message for error in cast(list[lxml.etree._LogEntry], schema.error_log)}
+        self.validate_seconds += time.perf_counter() - start
+        self.validated_count += 1
+
+        return is_valid, set() if is_valid else errors
+
+    def clear(self) -> None:
+        """Drop the compiled schemas and the timing collected for them."""
+        self._schemas.clear()
+        self._reset_stats()
+
+    def stats(self) -> tuple[int, float, int, float]:
+        return self.compiled_count, self.compile_seconds, self.validated_count, self.validate_seconds
+
+    def merge_stats(self, stats: tuple[int, float, int, float]) -> None:
+        """Add timing collected by another process (e.g. a validation worker)."""
+        compiled_count, compile_seconds, validated_count, validate_seconds = stats
+        self.compiled_count += compiled_count
+        self.compile_seconds += compile_seconds
+        self.validated_count += validated_count
+        self.validate_seconds += validate_seconds
+
+    def summary(self) -> str:
+        return (
+            f"XSD timing: compiled {self.compiled_count} schema(s) in {self.compile_seconds:.2f}s, "
+            f"validated {self.validated_count} part(s) in {self.validate_seconds:.2f}s"
+        )
+
+
+SCHEMA_CACHE = SchemaCache()
@@ -0,0 +1,68 @@
+"""Persistent per-part validation results for incremental runs.
+
+Results are stored per check and part name together with a key built from
+the content hashes of the part and the parts it depends on, so an edited
+slide (or its rels) is re-checked while unchanged parts reuse their verdict.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+class ValidationCache:
+    def __init__(self, path: Path | None, version: str):
+        self.path = path
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, list]] = {}
+        self._dirty = False
+
+        if path is not None:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data.get("version") == version:
+                    self._entries = data["checks"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+    def get(self, check: str, name: str, key: str) -> Any | None:
+        entry = self._entries.get(check, {}).get(name)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def contains(self, check: str, name: str, key: str) -> bool:
+        entry = self._entries.get(check, {}).get(name)
+        return entry is not None and entry[0] == key
+
+    def put(self, check: str, name: str, key: str, value: Any) -> None:
+        self._entries.setdefault(check, {})[name] = [key, value]
+        self._dirty = True
+
+    def save(self, names: set[str]) -> None:
+        """Write the cache, dropping entries for parts that no longer exist."""
+        if self.path is None or not self._dirty:
+            return
+
+        checks = {
+            check: {name: entry for name, entry in entries.items() if name in names}
+            for check, entries in self._entries.items()
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps({"version": self.version, "checks": checks}), encoding="utf-8")
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except OSError:
+            pass
+
+    def summary(self) -> str:
+        return f"Validation cache: {self.hits} hit(s), {self.misses} miss(es)"
@@ -0,0 +1,128 @@
+"""lxml-based XML formatting shared by pack and unpack.
+
+Output is byte-for-byte what the previous ``xml.dom.minidom`` based code
+produced (double-quoted declaration without ``standalone``, ``&quot;`` in
+text, raw newlines and tabs in attribute values), so switching engines does
+not churn packed parts.
+"""
+
+from __future__ import annotations
+
+import re
+
+import lxml.etree
+
+XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8"?>'
+# minidom.toprettyxml(encoding="utf-8") spells the encoding in lower case.
+PRETTY_XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>'
+
+# Tags, comments, PIs and CDATA are matched whole so that text patterns only
+# ever see character data. Raw ``>`` never occurs inside a serialized tag.
+_MINIDOM_ESCAPE_PATTERN = re.compile(
+    rb"(<!--.*?-->|<\?.*?\?>|<!\[CDATA\[.*?\]\]>)"
+    rb"|(<[^>]*&#[^>]*>)"
+    rb'|(?<=>)([^<]*?(?:"|&#13;)[^<]*)',
+    re.DOTALL,
+)
+
+
+def xml_parser() -> lxml.etree.XMLParser:
+    """Return a parser that never loads DTDs, expands entities or hits the network."""
+    return lxml.etree.XMLParser(
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        huge_tree=False,
+        strip_cdata=False,
+    )
+
+
+def condense_xml(content: bytes) -> bytes:
+    """Drop whitespace-only text and comments, except inside ``:t`` text elements."""
+    root = lxml.etree.fromstring(content, parser=xml_parser())
+    text_has_quote = False
+
+    for element in root.iter(lxml.etree.Element):
+        if element.tag.endswith("}t") and element.prefix:
+            text_has_quote = text_has_quote or '"' in (element.text or "")
+            for child in element:
+                text_has_quote = text_has_quote or '"' in (child.tail or "")
+            continue
+
+        if element.text:
+            if element.text.strip():
+                text_has_quote = text_has_quote or '"' in element.text
+            else:
+                element.text = None
+
+        comments = []
+        for child in element:
+            if child.tail:
+                if child.tail.strip():
+                    text_has_quote = text_has_quote or '"' in child.tail
+                else:
+                    child.tail = None
+            if child.tag is lxml.etree.Comment:
+                comments.append(child)
+
+        for comment in comments:
+            _remove_keeping_tail(comment)
+
+    return serialize_xml(root, minidom_escapes=text_has_quote)
+
+
+def pretty_xml(content: bytes) -> bytes:
+    """Indent *content* two spaces per level, one node per line like ``minidom.toprettyxml``.
+
+    Text content (including mixed content) is left untouched apart from the
+    same escaping as :func:`serialize_xml`.
+    """
+    root = lxml.etree.fromstring(content, parser=xml_parser())
+    lxml.etree.indent(root, space="  ")
+
+    before, after = _top_level_siblings(root)
+    body = _MINIDOM_ESCAPE_PATTERN.sub(
+        _minidom_escape, lxml.etree.tostring(root, encoding="UTF-8", xml_declaration=False)
+    )
+    return b"\n".join([PRETTY_XML_DECLARATION, *before, body, *after, b""])
+
+
+def serialize_xml(root: lxml.etree._Element, minidom_escapes: bool = True) -> bytes:
+    """Serialize *root* and its top-level siblings the way ``minidom.toxml`` does.
+
+    *minidom_escapes* may be set to ``False`` when the caller knows no text
+    contains ``"``; attribute character references are still checked.
+    """
+    body = lxml.etree.tostring(root, encoding="UTF-8", xml_declaration=False)
+    if minidom_escapes or b"&#" in body:
+        body = _MINIDOM_ESCAPE_PATTERN.sub(_minidom_escape, body)
+
+    before, after = _top_level_siblings(root)
+    return b"".join([XML_DECLARATION, *before, body, *after])
+
+
+def _top_level_siblings(root: lxml.etree._Element) -> tuple[list[bytes], list[bytes]]:
+    """Serialize the comments and PIs before and after the root element."""
+    before = [lxml.etree.tostring(node, with_tail=False) for node in reversed(list(root.itersiblings(preceding=True)))]
+    after = [lxml.etree.tostring(node, with_tail=False) for node in root.itersiblings()]
+    return before, after
+
+
+def _minidom_escape(match: re.Match[bytes]) -> bytes:
+    markup, tag, text = match.groups()
+    if tag is not None:
+        return tag.replace(b"&#10;", b"\n").replace(b"&#13;", b"\r").replace(b"&#9;", b"\t")
+    if text is not None:
+        return text.replace(b'"', b"&quot;").replace(b"&#13;", b"\r")
+    return markup
+
+
+def _remove_keeping_tail(node: lxml.etree._Element) -> None:
+    parent = node.getparent()
+    if node.tail:
+        previous = node.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + node.tail
+        else:
+            parent.text = (parent.text or "") + node.tail
+    parent.remove(node)
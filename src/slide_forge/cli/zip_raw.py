@@ -0,0 +1,81 @@
+"""Copy zip members between archives without recompressing them.
+
+:mod:`zipfile` has no public API for writing data that is already
+compressed, so :func:`write_raw` appends the local header and payload itself
+and registers the member the same way ``ZipFile.write`` does.
+"""
+
+from __future__ import annotations
+
+import struct
+import zipfile
+from typing import Any, cast
+
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_LOCAL_HEADER_SIZE = 30
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+
+
+def read_raw(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    """Return the compressed payload of *info* exactly as stored in *zf*."""
+    if info.flag_bits & _FLAG_ENCRYPTED:
+        raise ValueError(f"{info.filename} is encrypted")
+
+    fp = zf.fp
+    if fp is None:
+        raise ValueError("Attempt to read ZIP archive that was already closed")
+
+    fp.seek(info.header_offset)
+    header = fp.read(_LOCAL_HEADER_SIZE)
+    if len(header) != _LOCAL_HEADER_SIZE or header[:4] != _LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    fp.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length)
+    raw = fp.read(info.compress_size)
+    if len(raw) != info.compress_size:
+        raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+    return raw
+
+
+def write_raw(zf: zipfile.ZipFile, info: zipfile.ZipInfo, raw: bytes) -> zipfile.ZipInfo:
+    """Append a member whose payload *raw* was compressed as described by *info*.
+
+    *info* supplies the name, timestamp, attributes, compression method, CRC
+    and uncompressed size of the new member.
+    """
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.CRC = info.CRC
+    zinfo.file_size = info.file_size
+    zinfo.compress_size = len(raw)
+    zinfo.external_attr = info.external_attr
+    zinfo.create_system = info.create_system
+    zinfo.flag_bits = info.flag_bits & ~(_FLAG_DATA_DESCRIPTOR | _FLAG_ENCRYPTED)
+
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+
+    # The locking and bookkeeping below is what ZipFile.write does; those attributes are private and untyped.
+    state = cast(Any, zf)
+    with state._lock:
+        if state._writing:
+            raise ValueError("Can't write to ZIP archive while an open writing handle exists")
+        state._writecheck(zinfo)
+        state._didModify = True
+
+        assert zf.fp is not None
+        zinfo.header_offset = zf.fp.tell()
+        zf.fp.write(zinfo.FileHeader(zip64))
+        zf.fp.write(raw)
+
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf.start_dir = zf.fp.tell()
+
+    return zinfo
+
+
+def copy_member(source: zipfile.ZipFile, info: zipfile.ZipInfo, target: zipfile.ZipFile) -> zipfile.ZipInfo:
+    """Copy one member from *source* to *target* without decompressing it."""
+    return write_raw(target, info, read_raw(source, info))
@@ -0,0 +1,80 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["slide-forge"]
+#
+# [tool.uv.sources]
+# slide-forge = { path = "../" }
+# ///
+
+"""clean 벤치마크 — 고아 미디어 수백 개가 있는 덱에서 mark-and-sweep 시간 측정."""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from slide_forge import add_bullet, add_content_box, add_section, add_slide_title, create_slide
+from slide_forge.cli.clean import clean_unused_files
+from slide_forge.cli.unpack import unpack
+from slide_forge.default import get_presentation
+
+SLIDES = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+ORPHANS = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+IMAGE_RELATIONSHIP = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+NOTES_CHAINS = 20
+
+
+def build_unpacked(directory: Path) -> Path:
+    prs = get_presentation()
+    for i in range(SLIDES):
+        slide = create_slide(prs)
+        add_slide_title(slide, f"Slide {i}")
+        tf = add_content_box(slide)
+        add_section(tf, "Section")
+        add_bullet(tf, f"bullet {i}")
+
+    pptx_path = directory / "deck.pptx"
+    prs.save(str(pptx_path))
+    unpack(str(pptx_path), str(directory / "unpacked"))
+    unpacked = directory / "unpacked"
+
+    media = unpacked / "ppt" / "media"
+    media.mkdir(exist_ok=True)
+    for i in range(ORPHANS):
+        (media / f"orphan{i}.png").write_bytes(os.urandom(256))
+
+    # 고아 노트 슬라이드 → 미디어: 이전 구현은 반복마다 한 단계씩만 제거했다
+    notes = unpacked / "ppt" / "notesSlides"
+    (notes / "_rels").mkdir(parents=True, exist_ok=True)
+    for i in range(NOTES_CHAINS):
+        (notes / f"notesSlide{1000 + i}.xml").write_text("<p:notes xmlns:p='urn:p'/>", encoding="utf-8")
+        (notes / "_rels" / f"notesSlide{1000 + i}.xml.rels").write_text(
+            "<Relationships xmlns='http://schemas.openxmlformats.org/package/2006/relationships'>"
+            f"<Relationship Id='rId1' Type='{IMAGE_RELATIONSHIP}' Target='../media/chained{i}.png'/>"
+            "</Relationships>",
+            encoding="utf-8",
+        )
+        (media / f"chained{i}.png").write_bytes(os.urandom(256))
+
+    return unpacked
+
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    unpacked = build_unpacked(Path(temp_dir))
+    before = sum(1 for f in unpacked.rglob("*") if f.is_file())
+
+    start = time.perf_counter()
+    removed = clean_unused_files(unpacked)
+    seconds = time.perf_counter() - start
+
+    after = sum(1 for f in unpacked.rglob("*") if f.is_file())
+    expected = ORPHANS + NOTES_CHAINS * 3
+
+print(f"{SLIDES} slides, {before} files, {ORPHANS} orphaned media, {NOTES_CHAINS} orphaned notes chains")
+print(f"clean: removed {len(removed)} files in {seconds:.3f}s ({after} left)")
+
+if len(removed) != expected:
+    print(f"expected {expected} removals")
+    sys.exit(1)
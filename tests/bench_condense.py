@@ -0,0 +1,99 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["slide-forge"]
+#
+# [tool.uv.sources]
+# slide-forge = { path = "../" }
+# ///
+
+"""pack condense 벤치마크 — minidom 대비 lxml 엔진의 출력 동일성과 속도 비교."""
+
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import defusedxml.minidom
+
+from slide_forge import add_bullet, add_content_box, add_section, add_slide_title, create_slide
+from slide_forge.cli.unpack import unpack
+from slide_forge.cli.xml_format import condense_xml
+from slide_forge.default import get_presentation
+
+SLIDES = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+ROUNDS = 3
+
+EDGE_CASES = [
+    (
+        b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<!-- top --><a:r xmlns:a="urn:a">\n'
+        b'  <!-- c --> <a:t>  </a:t>\n  <a:t> keep <!-- kept --> </a:t>x "q" &amp; &gt;\r\n<?pi d?>\n</a:r>\n'
+    ),
+    b'<p xmlns:a="urn:a" v="1&#10;2&#9;&#13;" w="&quot;&gt;">a<!--x--> <b/>  <!--y-->b<t> </t></p>',
+]
+
+
+def minidom_condense(content: bytes) -> bytes:
+    """pack 이 이전에 사용하던 minidom 구현 (기준 출력)."""
+    dom = defusedxml.minidom.parse(io.BytesIO(content))
+
+    for element in dom.getElementsByTagName("*"):
+        if element.tagName.endswith(":t"):
+            continue
+
+        for child in list(element.childNodes):
+            if (
+                child.nodeType == child.TEXT_NODE and child.nodeValue and child.nodeValue.strip() == ""
+            ) or child.nodeType == child.COMMENT_NODE:
+                element.removeChild(child)
+
+    return dom.toxml(encoding="UTF-8")
+
+
+def build_parts(directory: Path) -> list[bytes]:
+    prs = get_presentation()
+    for i in range(SLIDES):
+        slide = create_slide(prs)
+        add_slide_title(slide, f"Slide {i}")
+        tf = add_content_box(slide)
+        add_section(tf, "Section")
+        add_bullet(tf, f'bullet {i} "straight" “smart” & <angle>')
+        add_bullet(tf, "nested", level=1)
+
+    pptx_path = directory / "deck.pptx"
+    prs.save(str(pptx_path))
+    unpack(str(pptx_path), str(directory / "unpacked"))
+
+    files = sorted((directory / "unpacked").rglob("*"))
+    return [f.read_bytes() for f in files if f.suffix in (".xml", ".rels")]
+
+
+def timed(engine, parts: list[bytes]) -> tuple[float, list[bytes]]:
+    best = float("inf")
+    outputs: list[bytes] = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        outputs = [engine(part) for part in parts]
+        best = min(best, time.perf_counter() - start)
+    return best, outputs
+
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    parts = build_parts(Path(temp_dir))
+
+for case in EDGE_CASES:
+    assert condense_xml(case) == minidom_condense(case), case
+
+minidom_seconds, expected = timed(minidom_condense, parts)
+lxml_seconds, actual = timed(condense_xml, parts)
+
+mismatches = sum(a != b for a, b in zip(actual, expected, strict=True))
+total_bytes = sum(map(len, parts))
+
+print(f"{len(parts)} parts, {total_bytes / 1024:.0f} KiB ({SLIDES} slides)")
+print(f"minidom: {minidom_seconds:.3f}s")
+print(f"lxml:    {lxml_seconds:.3f}s ({minidom_seconds / lxml_seconds:.1f}x faster)")
+print(f"byte-identical: {len(parts) - mismatches}/{len(parts)}")
+
+if mismatches:
+    sys.exit(1)
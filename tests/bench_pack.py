@@ -0,0 +1,80 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["slide-forge"]
+#
+# [tool.uv.sources]
+# slide-forge = { path = "../" }
+# ///
+
+"""pack 압축 정책 벤치마크 — 전체 deflate 대비 미디어 STORED + 레벨별 처리량 비교."""
+
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from PIL import Image
+from pptx.util import Emu
+
+from slide_forge import add_slide_title, create_slide
+from slide_forge.cli.pack import pack
+from slide_forge.cli.unpack import unpack
+from slide_forge.default import get_presentation
+
+SLIDES = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+
+def build_deck(directory: Path) -> Path:
+    prs = get_presentation()
+    for i in range(SLIDES):
+        image_path = directory / f"noise{i}.png"
+        Image.frombytes("RGB", (600, 400), os.urandom(600 * 400 * 3)).save(image_path)
+        slide = create_slide(prs)
+        add_slide_title(slide, f"Slide {i}")
+        slide.shapes.add_picture(str(image_path), Emu(0), Emu(0))
+
+    pptx_path = directory / "deck.pptx"
+    prs.save(str(pptx_path))
+    unpack(str(pptx_path), str(directory / "unpacked"))
+    return directory / "unpacked"
+
+
+def deflate_everything(input_dir: Path, output: Path) -> None:
+    """이전 pack 과 같은 정책: 모든 파트를 기본 레벨로 deflate."""
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zf:
+        for f in input_dir.rglob("*"):
+            if f.is_file():
+                zf.write(f, f.relative_to(input_dir))
+
+
+def report(label: str, seconds: float, input_bytes: int, output: Path) -> None:
+    print(
+        f"{label:<14} {seconds:6.2f}s  {input_bytes / 2**20 / seconds:7.1f} MB/s  "
+        f"{output.stat().st_size / 2**20:6.1f} MB"
+    )
+
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    temp = Path(temp_dir)
+    input_dir = build_deck(temp)
+    input_bytes = sum(f.stat().st_size for f in input_dir.rglob("*") if f.is_file())
+    print(f"{SLIDES} slides, {input_bytes / 2**20:.1f} MB unpacked")
+
+    output = temp / "all-deflated.pptx"
+    start = time.perf_counter()
+    deflate_everything(input_dir, output)
+    report("deflate all", time.perf_counter() - start, input_bytes, output)
+
+    for level in ("fast", "default", "max"):
+        output = temp / f"{level}.pptx"
+        start = time.perf_counter()
+        pack(str(input_dir), str(output), validate=False, level=level)
+        report(f"policy {level}", time.perf_counter() - start, input_bytes, output)
+
+    with zipfile.ZipFile(temp / "default.pptx") as zf:
+        infos = zf.infolist()
+        stored = sum(info.compress_type == zipfile.ZIP_STORED for info in infos)
+        assert infos[0].filename == "[Content_Types].xml"
+    print(f"{stored}/{len(infos)} members stored, [Content_Types].xml first")
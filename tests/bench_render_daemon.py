@@ -0,0 +1,70 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["slide-forge"]
+#
+# [tool.uv.sources]
+# slide-forge = { path = "../" }
+# ///
+
+"""render 변환 벤치마크 — 매번 soffice를 새로 띄우는 경우(cold)와 상주 데몬(warm)의 연속 20회 비교.
+
+LibreOffice와 그 Python 브리지(uno)가 필요하다. 데몬 프로파일은 임시 캐시 디렉터리에 만든다.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from slide_forge import add_bullet, add_content_box, add_section, add_slide_title, create_slide
+from slide_forge.default import get_presentation
+
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+SLIDES = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+
+def build_deck(directory: Path) -> Path:
+    prs = get_presentation()
+    for i in range(SLIDES):
+        slide = create_slide(prs)
+        add_slide_title(slide, f"Slide {i}")
+        tf = add_content_box(slide)
+        add_section(tf, "Section")
+        add_bullet(tf, f"bullet {i}")
+
+    pptx_path = directory / "deck.pptx"
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+def timed(label: str, convert) -> float:
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        convert()
+    seconds = time.perf_counter() - start
+    print(f"{label}: {RUNS} conversions in {seconds:.2f}s ({seconds / RUNS:.2f}s each)")
+    return seconds
+
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    os.environ["SLIDE_FORGE_CACHE_DIR"] = str(Path(temp_dir) / "cache")
+
+    from slide_forge.cli.render import _pptx_to_pdf_soffice
+    from slide_forge.cli.soffice_daemon import SofficeDaemon
+
+    pptx_path = build_deck(Path(temp_dir))
+    pdf_path = str(Path(temp_dir) / "deck.pdf")
+
+    cold = timed("cold (soffice per call)", lambda: _pptx_to_pdf_soffice(str(pptx_path), pdf_path))
+
+    daemon = SofficeDaemon(name="bench", idle_timeout=60)
+    try:
+        start = time.perf_counter()
+        daemon.convert(pptx_path, pdf_path)
+        print(f"daemon startup + first conversion: {time.perf_counter() - start:.2f}s")
+        warm = timed("warm (daemon)", lambda: daemon.convert(pptx_path, pdf_path))
+    finally:
+        daemon.stop()
+
+print(f"speedup: {cold / warm:.1f}x")
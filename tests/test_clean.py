@@ -0,0 +1,71 @@
+"""Tests for the clean command on unpacked directories and packed files."""
+
+import zipfile
+
+import pytest
+
+from slide_forge.cli.clean import clean_unused_files
+from slide_forge.cli.opc import ZipSource
+from slide_forge.cli.pack import pack
+from slide_forge.cli.unpack import unpack
+from slide_forge.default import get_presentation
+from slide_forge.default.slide import add_slide_title, create_slide
+
+ORPHAN_OVERRIDE = b'<Override PartName="/ppt/embeddings/orphan.bin" ContentType="application/octet-stream"/>'
+
+
+@pytest.fixture
+def unpacked_dir(tmp_path):
+    prs = get_presentation()
+    for i in range(3):
+        add_slide_title(create_slide(prs), f"Slide {i}")
+
+    pptx_path = tmp_path / "deck.pptx"
+    prs.save(pptx_path)
+    unpacked = tmp_path / "unpacked"
+    unpack(str(pptx_path), str(unpacked))
+
+    (unpacked / "ppt" / "media").mkdir(exist_ok=True)
+    (unpacked / "ppt" / "media" / "orphan.png").write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(64))
+    (unpacked / "ppt" / "embeddings").mkdir(exist_ok=True)
+    (unpacked / "ppt" / "embeddings" / "orphan.bin").write_bytes(bytes(64))
+    (unpacked / "[trash]").mkdir()
+    (unpacked / "[trash]" / "junk.bin").write_bytes(bytes(16))
+
+    content_types = unpacked / "[Content_Types].xml"
+    content_types.write_bytes(content_types.read_bytes().replace(b"</Types>", ORPHAN_OVERRIDE + b"</Types>"))
+    return unpacked
+
+
+class TestCleanPackedFile:
+    def test_matches_cleaning_the_directory(self, unpacked_dir, tmp_path):
+        packed = tmp_path / "packed.pptx"
+        pack(str(unpacked_dir), str(packed), validate=False, use_cache=False)
+
+        source = ZipSource(packed)
+        zip_removed = clean_unused_files(source)
+        slim = tmp_path / "slim.pptx"
+        source.save(slim)
+        dir_removed = clean_unused_files(unpacked_dir)
+
+        assert sorted(zip_removed) == sorted(dir_removed)
+        assert "ppt/media/orphan.png" in zip_removed
+        assert "[trash]/junk.bin" in zip_removed
+
+        with zipfile.ZipFile(packed) as before, zipfile.ZipFile(slim) as after:
+            assert sorted(after.namelist()) == sorted(set(before.namelist()) - set(zip_removed))
+            assert b"orphan.bin" not in after.read("[Content_Types].xml")
+
+            for info in after.infolist():
+                if info.filename != "[Content_Types].xml":
+                    original = before.getinfo(info.filename)
+                    assert (info.CRC, info.compress_size) == (original.CRC, original.compress_size)
+
+    def test_original_file_untouched_until_saved(self, unpacked_dir, tmp_path):
+        packed = tmp_path / "packed.pptx"
+        pack(str(unpacked_dir), str(packed), validate=False, use_cache=False)
+        original = packed.read_bytes()
+
+        clean_unused_files(ZipSource(packed))
+
+        assert packed.read_bytes() == original
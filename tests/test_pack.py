@@ -0,0 +1,208 @@
+"""Tests for the pack command: reproducible output, incremental repacks and merging over a base package."""
+
+import os
+import zipfile
+
+import pytest
+
+from slide_forge.cli import pack as pack_module
+from slide_forge.cli import pack_cache
+from slide_forge.cli.pack import pack
+from slide_forge.cli.unpack import unpack
+from slide_forge.default import get_presentation
+from slide_forge.default.slide import add_content_box, add_section, add_slide_title, create_slide
+
+
+@pytest.fixture
+def unpacked_dir(tmp_path):
+    prs = get_presentation()
+    for i in range(3):
+        slide = create_slide(prs)
+        add_slide_title(slide, f"Slide {i}")
+        add_section(add_content_box(slide), "Section")
+
+    pptx_path = tmp_path / "deck.pptx"
+    prs.save(pptx_path)
+    unpack(str(pptx_path), str(tmp_path / "unpacked"))
+    return tmp_path / "unpacked"
+
+
+def _touch_all(directory, mtime):
+    for path in directory.rglob("*"):
+        if path.is_file():
+            os.utime(path, (mtime, mtime))
+
+
+class TestDeterministicPack:
+    def test_packing_twice_gives_identical_bytes(self, unpacked_dir, tmp_path):
+        first = tmp_path / "first.pptx"
+        second = tmp_path / "second.pptx"
+
+        _touch_all(unpacked_dir, 1_700_000_000)
+        pack(str(unpacked_dir), str(first), validate=False, deterministic=True)
+        _touch_all(unpacked_dir, 1_800_000_000)
+        pack(str(unpacked_dir), str(second), validate=False, deterministic=True)
+
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_cached_and_uncached_packs_match(self, unpacked_dir, tmp_path):
+        cached = tmp_path / "cached.pptx"
+        uncached = tmp_path / "uncached.pptx"
+
+        pack(str(unpacked_dir), str(tmp_path / "warm.pptx"), validate=False, deterministic=True)
+        pack(str(unpacked_dir), str(cached), validate=False, deterministic=True)
+        pack(str(unpacked_dir), str(uncached), validate=False, use_cache=False, deterministic=True)
+
+        assert cached.read_bytes() == uncached.read_bytes()
+
+    def test_header_carries_the_source_size_for_zip64(self, unpacked_dir):
+        path = unpacked_dir / "[Content_Types].xml"
+
+        info = pack_module._member_info(path, "[Content_Types].xml", deterministic=True)
+
+        assert info.file_size == path.stat().st_size
+
+    def test_members_sorted_with_content_types_first(self, unpacked_dir, tmp_path):
+        output = tmp_path / "out.pptx"
+        pack(str(unpacked_dir), str(output), validate=False, deterministic=True)
+
+        with zipfile.ZipFile(output) as zf:
+            infos = zf.infolist()
+
+        names = [info.filename for info in infos]
+        assert names[0] == "[Content_Types].xml"
+        assert names[1:] == sorted(names[1:])
+        assert {info.date_time for info in infos} == {(1980, 1, 1, 0, 0, 0)}
+
+    def test_output_differs_when_a_part_changes(self, unpacked_dir, tmp_path):
+        before = tmp_path / "before.pptx"
+        after = tmp_path / "after.pptx"
+
+        pack(str(unpacked_dir), str(before), validate=False, deterministic=True)
+        slide = unpacked_dir / "ppt" / "slides" / "slide1.xml"
+        slide.write_bytes(slide.read_bytes().replace(b"Slide 0", b"Slide zero"))
+        pack(str(unpacked_dir), str(after), validate=False, deterministic=True)
+
+        assert before.read_bytes() != after.read_bytes()
+
+
+class TestPackCache:
+    @pytest.fixture
+    def caches(self, monkeypatch):
+        """Collect the PackCache of every pack() call."""
+        created = []
+
+        class RecordingCache(pack_cache.PackCache):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(pack_module, "PackCache", RecordingCache)
+        return created
+
+    def _pack(self, unpacked_dir, output, caches):
+        pack(str(unpacked_dir), str(output), validate=False)
+        return caches[-1]
+
+    def test_edited_slide_is_the_only_rebuilt_part(self, unpacked_dir, tmp_path, caches):
+        first = self._pack(unpacked_dir, tmp_path / "first.pptx", caches)
+        slide = unpacked_dir / "ppt" / "slides" / "slide1.xml"
+        slide.write_bytes(slide.read_bytes().replace(b"Slide 0", b"Slide zero"))
+        second = self._pack(unpacked_dir, tmp_path / "second.pptx", caches)
+
+        assert first.hits == 0
+        assert (second.hits, second.misses) == (first.misses - 1, 1)
+        with zipfile.ZipFile(tmp_path / "second.pptx") as zf:
+            assert b"Slide zero" in zf.read("ppt/slides/slide1.xml")
+
+    def test_touched_file_hits_by_content_hash(self, unpacked_dir, tmp_path, caches, monkeypatch):
+        first = self._pack(unpacked_dir, tmp_path / "first.pptx", caches)
+        slide = unpacked_dir / "ppt" / "slides" / "slide1.xml"
+        mtime = slide.stat().st_mtime + 60
+        os.utime(slide, (mtime, mtime))
+
+        hashed = []
+        file_sha256 = pack_cache.file_sha256
+        monkeypatch.setattr(pack_cache, "file_sha256", lambda path: hashed.append(path) or file_sha256(path))
+        second = self._pack(unpacked_dir, tmp_path / "second.pptx", caches)
+
+        assert (second.hits, second.misses) == (first.misses, 0)
+        assert hashed[0] == slide
+
+
+class TestPackBase:
+    def test_partial_unpack_merges_over_base(self, tmp_path):
+        prs = get_presentation()
+        for i in range(3):
+            add_slide_title(create_slide(prs), f"Slide {i}")
+        base = tmp_path / "base.pptx"
+        prs.save(base)
+
+        partial = tmp_path / "partial"
+        unpack(str(base), str(partial), only=["slides/slide2.xml"])
+        assert not (partial / "ppt" / "slides" / "slide1.xml").exists()
+
+        slide = partial / "ppt" / "slides" / "slide2.xml"
+        slide.write_bytes(slide.read_bytes().replace(b"Slide 1", b"Slide one"))
+        merged = tmp_path / "merged.pptx"
+        pack(str(partial), str(merged), base_file=str(base), validate=False)
+
+        with zipfile.ZipFile(base) as base_zf, zipfile.ZipFile(merged) as merged_zf:
+            assert sorted(merged_zf.namelist()) == sorted(base_zf.namelist())
+            assert b"Slide one" in merged_zf.read("ppt/slides/slide2.xml")
+
+            extracted = {path.relative_to(partial).as_posix() for path in partial.rglob("*") if path.is_file()}
+            for info in base_zf.infolist():
+                if info.filename not in extracted:
+                    merged_info = merged_zf.getinfo(info.filename)
+                    assert (merged_info.CRC, merged_info.compress_size) == (info.CRC, info.compress_size)
+
+
+class TestCompression:
+    def test_media_is_stored_and_fonts_are_deflated(self, unpacked_dir, tmp_path):
+        (unpacked_dir / "ppt" / "fonts").mkdir()
+        # Obfuscated fonts only XOR their first 32 bytes; the rest is compressible TrueType data.
+        (unpacked_dir / "ppt" / "fonts" / "font1.odttf").write_bytes(os.urandom(32) + b"\0\1glyf" * 4096)
+        output = tmp_path / "out.pptx"
+        pack(str(unpacked_dir), str(output), validate=False)
+
+        with zipfile.ZipFile(output) as zf:
+            font = zf.getinfo("ppt/fonts/font1.odttf")
+            media = [info for info in zf.infolist() if info.filename.startswith("ppt/media/")]
+
+        assert font.compress_type == zipfile.ZIP_DEFLATED
+        assert font.compress_size < font.file_size // 2
+        assert media
+        assert {info.compress_type for info in media} == {zipfile.ZIP_STORED}
+
+
+class TestStats:
+    def test_stats_report_sizes_and_peak_memory(self, unpacked_dir, tmp_path):
+        _, message = pack(str(unpacked_dir), str(tmp_path / "out.pptx"), validate=False, jobs=2, stats=True)
+
+        stats_line = next(line for line in message.splitlines() if line.startswith("Stats:"))
+        assert "MB ->" in stats_line
+        assert "peak RSS" in stats_line
+        assert "largest worker" in stats_line
+
+
+class TestParallelPack:
+    def test_jobs_give_the_same_bytes_as_serial(self, unpacked_dir, tmp_path):
+        serial = tmp_path / "serial.pptx"
+        parallel = tmp_path / "parallel.pptx"
+
+        pack(str(unpacked_dir), str(serial), validate=False, use_cache=False, deterministic=True)
+        pack(str(unpacked_dir), str(parallel), validate=False, use_cache=False, deterministic=True, jobs=2)
+
+        assert parallel.read_bytes() == serial.read_bytes()
+
+
+class TestParallelUnpack:
+    def _tree(self, directory):
+        return {path.relative_to(directory): path.read_bytes() for path in directory.rglob("*") if path.is_file()}
+
+    def test_jobs_write_the_same_tree_as_serial(self, unpacked_dir, tmp_path):
+        # The fixture unpacked deck.pptx with the default of one job.
+        unpack(str(tmp_path / "deck.pptx"), str(tmp_path / "parallel"), jobs=2)
+
+        assert self._tree(tmp_path / "parallel") == self._tree(unpacked_dir)
@@ -0,0 +1,281 @@
+"""Tests for render, with a stand-in for the PPTX -> PDF converter (LibreOffice is not needed)."""
+
+import json
+import os
+import re
+import stat
+import subprocess
+import sys
+from pathlib import Path
+
+import pymupdf
+import pytest
+from pptx import Presentation
+from pptx.shapes.autoshape import Shape
+from pptx.util import Emu
+
+from slide_forge.cli import render
+from slide_forge.cli.deck import parse_slide_ranges
+from slide_forge.cli.render import _pdf_to_images, _render_slides, iter_render_bytes, render_to_bytes
+from slide_forge.cli.render_cache import RenderCache
+from slide_forge.default import get_presentation
+from slide_forge.default.slide import add_slide_title, create_slide
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    doc = pymupdf.open()
+    for i in range(5):
+        page = doc.new_page(width=320, height=180)
+        page.insert_text((20, 90), f"Slide {i + 1}", fontsize=24)
+    path = tmp_path / "deck.pdf"
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+class TestPdfToImages:
+    def test_parallel_matches_serial(self, pdf_path, tmp_path):
+        serial = _pdf_to_images(pdf_path, str(tmp_path / "serial"), dpi=72)
+        parallel = _pdf_to_images(pdf_path, str(tmp_path / "parallel"), dpi=72, jobs=2)
+
+        assert [Path(p).name for p in parallel] == [f"slide-{i:02d}.png" for i in range(1, 6)]
+        for a, b in zip(serial, parallel, strict=True):
+            assert Path(a).read_bytes() == Path(b).read_bytes()
+
+
+def _slide_text(slide):
+    return " ".join(shape.text_frame.text for shape in slide.shapes if shape.has_text_frame)
+
+
+def _fake_convert(pptx_path, pdf_path, calls):
+    """Stand-in for LibreOffice: one page per visible slide showing its text."""
+    texts = [_slide_text(slide) for slide in Presentation(pptx_path).slides if slide._element.get("show") != "0"]
+    calls.append(texts)
+    doc = pymupdf.open()
+    for text in texts:
+        page = doc.new_page(width=320, height=180)
+        page.insert_text((20, 90), text, fontsize=24)
+    doc.save(pdf_path)
+    doc.close()
+
+
+@pytest.fixture
+def deck_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("SLIDE_FORGE_CACHE_DIR", str(tmp_path / "cache"))
+    prs = get_presentation()
+    for i in range(4):
+        add_slide_title(create_slide(prs), f"Slide {i + 1}")
+    path = tmp_path / "deck.pptx"
+    prs.save(path)
+    return path
+
+
+class TestRenderCache:
+    def _render(self, deck_path, output_dir, **kwargs):
+        calls = []
+        output_dir.mkdir()
+        convert = lambda a, b: _fake_convert(a, b, calls)
+        images = _render_slides(str(deck_path), str(output_dir), 72, 1, convert, **kwargs)
+        return images, calls
+
+    def test_unchanged_deck_is_not_converted_again(self, deck_path, tmp_path):
+        first, first_calls = self._render(deck_path, tmp_path / "first")
+        second, second_calls = self._render(deck_path, tmp_path / "second")
+
+        assert len(first_calls) == 1
+        assert second_calls == []
+        for a, b in zip(first, second, strict=True):
+            assert Path(a).read_bytes() == Path(b).read_bytes()
+
+    def test_only_changed_slide_is_converted(self, deck_path, tmp_path):
+        before, _ = self._render(deck_path, tmp_path / "before")
+
+        prs = Presentation(deck_path)
+        title = next(shape for shape in prs.slides[2].shapes if isinstance(shape, Shape) and shape.has_text_frame)
+        title.text_frame.text = "Slide three"
+        prs.save(deck_path)
+        after, calls = self._render(deck_path, tmp_path / "after")
+
+        assert calls == [["Slide three"]]
+        changed = [
+            Path(a).name for a, b in zip(before, after, strict=True) if Path(a).read_bytes() != Path(b).read_bytes()
+        ]
+        assert changed == ["slide-03.png"]
+
+    @pytest.mark.parametrize("use_cache", [True, False])
+    def test_slide_subset_keeps_original_numbers(self, deck_path, tmp_path, use_cache):
+        images, calls = self._render(deck_path, tmp_path / "subset", slide_spec="2-3", use_cache=use_cache)
+
+        assert [Path(p).name for p in images] == ["slide-02.png", "slide-03.png"]
+        assert calls == [["Slide 2", "Slide 3"]]
+        assert sorted(p.name for p in (tmp_path / "subset").iterdir()) == ["slide-02.png", "slide-03.png"]
+
+    def test_subset_reuses_full_render(self, deck_path, tmp_path):
+        full, _ = self._render(deck_path, tmp_path / "full")
+        subset, calls = self._render(deck_path, tmp_path / "subset", slide_spec="4")
+
+        assert calls == []
+        assert Path(subset[0]).read_bytes() == Path(full[3]).read_bytes()
+
+    def test_only_whole_deck_conversions_enter_the_pdf_cache(self, deck_path, tmp_path):
+        self._render(deck_path, tmp_path / "full")
+
+        prs = Presentation(deck_path)
+        prs.slides[2].shapes.add_textbox(Emu(0), Emu(0), Emu(100), Emu(100)).text_frame.text = "new"
+        prs.save(deck_path)
+        _, calls = self._render(deck_path, tmp_path / "edited")
+
+        assert calls == [["Slide 3 new"]]
+        assert len(list((tmp_path / "cache" / "pdf").glob("*.pdf"))) == 1
+
+    def test_cached_images_are_read_only(self, deck_path, tmp_path):
+        images, _ = self._render(deck_path, tmp_path / "out")
+
+        assert stat.S_IMODE(os.stat(images[0]).st_mode) & 0o222 == 0
+        assert sorted((tmp_path / "cache" / "render").glob("*/*.tmp")) == []
+
+    def test_prune_drops_the_least_recently_used(self, deck_path, tmp_path, monkeypatch):
+        monkeypatch.setattr(RenderCache, "MAX_ENTRIES", 2)
+        self._render(deck_path, tmp_path / "a", slide_spec="1-2")
+        for entry in (tmp_path / "cache" / "render").glob("*/*.png"):
+            os.utime(entry, (1_000_000_000, 1_000_000_000))
+
+        # Reusing slide 1 marks it as recently used, so storing slide 3 evicts slide 2.
+        self._render(deck_path, tmp_path / "b", slide_spec="1")
+        self._render(deck_path, tmp_path / "c", slide_spec="3")
+
+        assert self._render(deck_path, tmp_path / "d", slide_spec="1")[1] == []
+        assert self._render(deck_path, tmp_path / "e", slide_spec="2")[1] == [["Slide 2"]]
+
+
+class TestRenderToBytes:
+    @pytest.fixture(autouse=True)
+    def fake_converter(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(render, "_pptx_to_pdf", lambda a, b, **kwargs: _fake_convert(a, b, calls))
+        return calls
+
+    @pytest.mark.parametrize(
+        ("image_format", "magic"),
+        [("png", b"\x89PNG"), ("jpeg", b"\xff\xd8\xff"), ("webp", b"RIFF")],
+    )
+    def test_formats(self, deck_path, image_format, magic):
+        images = render_to_bytes(str(deck_path), dpi=72, image_format=image_format)
+
+        assert len(images) == 4
+        assert all(image.startswith(magic) for image in images)
+
+    def test_accepts_bytes_and_slide_subset(self, deck_path, fake_converter):
+        images = list(iter_render_bytes(deck_path.read_bytes(), dpi=72, slides="2,4"))
+
+        assert len(images) == 2
+        assert fake_converter == [["Slide 2", "Slide 4"]]
+
+    def test_writes_nothing_next_to_the_deck(self, deck_path):
+        before = sorted(deck_path.parent.iterdir())
+        render_to_bytes(deck_path, dpi=72)
+
+        assert sorted(deck_path.parent.iterdir()) == before
+
+    def test_unknown_format(self, deck_path):
+        with pytest.raises(ValueError):
+            render_to_bytes(deck_path, image_format="gif")
+
+    def test_unknown_format_fails_before_iterating(self, deck_path, fake_converter):
+        with pytest.raises(ValueError, match="gif"):
+            iter_render_bytes(deck_path, image_format="gif")
+
+        assert fake_converter == []
+
+
+class TestParseSlideRanges:
+    def test_ranges_are_sorted_and_unique(self):
+        assert parse_slide_ranges("12-14,20, 13", 20) == [12, 13, 14, 20]
+
+    @pytest.mark.parametrize("spec", ["0", "3-2", "21", "a-b", ""])
+    def test_invalid_ranges(self, spec):
+        with pytest.raises(ValueError):
+            parse_slide_ranges(spec, 20)
+
+
+class TestSofficeDaemon:
+    def test_refused_without_unix_sockets(self, monkeypatch):
+        from slide_forge.cli import soffice_daemon
+
+        monkeypatch.setattr(soffice_daemon, "_needs_shim", lambda: True)
+        with pytest.raises(RuntimeError, match="AF_UNIX"):
+            soffice_daemon.SofficeDaemon()
+
+    def test_stop_waits_for_the_supervisor_to_exit(self, tmp_path, monkeypatch):
+        from slide_forge.cli import soffice_daemon
+
+        monkeypatch.setenv("SLIDE_FORGE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(soffice_daemon, "_needs_shim", lambda: False)
+        # Stands in for a supervisor that takes a moment to shut soffice down after SIGTERM.
+        supervisor = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                (
+                    "import signal, sys, time\n"
+                    "signal.signal(signal.SIGTERM, lambda *_: (time.sleep(0.5), sys.exit()))\n"
+                    "print(flush=True)\n"
+                    "time.sleep(60)"
+                ),
+            ],
+            stdout=subprocess.PIPE,
+        )
+        assert supervisor.stdout is not None
+        supervisor.stdout.readline()
+        daemon = soffice_daemon.SofficeDaemon("test")
+        daemon.state_path.write_text(json.dumps({"pid": supervisor.pid, "connection": "pipe,name=x"}))
+
+        daemon.stop()
+
+        assert supervisor.poll() is not None
+        assert not daemon.state_path.exists()
+        assert daemon.lock_path.exists()
+
+
+class TestSofficePool:
+    @pytest.fixture
+    def warmed(self, tmp_path, monkeypatch):
+        from slide_forge.cli import soffice
+
+        monkeypatch.setenv("SLIDE_FORGE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(soffice.SofficePool, "LOCK_TIMEOUT", 0.5)
+
+        def no_soffice(*args, **kwargs):
+            raise AssertionError("soffice was launched")
+
+        monkeypatch.setattr(soffice.subprocess, "run", no_soffice)
+        warmed = []
+        monkeypatch.setattr(soffice, "_warm_profile", warmed.append)
+        return warmed
+
+    def test_nested_blocks_get_different_profiles(self, warmed):
+        from slide_forge.cli.soffice import SofficePool
+
+        pool = SofficePool(2)
+        with pool.profile() as outer, pool.profile() as inner:
+            assert (outer.name, inner.name) == ("worker-0", "worker-1")
+        assert warmed == [outer, inner]
+
+    def test_lock_is_released_when_the_block_raises(self, warmed):
+        from slide_forge.cli.soffice import SofficePool
+
+        pool = SofficePool(1)
+        with pytest.raises(ValueError), pool.profile():
+            raise ValueError
+
+        with pool.profile() as profile:
+            assert profile.name == "worker-0"
+
+    def test_busy_pool_times_out_naming_its_directory(self, warmed):
+        from slide_forge.cli.soffice import SofficePool
+
+        pool = SofficePool(1)
+        busy = pytest.raises(RuntimeError, match=re.escape(str(pool.directory)))
+        with pool.profile(), busy, pool.profile():
+            pass
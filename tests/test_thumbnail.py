@@ -0,0 +1,108 @@
+"""Tests for thumbnail grids, with a stand-in for the LibreOffice PDF conversion."""
+
+import subprocess
+from pathlib import Path
+
+import pymupdf
+import pytest
+from PIL import Image, ImageChops, ImageStat
+from pptx import Presentation
+
+from slide_forge.cli import main, render, thumbnail
+from slide_forge.cli.deck import list_slides
+from slide_forge.cli.opc import ZipSource
+from slide_forge.default import get_presentation
+from slide_forge.default.slide import add_slide_title, create_slide
+
+
+def _fake_soffice(args, workers=None, **kwargs):
+    outdir = Path(args[args.index("--outdir") + 1])
+    pptx_path = Path(args[-1])
+    doc = pymupdf.open()
+    for i in range(5):
+        page = doc.new_page(width=960, height=540)
+        page.insert_text((60, 270), f"Slide {i + 1}", fontsize=64)
+    doc.save(outdir / f"{pptx_path.stem}.pdf")
+    doc.close()
+    return subprocess.CompletedProcess(args, 0, "", "")
+
+
+@pytest.fixture
+def deck_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("SLIDE_FORGE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(thumbnail, "run_soffice", _fake_soffice)
+    prs = get_presentation()
+    for i in range(5):
+        add_slide_title(create_slide(prs), f"Slide {i + 1}")
+    path = tmp_path / "deck.pptx"
+    prs.save(path)
+    return path
+
+
+class TestThumbnail:
+    def test_rasterizes_at_thumbnail_width(self, deck_path, tmp_path):
+        pdf_path = thumbnail._convert_to_pdf(deck_path, tmp_path)
+        images = list(thumbnail._iter_thumbnails(pdf_path, thumbnail.THUMBNAIL_WIDTH))
+
+        assert len(images) == 5
+        assert {image.size for image in images} == {(300, 169)}
+
+    def test_grid_layout(self, deck_path, tmp_path):
+        prefix = tmp_path / "grid"
+        main(["thumbnail", str(deck_path), str(prefix), "--cols", "2"])
+
+        with Image.open(f"{prefix}.jpg") as grid:
+            # 2 columns and 3 rows of 300x169 tiles with 20px padding and 30px labels (12px padding each side)
+            assert grid.size == (2 * 300 + 3 * 20, 3 * (169 + 30 + 2 * 12) + 4 * 20)
+
+    def test_hidden_slides_share_one_placeholder(self, deck_path, tmp_path):
+        prs = Presentation(deck_path)
+        for index in (1, 3):
+            prs.slides[index]._element.set("show", "0")
+        prs.save(deck_path)
+
+        pdf_path = thumbnail._convert_to_pdf(deck_path, tmp_path)
+        slides = list(
+            thumbnail._iter_slides(list_slides(ZipSource(deck_path)), thumbnail._iter_thumbnails(pdf_path, 300))
+        )
+
+        assert [label for _, label in slides] == [
+            "slide1.xml",
+            "slide2.xml (hidden)",
+            "slide3.xml",
+            "slide4.xml (hidden)",
+            "slide5.xml",
+        ]
+        assert slides[1][0] is slides[3][0]
+        assert slides[1][0].size == slides[0][0].size
+
+    @pytest.mark.parametrize("suffix", [".png", ".webp"])
+    def test_contact_sheet_stacks_every_grid(self, deck_path, tmp_path, suffix):
+        prefix = tmp_path / "grid"
+        sheet = tmp_path / f"sheet{suffix}"
+        main(["thumbnail", str(deck_path), str(prefix), "--cols", "1", "--contact-sheet", str(sheet)])
+
+        # 1 column, 2 slides per grid: grids of 2, 2 and 1 rows, each with its own top padding
+        grids = [Image.open(tmp_path / f"grid-{i}.jpg") for i in range(1, 4)]
+        with Image.open(sheet) as image:
+            image.load()
+            assert image.size == (grids[0].width, sum(grid.height - 20 for grid in grids) + 20)
+            top = image.crop((0, 0, *grids[0].size)).convert("RGB")
+        assert max(ImageStat.Stat(ImageChops.difference(top, grids[0])).mean) < 2
+
+    def test_conversion_is_shared_with_preview(self, deck_path, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(thumbnail, "run_soffice", lambda args, **kwargs: calls.append(args) or _fake_soffice(args))
+        monkeypatch.setattr(render, "_check_dependencies", lambda: None)
+        monkeypatch.setattr(
+            render, "_pptx_to_pdf", lambda *args, **kwargs: pytest.fail("preview converted a cached deck")
+        )
+
+        main(["thumbnail", str(deck_path), str(tmp_path / "grid")])
+        main(["preview", str(deck_path), str(tmp_path / "preview"), "--dpi", "72"])
+
+        assert len(calls) == 1
+        assert sorted(p.name for p in (tmp_path / "preview").iterdir()) == [
+            *(f"slide-{i:02d}.png" for i in range(1, 6)),
+            "thumbnails.jpg",
+        ]
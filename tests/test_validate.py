@@ -0,0 +1,150 @@
+"""Tests for validate: incremental per-part results and parallel XSD validation."""
+
+import json
+import shutil
+
+import lxml.etree
+import pytest
+from PIL import Image
+from pptx.util import Inches
+
+from slide_forge.cli import main
+from slide_forge.cli.unpack import unpack
+from slide_forge.cli.validators import PPTXSchemaValidator, SchemaCache
+from slide_forge.cli.validators.validation_cache import ValidationCache
+from slide_forge.default import get_presentation
+from slide_forge.default.slide import add_slide_title, create_slide
+
+SLIDE_RELS = "ppt/slides/_rels/slide2.xml.rels"
+
+
+@pytest.fixture
+def unpacked_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SLIDE_FORGE_CACHE_DIR", str(tmp_path / "cache"))
+    image_path = tmp_path / "image.png"
+    Image.new("RGB", (8, 8), "red").save(image_path)
+
+    prs = get_presentation()
+    for i in range(3):
+        slide = create_slide(prs)
+        add_slide_title(slide, f"Slide {i}")
+        slide.shapes.add_picture(str(image_path), Inches(1), Inches(1))
+    pptx_path = tmp_path / "deck.pptx"
+    prs.save(str(pptx_path))
+    unpack(str(pptx_path), str(tmp_path / "unpacked"))
+    return tmp_path / "unpacked"
+
+
+def _break_image_relationship(unpacked_dir):
+    rels = unpacked_dir / SLIDE_RELS
+    rels.write_bytes(rels.read_bytes().replace(b'Id="rId2"', b'Id="rId7"'))
+
+
+class TestValidationCache:
+    @pytest.fixture
+    def misses(self, monkeypatch):
+        """Record the (check, part) pairs that had to be recomputed."""
+        missed = set()
+        get = ValidationCache.get
+
+        def recording_get(self, check, name, key):
+            value = get(self, check, name, key)
+            if value is None:
+                missed.add((check, name))
+            return value
+
+        monkeypatch.setattr(ValidationCache, "get", recording_get)
+        return missed
+
+    def _validate(self, unpacked_dir, capsys):
+        validator = PPTXSchemaValidator(unpacked_dir)
+        validator.validate()
+        return validator.cache, capsys.readouterr().out
+
+    def test_unchanged_package_is_served_from_cache(self, unpacked_dir, capsys, misses):
+        first, first_output = self._validate(unpacked_dir, capsys)
+        misses.clear()
+        second, second_output = self._validate(unpacked_dir, capsys)
+
+        assert first.misses > 0
+        assert (second.hits, second.misses) == (first.misses, 0)
+        assert misses == set()
+        assert second_output == first_output
+
+    def test_edited_rels_rechecks_only_that_slide(self, unpacked_dir, capsys, misses):
+        first, _ = self._validate(unpacked_dir, capsys)
+        _break_image_relationship(unpacked_dir)
+        misses.clear()
+        second, output = self._validate(unpacked_dir, capsys)
+
+        assert "ppt/slides/slide2.xml: Line" in output
+        assert "references non-existent relationship 'rId2'" in output
+        assert {name for _, name in misses} == {SLIDE_RELS, "ppt/slides/slide2.xml"}
+        assert ("relationship_ids", "ppt/slides/slide2.xml") in misses
+        assert second.misses == len(misses)
+        assert second.hits == first.misses - second.misses
+
+
+class TestParallelValidation:
+    def _run(self, unpacked_dir, capsys, *args):
+        with pytest.raises(SystemExit):
+            main(["validate", str(unpacked_dir), "--no-cache", *args])
+        # Schema compile timings differ between runs; everything else must match.
+        return [line for line in capsys.readouterr().out.splitlines() if not line.startswith("XSD timing:")]
+
+    def test_jobs_print_the_same_report_as_serial(self, unpacked_dir, capsys):
+        _break_image_relationship(unpacked_dir)
+
+        serial = self._run(unpacked_dir, capsys)
+        parallel = self._run(unpacked_dir, capsys, "--jobs", "2")
+
+        assert any("non-existent relationship" in line for line in serial)
+        assert parallel == serial
+
+
+class TestSchemaCache:
+    def test_clear_resets_counters(self, unpacked_dir):
+        cache = SchemaCache()
+        schema_path = PPTXSchemaValidator(unpacked_dir).schemas_dir / "ecma/fouth-edition/opc-relationships.xsd"
+        cache.validate(schema_path, lxml.etree.parse(unpacked_dir / SLIDE_RELS))
+        assert cache.stats()[::2] == (1, 1)
+
+        cache.clear()
+
+        assert cache.stats() == (0, 0.0, 0, 0.0)
+        assert cache.summary().startswith("XSD timing: compiled 0 schema(s)")
+
+
+class TestOriginalErrorIndex:
+    def test_original_errors_are_subtracted_and_indexed_once(self, unpacked_dir, tmp_path, capsys, monkeypatch):
+        original = tmp_path / "deck.pptx"
+        assert not PPTXSchemaValidator(unpacked_dir, use_cache=False).validate()
+        assert "ppt/authors.xml" in capsys.readouterr().out
+
+        assert PPTXSchemaValidator(unpacked_dir, original).validate()
+        assert "ppt/authors.xml" not in capsys.readouterr().out
+        indexes = list((tmp_path / "cache" / "baseline").glob("*.json"))
+        assert len(indexes) == 1
+        assert "ppt/authors.xml" in json.loads(indexes[0].read_text(encoding="utf-8"))
+
+        def fail(self):
+            raise AssertionError("the original was validated again")
+
+        monkeypatch.setattr(PPTXSchemaValidator, "_build_original_error_index", fail)
+        # A fresh copy has no per-part results, so every part is checked against the stored index.
+        copy = shutil.copytree(unpacked_dir, tmp_path / "copy")
+        assert PPTXSchemaValidator(copy, original).validate()
+
+
+class TestZipSource:
+    def test_pptx_and_unpacked_directory_give_the_same_report(self, unpacked_dir, tmp_path, capsys):
+        reports = []
+        for path in (tmp_path / "deck.pptx", unpacked_dir):
+            with pytest.raises(SystemExit):
+                main(["validate", str(path), "--no-cache"])
+            reports.append(
+                [line for line in capsys.readouterr().out.splitlines() if not line.startswith("XSD timing:")]
+            )
+
+        assert any("ppt/authors.xml" in line for line in reports[0])
+        assert reports[0] == reports[1]
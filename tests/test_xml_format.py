@@ -0,0 +1,21 @@
+"""Tests that the lxml formatting matches the minidom output pack and unpack used to produce."""
+
+import defusedxml.minidom
+import pytest
+
+from slide_forge.cli.xml_format import pretty_xml
+
+SAMPLES = [
+    (
+        b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        b'<p:sp xmlns:p="urn:p" xmlns:a="urn:a"><a:r><a:t>a "q" &amp; &lt;b&gt;</a:t></a:r></p:sp>'
+    ),
+    b'<a:r xmlns:a="urn:a" v="1&#10;2&#9;" w="&quot;"><a:t>line1\nline2 "z"\r</a:t><a:br/></a:r>',
+]
+
+
+@pytest.mark.parametrize("content", SAMPLES)
+def test_pretty_xml_matches_minidom(content):
+    expected = defusedxml.minidom.parseString(content.decode("utf-8")).toprettyxml(indent="  ", encoding="utf-8")
+
+    assert pretty_xml(content) == expected